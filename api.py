@@ -0,0 +1,320 @@
+# api.py
+#
+# Read-only JSON API for other government systems, served from the same cached data
+# snapshot as the dashboard (catalogue.py / facet_index.py):
+#
+#   /api/v1/sectors
+#   /api/v1/indicators?sector=ict&status=LOW&fields=indicator,current,status_2024
+#   POST /api/v1/indicators/batch  {"keys": [{"sector": "ict", "indicator": "..."}, ...]}
+#
+# indicators: 'sector' (source key, see /api/v1/sectors), 'pillar', 'status' (2024/25)
+# and 'status_midterm' filter the rows; each may be repeated or comma-separated and the
+# values of one parameter are OR-ed. 'fields' projects the rows onto API_FIELDS. Rows are
+# returned in catalogue order, 'limit' at a time, and 'next_cursor' fetches the next
+# page; a cursor belongs to one snapshot and is rejected once the data has changed.
+#
+# batch looks up to MAX_BATCH_KEYS (sector, indicator) keys in one request through a hash
+# index of the snapshot; every key gets its own result or error, in request order. An
+# indicator name used twice in a sector also needs the key's 'outcome'.
+#
+# Every GET response carries an ETag of (snapshot version, request), checked before any work
+# is done, so an unchanged poll is answered with an empty 304. Bodies are gzipped for
+# clients that accept it.
+
+import base64
+import gzip
+import hashlib
+import json
+import threading
+
+import numpy as np
+from flask import Response, request
+
+from catalogue import get_catalogue, json_value, CATALOGUE_FIELDS, MATRIX_SOURCE, MATRIX_SOURCE_LABEL
+from facet_index import get_facet_index, filter_bitmap, matching_rows
+from sector_config import SECTORS
+from typeahead import normalize
+
+API_PREFIX = '/api/v1'
+
+# Fields an indicator row can be projected onto
+API_FIELDS = CATALOGUE_FIELDS
+DEFAULT_FIELDS = [
+    'source', 'pillar', 'outcome', 'indicator', 'unit', 'baseline', 'target_2024',
+    'target_midterm', 'current', 'progress_2024', 'progress_midterm', 'status_2024',
+    'status_midterm',
+]
+
+# Fields returned for every key of a batch request (unless 'fields' is given)
+BATCH_FIELDS = [
+    'source', 'outcome', 'indicator', 'unit', 'baseline', 'target_2024', 'target_midterm',
+    'current', 'progress_2024', 'progress_midterm', 'status_2024', 'status_midterm',
+]
+MAX_BATCH_KEYS = 100
+
+# Rows per page
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 500
+
+# Query parameter -> facet_index facet
+FILTER_PARAMS = {
+    'sector': 'sector',
+    'pillar': 'pillar',
+    'status': 'status_2024',
+    'status_midterm': 'status_midterm',
+}
+
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_BYTES = 1024
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# --- Snapshot data ---
+def source_labels():
+    """Source key -> label, the sectors followed by matrix.xlsx."""
+    labels = {sector['key']: sector['label'] for sector in SECTORS}
+    labels[MATRIX_SOURCE] = MATRIX_SOURCE_LABEL
+    return labels
+
+
+def build_api_data(catalogue):
+    records = [
+        {field: json_value(value) for field, value in record.items()}
+        for record in catalogue.to_dict('records')
+    ]
+    counts = catalogue['source'].value_counts()
+    sources = [(sector['key'], sector['label'], sector['pillar'], sector['path']) for sector in SECTORS]
+    # matrix.xlsx spans every pillar
+    sources.append((MATRIX_SOURCE, MATRIX_SOURCE_LABEL, None, None))
+    sectors = [
+        {'key': key, 'label': label, 'pillar': pillar, 'path': path, 'indicators': int(counts.get(key, 0))}
+        for key, label, pillar, path in sources
+    ]
+    # (source, normalised indicator) -> catalogue rows, for batch lookups
+    keys = {}
+    for row, record in enumerate(records):
+        keys.setdefault((record['source'], normalize(record['indicator'])), []).append(row)
+    return {'records': records, 'sectors': sectors, 'keys': keys}
+
+
+_api_lock = threading.Lock()
+_current_api = {'version': None, 'data': None}
+
+
+def get_api_data():
+    """(version, {'records', 'sectors'}) for the current data snapshot, built on first use."""
+    version, catalogue = get_catalogue()
+    with _api_lock:
+        if _current_api['version'] != version:
+            _current_api['data'] = build_api_data(catalogue)
+            _current_api['version'] = version
+        return version, _current_api['data']
+
+
+# --- Request parsing ---
+def list_param(args, name):
+    """Repeated and comma-separated values of a query parameter."""
+    return [value.strip() for raw in args.getlist(name) for value in raw.split(',') if value.strip()]
+
+
+def check_fields(fields):
+    if not isinstance(fields, list) or not all(isinstance(field, str) for field in fields):
+        raise ApiError(400, "'fields' must be a list of field names")
+    unknown = [field for field in fields if field not in API_FIELDS]
+    if unknown:
+        raise ApiError(400, f"Unknown field(s): {', '.join(map(repr, unknown))}")
+    return fields
+
+
+def parse_fields(args):
+    return check_fields(list_param(args, 'fields') or DEFAULT_FIELDS)
+
+
+def parse_limit(args):
+    try:
+        limit = int(args.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        raise ApiError(400, "'limit' must be an integer")
+    if not 1 <= limit <= MAX_LIMIT:
+        raise ApiError(400, f"'limit' must be between 1 and {MAX_LIMIT}")
+    return limit
+
+
+def parse_selections(args):
+    """Facet selections for facet_index.filter_bitmap from the filter parameters."""
+    labels = source_labels()
+    selections = {}
+    for param, facet in FILTER_PARAMS.items():
+        values = list_param(args, param)
+        if param == 'sector':
+            unknown = [value for value in values if value.lower() not in labels]
+            if unknown:
+                raise ApiError(400, f"Unknown sector(s): {', '.join(unknown)}")
+            values = [labels[value.lower()] for value in values]
+        else:
+            values = [value.upper() for value in values]
+        selections[facet] = values
+    return selections
+
+
+def encode_cursor(version, position):
+    token = json.dumps({'v': version, 'after': int(position)}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(token.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, version):
+    """Catalogue position after which the page starts (-1 without a cursor)."""
+    if not cursor:
+        return -1
+    try:
+        token = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        after = int(token['after'])
+        cursor_version = token['v']
+    except (ValueError, KeyError, TypeError):
+        raise ApiError(400, "Invalid cursor")
+    if cursor_version != version:
+        raise ApiError(410, "The data has changed since this cursor was issued; start again without a cursor")
+    return after
+
+
+# --- Responses ---
+def request_etag(version):
+    """ETag of the response to this request; gzipped and plain bodies get different tags."""
+    query = '&'.join(f"{key}={value}" for key, value in sorted(request.args.items(multi=True)))
+    encoding = 'gzip' if 'gzip' in request.accept_encodings else 'identity'
+    return hashlib.sha1(f"{version}|{request.path}|{query}|{encoding}".encode('utf-8')).hexdigest()[:20]
+
+
+def json_response(payload, status=200, etag=None):
+    body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    response = Response(mimetype='application/json', status=status)
+    if len(body) >= GZIP_MIN_BYTES and 'gzip' in request.accept_encodings:
+        body = gzip.compress(body, compresslevel=6)
+        response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.set_data(body)
+    if etag:
+        response.set_etag(etag)
+        # Clients may keep the response but must revalidate it
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def not_modified(etag):
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def api_endpoint(handler, conditional=True):
+    """Wrap handler(version) with JSON error responses and, if conditional, the ETag check."""
+    def view():
+        version, _ = get_catalogue()
+        etag = request_etag(version) if conditional else None
+        if etag and request.if_none_match.contains(etag):
+            return not_modified(etag)
+        try:
+            payload = handler(version)
+        except ApiError as error:
+            return json_response({'error': error.message}, status=error.status)
+        return json_response(payload, etag=etag)
+    view.__name__ = f"api_{handler.__name__}"
+    return view
+
+
+# --- Endpoints ---
+def sectors(version):
+    _, data = get_api_data()
+    return {'snapshot': version, 'data': data['sectors']}
+
+
+def indicators(version):
+    fields = parse_fields(request.args)
+    limit = parse_limit(request.args)
+    selections = parse_selections(request.args)
+    after = decode_cursor(request.args.get('cursor'), version)
+
+    _, data = get_api_data()
+    _, index = get_facet_index()
+    rows = matching_rows(index, filter_bitmap(index, selections))
+    start = int(np.searchsorted(rows, after, side='right'))
+    page = rows[start:start + limit]
+    more = start + limit < len(rows)
+
+    records = data['records']
+    return {
+        'snapshot': version,
+        'total': int(len(rows)),
+        'count': int(len(page)),
+        'next_cursor': encode_cursor(version, page[-1]) if more else None,
+        'data': [{field: records[row][field] for field in fields} for row in page],
+    }
+
+
+def parse_batch_key(key):
+    """{'sector', 'indicator', 'outcome'?} or [sector, indicator] -> (sector, indicator, outcome)."""
+    if isinstance(key, dict):
+        sector, indicator, outcome = key.get('sector'), key.get('indicator'), key.get('outcome')
+    elif isinstance(key, (list, tuple)) and len(key) == 2:
+        (sector, indicator), outcome = key, None
+    else:
+        raise ApiError(400, "A key is {'sector': ..., 'indicator': ...} or [sector, indicator]")
+    if not isinstance(sector, str) or not isinstance(indicator, str) or not indicator.strip():
+        raise ApiError(400, "'sector' and 'indicator' must be non-empty strings")
+    return sector.strip().lower(), indicator, outcome
+
+
+def lookup_batch_key(data, key, fields):
+    """Result dict for one batch key: {'key', 'data'} or {'key', 'error'}."""
+    try:
+        sector, indicator, outcome = parse_batch_key(key)
+    except ApiError as error:
+        return {'key': key, 'error': error.message}
+    if sector not in source_labels():
+        return {'key': key, 'error': f"Unknown sector: {sector}"}
+
+    rows = data['keys'].get((sector, normalize(indicator)), [])
+    if outcome is not None:
+        rows = [row for row in rows if normalize(data['records'][row]['outcome']) == normalize(outcome)]
+    if not rows:
+        return {'key': key, 'error': "Indicator not found"}
+    if len(rows) > 1:
+        return {'key': key, 'error': f"{len(rows)} indicators have this name; add the key's 'outcome'"}
+    record = data['records'][rows[0]]
+    return {'key': key, 'data': {field: record[field] for field in fields}}
+
+
+def batch(version):
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict) or not isinstance(body.get('keys'), list):
+        raise ApiError(400, "Expected a JSON object with a 'keys' list")
+    keys = body['keys']
+    if len(keys) > MAX_BATCH_KEYS:
+        raise ApiError(413, f"At most {MAX_BATCH_KEYS} keys per request, got {len(keys)}")
+    fields = check_fields(body.get('fields') or BATCH_FIELDS)
+
+    _, data = get_api_data()
+    results = [lookup_batch_key(data, key, fields) for key in keys]
+    return {
+        'snapshot': version,
+        'count': len(results),
+        'errors': sum('error' in result for result in results),
+        'results': results,
+    }
+
+
+def register_api_routes(server):
+    """Add the /api/v1 JSON endpoints to the Flask server."""
+    server.add_url_rule(f"{API_PREFIX}/sectors", view_func=api_endpoint(sectors))
+    server.add_url_rule(f"{API_PREFIX}/indicators", view_func=api_endpoint(indicators))
+    server.add_url_rule(
+        f"{API_PREFIX}/indicators/batch", view_func=api_endpoint(batch, conditional=False),
+        methods=['POST']
+    )
+    return server
@@ -1,10 +1,27 @@
-from dash import html, dcc, callback, Output, Input, State
+from dash import html, dcc, callback, Output, Input, State, ALL
 import dash
 import dash.dash_table
-import plotly.express as px
+import numpy as np
 import pandas as pd
 import os
+import logging
 import dash_bootstrap_components as dbc # Import dbc for layout components
+from status_cube import status_counts_by_group, status_index
+from figure_cache import cached_figure
+from figures import status_pie
+from sector_config import SECTORS, SECTORS_BY_PATH
+from search_index import search_indicators
+from sector_data import get_matrix_data, MATRIX_OUTCOME_COL, INDICATOR_COL
+from typeahead import cached_prefix_index, typeahead_options, TYPEAHEAD_LIMIT
+from background import background_callback_manager, watch_callback_latency
+from export import register_export_routes
+from api import register_api_routes
+from catalogue import get_catalogue, clean_text, MATRIX_SOURCE
+from projections import get_projections, at_risk, AT_RISK_PROBABILITY
+from snapshot_diff import record_snapshot
+from history import record_history
+
+logger = logging.getLogger(__name__)
 
 # Import the sp.py file from the pages folder to register it as a page
 # import pages.sp # This line is crucial for registering the page?
@@ -13,13 +30,36 @@ import dash_bootstrap_components as dbc # Import dbc for layout components
 # IMPORTANT: use_pages=True enables multi-page functionality
 # We'll use dbc.themes.BOOTSTRAP for general styling and layout components.
 # external_stylesheets will automatically pick up CSS from the 'assets' folder.
+# Heavy operations run as background callbacks through background.background_callback_manager.
 app = dash.Dash(__name__, use_pages=True, suppress_callback_exceptions=True,
-                external_stylesheets=[dbc.themes.BOOTSTRAP, 'assets/style.css', 'assets/styles2.css'])
+                external_stylesheets=[dbc.themes.BOOTSTRAP, 'assets/style.css', 'assets/styles2.css'],
+                background_callback_manager=background_callback_manager)
 
 # This line is CRUCIAL for Render deployment with Gunicorn
 # It exposes the underlying Flask server for Gunicorn to run
 server = app.server
 
+# Log callbacks that exceed background.LATENCY_BUDGET_MS (candidates for background_callback)
+watch_callback_latency(server)
+
+# CSV / XLSX downloads of filtered indicator sets (/export/indicators.csv|.xlsx)
+register_export_routes(server)
+
+# Read-only JSON API for other systems (/api/v1/sectors, /api/v1/indicators)
+register_api_routes(server)
+
+# Keep a copy of the loaded data release for the "What Changed" page (snapshot_diff.py)
+# and append its values to the indicator history behind the trend sparklines (history.py).
+# Each is optional: a failure is logged and the dashboard starts without it.
+try:
+    record_snapshot()
+except Exception:
+    logger.exception("Could not record the data snapshot")
+try:
+    record_history()
+except Exception:
+    logger.exception("Could not append the data snapshot to the indicator history")
+
 
 # Helper functions (Keep these as they are, they are used in callbacks)
 def normalize_col_name(col_name):
@@ -54,9 +94,15 @@ EXPECTED_COLS_NORMALIZED = {
     'data_sources_report': 'Data Sources (report)'
 }
 
+# Period keys used in the processed-status-data store (Keep as is, read by display_pillar_dashboard)
+STATUS_PERIOD_LABELS = ['2024/25', '2026/7']
+# Period key -> year shown in the pillar pie titles
+PIE_YEAR_LABELS = {'2024/25': '2024/25', '2026/7': '2026/27'}
+
 # Initialize data variables (Keep as is)
 initial_data = pd.DataFrame()
 initial_status_data = {}
+initial_status_index = {}
 initial_pillar_options = []
 data_load_message = ""
 actual_col_name_map = {}
@@ -97,22 +143,19 @@ try:
         unique_pillars = [p for p in initial_data[pillar_col].unique() if pd.notna(p)]
         initial_pillar_options = [{'label': p, 'value': p} for p in unique_pillars]
         
-        status_categories = ['COMPLETED', 'GOOD', 'SATISFACTORY', 'LOW']
-        
         if status_2024_25_col and status_2026_27_col:
-            for pillar in unique_pillars:
-                pillar_df = initial_data[initial_data[pillar_col] == pillar]
-                
-                counts_2024_25 = pillar_df[status_2024_25_col].value_counts().to_dict()
-                status_counts_2024_25 = {cat: counts_2024_25.get(cat, 0) for cat in status_categories}
-                
-                counts_2026_27 = pillar_df[status_2026_27_col].value_counts().to_dict()
-                status_counts_2026_27 = {cat: counts_2026_27.get(cat, 0) for cat in status_categories}
-                
-                initial_status_data[pillar] = {
-                    '2024/25': status_counts_2024_25,
-                    '2026/7': status_counts_2026_27
-                }
+            # One vectorised pass over all pillars instead of a filter + value_counts per pillar
+            initial_status_data = status_counts_by_group(
+                initial_data, pillar_col,
+                [status_2024_25_col, status_2026_27_col],
+                STATUS_PERIOD_LABELS
+            )
+            # {pillar: {period: {status: [indicator]}}}, read when a pie slice is clicked
+            initial_status_index = status_index(
+                initial_data, indicator_col,
+                [status_2024_25_col, status_2026_27_col],
+                STATUS_PERIOD_LABELS, group_col=pillar_col
+            )
         else:
             data_load_message = html.Div(
                 "Warning: One or both status columns are missing. Status breakdown and table will not be displayed.",
@@ -130,12 +173,70 @@ except Exception as e:
         className='info-message-error'
     )
 
-# Hardcoded sector options (Used for num_sectors metric and potentially for dynamic links later)
-initial_sector_options = [
-    'PSDYE', 'WATSAN', 'ENERGY', 'PFM', 'FSD', 'SPORT AND CULTURE',
-    'AGRICULTURE', 'HEALTH', 'EDUCATION', 'ICT', 'TRANSPORT',
-    'URBANISATION', 'CENR', 'JRLO', 'GOVERNANCE', 'SOCIAL PROTECTION'
-]
+# Sector options (Used for num_sectors metric), taken from the sector page configuration
+initial_sector_options = [sector['label'] for sector in SECTORS]
+
+# Cross-sector pages in the sidebar: path -> (link text, header title)
+PAGE_TITLES = {
+    '/national': ("National Overview", "NST2 NATIONAL OVERVIEW"),
+    '/indicators': ("Indicator Explorer", "NST2 INDICATOR EXPLORER"),
+    '/changes': ("What Changed", "NST2 DATA RELEASE CHANGES"),
+}
+
+# Number of hits listed under the sidebar search box
+SEARCH_RESULT_LIMIT = 8
+
+def search_result_item(result):
+    status = result['status_midterm'] or result['status_2024']
+    return dcc.Link([
+        html.Div(result['indicator'], className='search-result-indicator'),
+        html.Div(
+            f"{result['source_label']} · {result['outcome']}" + (f" · {status}" if status else ''),
+            className='search-result-meta'
+        )
+    ], href=result['path'], className='search-result')
+
+# Status pie for the home page pillar section (built through figure_cache.cached_figure)
+def build_status_pie(counts_dict, year_label):
+    # Statuses with zero count are left out for cleaner pie charts
+    return status_pie(counts_dict, f'Indicator Status ({year_label})', drop_zero=True,
+                      legend_title_text='Status')
+
+
+# Number of indicators in the home page "at risk of missing midterm" ranking
+AT_RISK_LIMIT = 10
+
+def at_risk_table(pillar):
+    """Matrix indicators of the pillar least likely to reach their 2026/27 target
+    (projections.py), as a table."""
+    _, catalogue = get_catalogue()
+    _, projections = get_projections()
+    rows = np.flatnonzero((catalogue['source'].to_numpy() == MATRIX_SOURCE) &
+                          (catalogue['pillar'].to_numpy() == clean_text(pillar)))
+    ranked = rows[at_risk(rows, projections, 'midterm', AT_RISK_LIMIT)]
+    if not len(ranked):
+        return html.P("No indicator of this pillar is projected to miss its 2026/27 target.",
+                      className='at-risk-empty')
+
+    def number(value):
+        return '' if pd.isna(value) else f"{value:,.2f}".rstrip('0').rstrip('.')
+
+    header = html.Tr([html.Th(name) for name in [
+        "Indicator", "Current (2024/25)", "2026/27 target", "Projected 2026/27", "Chance on track"
+    ]])
+    body = [
+        html.Tr([
+            html.Td(catalogue.at[row, 'indicator']),
+            html.Td(number(pd.to_numeric(catalogue.at[row, 'current'], errors='coerce'))),
+            html.Td(number(pd.to_numeric(catalogue.at[row, 'target_midterm'], errors='coerce'))),
+            html.Td(number(projections.at[row, 'expected_midterm'])),
+            html.Td(f"{projections.at[row, 'on_track_midterm']:.0%}"),
+        ])
+        for row in catalogue.index[ranked]
+    ]
+    return dbc.Table([html.Thead(header), html.Tbody(body)], bordered=True, hover=True, size='sm',
+                     responsive=True, className='at-risk-table')
+
 
 # Main layout of the application
 # This now includes the sidebar and a dynamic content area for pages
@@ -167,120 +268,46 @@ app.layout = html.Div([
                     className='sidebar-nav-link' # Apply your existing styling
                 ),
                 html.Br(),
+                # Cross-sector pages (PAGE_TITLES)
+                dbc.Nav(
+                    [
+                        dbc.NavLink(
+                            html.Div(name, className="ms-1"),
+                            href=path,
+                            active="exact",
+                            className='sidebar-nav-link'
+                        )
+                        for path, (name, _) in PAGE_TITLES.items()
+                    ],
+                    vertical=True,
+                    pills=True,
+                    className='sidebar-nav-group'
+                ),
                 html.Div(id='data-load-message-display', children=data_load_message),
+
+                # Cross-sector indicator search (search_index.py)
+                html.Label("Search indicators", className='dropdown-label'),
+                dcc.Input(
+                    id='indicator-search',
+                    type='search',
+                    placeholder='e.g. stunting, internet...',
+                    debounce=0.3,
+                    className='indicator-search-input'
+                ),
+                html.Div(id='indicator-search-results', className='indicator-search-results'),
                 
-                # Navigation for ICT and PSDYE pages using dbc.Nav and dbc.NavLink
+                # Navigation for the sector pages using dbc.Nav and dbc.NavLink
                 html.Label("Select the SSP sector", className='dropdown-label'), # New label for clarity
                 dbc.Nav(
                     [
+                        # One link per sector page, in sector_config.SECTORS order
                         dbc.NavLink(
-                            html.Div("ICT Dashboard", className="ms-1"),
-                            href="/ict", # Path for ICT page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        dbc.NavLink(
-                            html.Div("PSDYE Dashboard", className="ms-1"),
-                            href="/psdye", # Path for PSDYE page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        # Add this new NavLink for CENR
-                        dbc.NavLink(
-                            html.Div("CENR Dashboard", className="ms-1"),
-                            href="/cenr", # Path for CENR page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        # Add the new NavLink for Education
-                        dbc.NavLink(
-                            html.Div("Education Dashboard", className="ms-1"),
-                            href="/education", # Path for Education page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        # Add other links here later as needed
-                        dbc.NavLink(
-                            html.Div("Health Dashboard", className="ms-1"),
-                            href="/health", # Path for Health page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        dbc.NavLink(
-                            html.Div("Governance Dashboard", className="ms-1"),
-                            href="/governance", # Path for Governance page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        dbc.NavLink(
-                            html.Div("Agriculture Dashboard", className="ms-1"),
-                            href="/agriculture", # Path for Agriculture page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        # NEW: Add NavLink for Transport
-                        dbc.NavLink(
-                            html.Div("Transport Dashboard", className="ms-1"),
-                            href="/transport", # Path for Transport page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        # NEW: Add NavLink for Social Protection
-                        dbc.NavLink(
-                            html.Div("Social Protection Dashboard", className="ms-1"),
-                            href="/social-protection", # Path for Social Protection page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        # NEW: Add NavLink for Energy
-                        dbc.NavLink(
-                            html.Div("Energy Dashboard", className="ms-1"),
-                            href="/energy", # Path for Energy page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                         # NEW: Add NavLink for Urbanisation
-                        dbc.NavLink(
-                            html.Div("Urbanisation Dashboard", className="ms-1"),
-                            href="/urbanisation", # Path for Urbanisation page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        # NEW: Add NavLink for WATSAN
-                        dbc.NavLink(
-                            html.Div("WATSAN Dashboard", className="ms-1"),
-                            href="/watsan", # Path for WATSAN page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        # NEW: Add NavLink for JRLO
-                        dbc.NavLink(
-                            html.Div("JRLO Dashboard", className="ms-1"),
-                            href="/jrlo", # Path for JRLO page
+                            html.Div(sector['name'], className="ms-1"),
+                            href=sector['path'],
                             active="exact",
                             className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        # NEW: Add NavLink for Sport and Culture
-                        dbc.NavLink(
-                            html.Div("Sport and Culture Dashboard", className="ms-1"),
-                            href="/sport", # Path for Sport and Culture page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        # NEW: Add NavLink for PFM
-                        dbc.NavLink(
-                            html.Div("PFM Dashboard", className="ms-1"),
-                            href="/pfm", # Path for PFM page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
-                        # NEW: Add NavLink for FSD
-                        dbc.NavLink(
-                            html.Div("FSD Dashboard", className="ms-1"),
-                            href="/fsd", # Path for FSD page
-                            active="exact",
-                            className='sidebar-nav-link' # Custom class for styling
-                        ),
+                        )
+                        for sector in SECTORS
                     ],
                     vertical=True,
                     pills=True,
@@ -337,6 +364,28 @@ app.layout = html.Div([
                     html.H3(id='pillar-subheader', className='pillar-subheader'),
                     html.Div(id='pillar-card-section', className='pillar-card-section'),
 
+                    # Indicators of a clicked pillar pie slice (set_home_status_filter)
+                    dcc.Store(id='home-status-filter'),
+                    html.Div(id='home-status-panel', style={'display': 'none'}, children=[
+                        html.Div([
+                            html.P(id='home-status-title', className='section-title'),
+                            html.Button("Clear filter", id='home-status-clear', n_clicks=0,
+                                        className='btn btn-sm btn-outline-secondary')
+                        ]),
+                        html.Ul(id='home-status-list')
+                    ]),
+
+                    # Indicators of the pillar projected to miss the midterm target (projections.py)
+                    html.Div([
+                        html.P("At risk of missing the 2026/27 target", className='section-title'),
+                        html.P(
+                            "Current trend extended from the 2023/24 baseline; lowest chance of being "
+                            f"on track first (below {AT_RISK_PROBABILITY:.0%} only).",
+                            className='at-risk-note'
+                        ),
+                        html.Div(id='home-at-risk-list')
+                    ], className='at-risk-section'),
+
                     # SSP Section
                     html.Div([
                         html.Div([
@@ -396,6 +445,20 @@ def toggle_home_content_visibility(pathname):
         return {'display': 'none'}
 
 
+@app.callback(
+    Output('indicator-search-results', 'children'),
+    Input('indicator-search', 'value'),
+    prevent_initial_call=True
+)
+def update_search_results(query):
+    if not query or len(query.strip()) < 2:
+        return []
+    results = search_indicators(query, limit=SEARCH_RESULT_LIMIT)
+    if not results:
+        return html.Div("No matching indicators", className='search-result-meta')
+    return [search_result_item(result) for result in results]
+
+
 @app.callback(
     Output('num-sectors-metric', 'children'),
     Input('home-btn', 'n_clicks'), # Keep this input to trigger on home button click
@@ -419,78 +482,15 @@ def update_num_sectors_metric(n_clicks, pathname):
 )
 def update_title(home_clicks, pathname):
     ctx = dash.callback_context
-    if not ctx.triggered:
-        if pathname == '/ict':
-            return "ICT SSP PROGRESS DASHBOARD"
-        elif pathname == '/psdye':
-            return "PSDYE SSP PROGRESS DASHBOARD"
-        elif pathname == '/cenr':
-            return "CENR SSP PROGRESS DASHBOARD"
-        elif pathname == '/education':
-            return "EDUCATION SSP PROGRESS DASHBOARD"
-        elif pathname == '/health':
-            return "HEALTH SSP PROGRESS DASHBOARD"
-        elif pathname == '/governance':
-            return "GOVERNANCE SSP PROGRESS DASHBOARD"
-        elif pathname == '/agriculture':
-            return "AGRICULTURE SSP PROGRESS DASHBOARD"
-        elif pathname == '/transport':
-            return "TRANSPORT SSP PROGRESS DASHBOARD"
-        elif pathname == '/social-protection': # Added Social Protection condition
-            return "SOCIAL PROTECTION SSP PROGRESS DASHBOARD" # Title for Social Protection
-        elif pathname == '/energy': # NEW: Added Energy condition
-            return "ENERGY SSP PROGRESS DASHBOARD" # NEW: Title for Energy
-        elif pathname == '/urbanisation': # NEW: Added Urbanisation condition
-            return "URBANISATION SSP PROGRESS DASHBOARD" # NEW: Title for Urbanisation
-        elif pathname == '/watsan': # NEW: Added WATSAN condition
-            return "WATSAN SSP PROGRESS DASHBOARD" # NEW: Title for WATSAN
-        elif pathname == '/jrlo': # NEW: Added JRLO condition
-            return "JRLO SSP PROGRESS DASHBOARD" # NEW: Title for JRLO
-        elif pathname == '/sport': # NEW: Added Sport and Culture condition
-            return "SPORT AND CULTURE SSP PROGRESS DASHBOARD" # NEW: Title for Sport and Culture
-        elif pathname == '/pfm': # NEW: Added PFM condition
-            return "PFM SSP PROGRESS DASHBOARD" # NEW: Title for PFM
-        elif pathname == '/fsd': # NEW: Added FSD condition
-            return "FSD SSP PROGRESS DASHBOARD" # NEW: Title for FSD
+    if ctx.triggered and ctx.triggered_id == 'home-btn':
         return "NST2 PROGRESS DASHBOARD"
 
-    triggered_id = ctx.triggered_id
-    if triggered_id == 'home-btn' or pathname == '/':
-        return "NST2 PROGRESS DASHBOARD"
-    elif pathname == '/ict':
-        return "ICT SSP PROGRESS DASHBOARD"
-    elif pathname == '/psdye':
-        return "PSDYE SSP PROGRESS DASHBOARD"
-    elif pathname == '/cenr':
-        return "CENR SSP PROGRESS DASHBOARD"
-    elif pathname == '/education':
-        return "EDUCATION SSP PROGRESS DASHBOARD"
-    elif pathname == '/health':
-        return "HEALTH SSP PROGRESS DASHBOARD"
-    elif pathname == '/governance':
-        return "GOVERNANCE SSP PROGRESS DASHBOARD"
-    elif pathname == '/agriculture':
-        return "AGRICULTURE SSP PROGRESS DASHBOARD"
-    elif pathname == '/transport':
-        return "TRANSPORT SSP PROGRESS DASHBOARD"
-    elif pathname == '/social-protection': # Added Social Protection condition
-        return "SOCIAL PROTECTION SSP PROGRESS DASHBOARD" # Title for Social Protection
-    elif pathname == '/energy': # NEW: Added Energy condition
-        return "ENERGY SSP PROGRESS DASHBOARD" # NEW: Title for Energy
-    elif pathname == '/urbanisation': # NEW: Added Urbanisation condition
-        return "URBANISATION SSP PROGRESS DASHBOARD" # NEW: Title for Urbanisation
-    elif pathname == '/watsan': # NEW: Added WATSAN condition
-        return "WATSAN SSP PROGRESS DASHBOARD" # NEW: Title for WATSAN
-    elif pathname == '/jrlo': # NEW: Added JRLO condition
-        return "JRLO SSP PROGRESS DASHBOARD" # NEW: Title for JRLO
-    elif pathname == '/sport': # NEW: Added Sport and Culture condition
-        return "SPORT AND CULTURE SSP PROGRESS DASHBOARD" # NEW: Title for Sport and Culture
-    elif pathname == '/pfm': # NEW: Added PFM condition
-        return "PFM SSP PROGRESS DASHBOARD" # NEW: Title for PFM
-    elif pathname == '/fsd': # NEW: Added FSD condition
-        return "FSD SSP PROGRESS DASHBOARD" # NEW: Title for FSD
-    else:
-        return "NST2 PROGRESS DASHBOARD"
+    if pathname in PAGE_TITLES:
+        return PAGE_TITLES[pathname][1]
+    sector = SECTORS_BY_PATH.get(pathname)
+    if sector:
+        return f"{sector['label']} SSP PROGRESS DASHBOARD"
+    return "NST2 PROGRESS DASHBOARD"
 
 
 @app.callback(
@@ -531,7 +531,6 @@ def update_dynamic_data_and_metrics(initial_data_dict):
             pillar_options = [{'label': p, 'value': p} for p in unique_pillars]
             default_pillar_value = pillar_options[0]['value'] if pillar_options else None
 
-            status_categories = ['COMPLETED', 'GOOD', 'SATISFACTORY', 'LOW']
             status_2024_25_col = None
             status_2026_27_col = None
             
@@ -542,21 +541,12 @@ def update_dynamic_data_and_metrics(initial_data_dict):
                     status_2026_27_col = col
 
             if status_2024_25_col and status_2026_27_col:
-                for pillar in unique_pillars:
-                    # Ensure 'df' (from uploaded-data) is used for filtering
-                    pillar_df = df[df[actual_pillar_col] == pillar]
-                    
-                    counts_2024_25 = pillar_df[status_2024_25_col].value_counts().to_dict()
-                    status_counts_2024_25 = {cat: counts_2024_25.get(cat, 0) for cat in status_categories}
-                    
-                    # Corrected variable name from status_2026_7_col to status_2026_27_col
-                    counts_2026_27 = pillar_df[status_2026_27_col].value_counts().to_dict()
-                    status_counts_2026_27 = {cat: counts_2026_27.get(cat, 0) for cat in status_categories}
-                    
-                    processed_status_data[pillar] = {
-                        '2024/25': status_counts_2024_25,
-                        '2026/7': status_counts_2026_27
-                    }
+                # Ensure 'df' (from uploaded-data) is used for the tabulation
+                processed_status_data = status_counts_by_group(
+                    df, actual_pillar_col,
+                    [status_2024_25_col, status_2026_27_col],
+                    STATUS_PERIOD_LABELS
+                )
             else:
                 pass # Warning message handled in initial data load
 
@@ -618,39 +608,88 @@ def update_ssp_outcome_dropdown(selected_pillar, uploaded_data_dict):
 
     return options, default_value
 
+def matrix_indicator_index(outcome):
+    matrix = get_matrix_data()
+    def outcome_indicators():
+        df = matrix['df']
+        return [i for i in df[df[MATRIX_OUTCOME_COL] == outcome][INDICATOR_COL].unique() if pd.notna(i)]
+    return cached_prefix_index(('matrix', outcome), matrix['version'], outcome_indicators)
+
+# Options are filtered on the server (typeahead.py): a new outcome resets the list and the
+# selection, typing in the indicator dropdown (search_value) only replaces the list
 @app.callback(
     Output('home-ssp-indicator-dropdown', 'options'),
     Output('home-ssp-indicator-dropdown', 'value'),
     Input('home-ssp-outcome-dropdown', 'value'),
-    State('uploaded-data', 'data'),
+    Input('home-ssp-indicator-dropdown', 'search_value'),
+    Input('home-status-filter', 'data'),
+    State('home-ssp-indicator-dropdown', 'value'),
     prevent_initial_call=False
 )
-def update_indicator_dropdown(selected_outcome, uploaded_data_dict):
-    if not uploaded_data_dict or not selected_outcome:
+def update_indicator_dropdown(selected_outcome, search_value, status_filter, selected_indicator):
+    if status_filter:
+        # Indicators of the clicked pie slice, across the outcomes of the pillar
+        pillar, period, status = status_filter['pillar'], status_filter['period'], status_filter['status']
+        index = cached_prefix_index(
+            ('matrix-status', pillar, period, status), get_matrix_data()['version'],
+            lambda: initial_status_index.get(pillar, {}).get(period, {}).get(status, [])
+        )
+        # Every indicator of the slice, as listed in the status panel
+        limit = max(len(index['labels']), TYPEAHEAD_LIMIT)
+    elif selected_outcome:
+        index = matrix_indicator_index(selected_outcome)
+        limit = TYPEAHEAD_LIMIT
+    else:
         return [], None
-        
-    df = pd.DataFrame(uploaded_data_dict)
 
-    if df.empty:
-        return [], None
+    if dash.ctx.triggered_id == 'home-ssp-indicator-dropdown':
+        return typeahead_options(index, search_value, selected_indicator, limit), dash.no_update
 
-    actual_indicator_col = None
-    actual_ssp_outcome_col = None
-    
-    for col in df.columns:
-        if normalize_col_name(col) == normalize_col_name(EXPECTED_COLS_NORMALIZED['indicator']):
-            actual_indicator_col = col
-        if normalize_col_name(col) == normalize_col_name(EXPECTED_COLS_NORMALIZED['ssp_outcome']):
-            actual_ssp_outcome_col = col
+    options = typeahead_options(index, None, limit=limit)
+    default_value = options[0]['value'] if options else None
 
-    if actual_indicator_col is None or actual_ssp_outcome_col is None:
-        return [], None
+    return options, default_value
 
-    indicators = [i for i in df[df[actual_ssp_outcome_col] == selected_outcome][actual_indicator_col].unique() if pd.notna(i)]
-    options = [{'label': i, 'value': i} for i in indicators]
-    default_value = indicators[0] if len(indicators) > 0 else None
+# A click on a pillar pie slice filters the indicator dropdown to that status and lists
+# the indicators; another pillar, another outcome or "Clear filter" removes the filter.
+@app.callback(
+    Output('home-status-filter', 'data'),
+    Output('home-status-panel', 'style'),
+    Output('home-status-title', 'children'),
+    Output('home-status-list', 'children'),
+    Input({'type': 'pillar-pie', 'period': ALL}, 'clickData'),
+    Input('home-status-clear', 'n_clicks'),
+    Input('pillar-dropdown', 'value'),
+    Input('home-ssp-outcome-dropdown', 'value'),
+    prevent_initial_call=True
+)
+def set_home_status_filter(pie_clicks, clear_clicks, pillar, selected_outcome):
+    triggered = dash.ctx.triggered_id
+    if not (isinstance(triggered, dict) and triggered.get('type') == 'pillar-pie') or not pillar:
+        return None, {'display': 'none'}, '', []
+
+    click_data = dash.ctx.triggered[0]['value'] or {}
+    points = click_data.get('points') or []
+    status = points[0].get('label') if points else None
+    period = triggered['period']
+    indicators = initial_status_index.get(pillar, {}).get(period, {}).get(status)
+    if indicators is None:
+        return None, {'display': 'none'}, '', []
+
+    title = f"{status} indicators in {pillar} ({PIE_YEAR_LABELS[period]}): {len(indicators)}"
+    return ({'pillar': pillar, 'period': period, 'status': status},
+            {'display': 'block'}, title, [html.Li(indicator) for indicator in indicators])
+
+
+@app.callback(
+    Output('home-at-risk-list', 'children'),
+    Input('pillar-dropdown', 'value')
+)
+def update_at_risk_list(pillar):
+    if not pillar:
+        return []
+    return at_risk_table(pillar)
 
-    return options, default_value
 
 @app.callback(
     Output('home-indicator-detail-section', 'children'), # Corrected ID
@@ -711,6 +750,9 @@ def display_indicator_details(indicator, outcome, pillar, uploaded_data_dict):
         return html.Div("Please select an outcome and indicator.", className='info-message'), ""
 
     row = df[(df[column_map['ssp_outcome']] == outcome) & (df[column_map['indicator']] == indicator)]
+    if row.empty and pillar:
+        # Indicators picked through a pie slice filter may belong to another outcome of the pillar
+        row = df[(df[column_map['pillar']] == pillar) & (df[column_map['indicator']] == indicator)]
     if row.empty:
         return html.Div("No data for selected combination.", className='info-message-error'), ""
 
@@ -958,39 +1000,21 @@ def display_pillar_dashboard(pillar, processed_status_data, uploaded_data_dict):
 
     # Pie charts
     pie_graphs = [] # Renamed to avoid confusion with the pie_charts list from previous turn
-    status_colors = {
-        'COMPLETED': '#28a745',  # Green
-        'GOOD': '#007bff',       # Blue
-        'SATISFACTORY': '#ffc107', # Yellow
-        'LOW': '#dc3545'         # Red
-    }
-
-    for year_label, counts_dict in [('2024/25', status_counts_2024_25), ('2026/27', status_counts_2026_27)]:
-        pie_df = pd.DataFrame(list(counts_dict.items()), columns=['Status', 'Count'])
-        # Filter out statuses with zero count for cleaner pie charts
-        pie_df = pie_df[pie_df['Count'] > 0]
-        if not pie_df.empty:
-            fig = px.pie(pie_df, 
-                         values='Count', 
-                         names='Status', 
-                         title=f'Indicator Status ({year_label})',
-                         color='Status',
-                         color_discrete_map=status_colors,
-                         hole=0.3 # Creates a donut chart
-                        )
-            fig.update_traces(textinfo='percent')
-            fig.update_layout(
-                margin={"l": 20, "r": 20, "t": 50, "b": 20},
-                legend_title_text='Status',
-                paper_bgcolor='rgba(0,0,0,0)', # Transparent background
-                plot_bgcolor='rgba(0,0,0,0)',
-                font_color="#333",
-                title_font_size=16,
-                title_x=0.5 # Center title
+    for period, counts_dict in [('2024/25', status_counts_2024_25), ('2026/7', status_counts_2026_27)]:
+        year_label = PIE_YEAR_LABELS[period]
+        if any(count > 0 for count in counts_dict.values()):
+            # The counts are the data the pie is built from, so they act as its version:
+            # the figure is only rebuilt when this pillar's counts change.
+            fig = cached_figure(
+                ('pillar-pie', pillar, year_label),
+                tuple(counts_dict.items()),
+                lambda: build_status_pie(counts_dict, year_label)
             )
             # Removed the inline style from dcc.Graph. 
             # The dbc.Col below will handle the sizing and horizontal arrangement.
-            pie_graphs.append(dcc.Graph(figure=fig, className='pie-chart-graph'))
+            # Pattern-matching id: clicks are handled by set_home_status_filter
+            pie_graphs.append(dcc.Graph(id={'type': 'pillar-pie', 'period': period}, figure=fig,
+                                        className='pie-chart-graph'))
         else:
             pie_graphs.append(html.Div(f"No data for {year_label} status breakdown.", className='info-message-small'))
 
@@ -0,0 +1,33 @@
+// assets/debounce.js
+//
+// Debounced indicator selection for the sector pages (see sector_page.register_callbacks).
+// Arrow-keying through an indicator dropdown fires a value change for every intermediate
+// indicator. Only the selection that is still current after DEBOUNCE_MS is forwarded to the
+// server, tagged with a per-tab client id and a sequence number so the server can also
+// drop a selection that arrives after a newer one.
+
+(function () {
+    var DEBOUNCE_MS = 250;
+    var CLIENT_ID = Math.random().toString(36).slice(2) + Date.now().toString(36);
+    var latestSeq = {};
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        nst2: Object.assign({}, (window.dash_clientside || {}).nst2, {
+            debounceSelection: function (value, componentId) {
+                var key = JSON.stringify(componentId);
+                var seq = (latestSeq[key] || 0) + 1;
+                latestSeq[key] = seq;
+
+                return new Promise(function (resolve) {
+                    setTimeout(function () {
+                        if (latestSeq[key] !== seq || value === null || value === undefined) {
+                            resolve(window.dash_clientside.no_update);
+                        } else {
+                            resolve({value: value, seq: seq, client: CLIENT_ID});
+                        }
+                    }, DEBOUNCE_MS);
+                });
+            }
+        })
+    });
+})();
@@ -0,0 +1,82 @@
+# background.py
+#
+# Background callbacks for operations too slow to run inside a gunicorn request worker
+# (re-ingesting data, cross-sector aggregation, exports). Jobs run in separate processes
+# through Dash's DiskcacheManager, so no external broker (Redis/Celery) is needed: the
+# job queue and results live in a diskcache directory shared by all workers.
+#
+# Rule of thumb: a callback whose typical run time exceeds LATENCY_BUDGET_MS is registered
+# with background_callback() instead of dash.callback(). watch_callback_latency() logs the
+# synchronous callbacks that go over the budget so they can be moved.
+
+import logging
+import os
+import tempfile
+import time
+
+import dash
+import diskcache
+from flask import g, request
+
+logger = logging.getLogger(__name__)
+
+# Synchronous callbacks should answer within this many milliseconds
+LATENCY_BUDGET_MS = int(os.environ.get('NST2_LATENCY_BUDGET_MS', 300))
+
+# How often (ms) the browser polls a running job for progress and its result
+POLL_INTERVAL_MS = 500
+
+# Must be the same directory for every gunicorn worker
+CALLBACK_CACHE_DIR = os.environ.get(
+    'NST2_CALLBACK_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'nst2-callbacks')
+)
+
+# Finished job results are dropped after an hour
+RESULT_EXPIRE_SECONDS = 3600
+
+background_callback_manager = dash.DiskcacheManager(
+    diskcache.Cache(CALLBACK_CACHE_DIR), expire=RESULT_EXPIRE_SECONDS
+)
+
+
+def background_callback(*args, progress=None, running=None, cancel=None, **kwargs):
+    """dash.callback for a job that runs outside the request worker.
+
+    progress: Output(s) fed by the set_progress argument passed as the first callback
+    argument, e.g. Output('job-progress', 'value'). running: [(Output, value while running,
+    value when done), ...], e.g. to disable the trigger button. cancel: Inputs that stop a
+    running job.
+    """
+    if progress is not None:
+        kwargs['progress'] = progress
+    if running is not None:
+        kwargs['running'] = running
+    if cancel is not None:
+        kwargs['cancel'] = cancel
+    kwargs.setdefault('interval', POLL_INTERVAL_MS)
+    return dash.callback(*args, background=True, manager=background_callback_manager, **kwargs)
+
+
+def watch_callback_latency(server, budget_ms=LATENCY_BUDGET_MS):
+    """Log every synchronous callback request that takes longer than budget_ms."""
+
+    @server.before_request
+    def _start_callback_timer():
+        # Polls for a running background job carry its cacheKey and are not timed
+        if request.path.endswith('/_dash-update-component') and 'cacheKey' not in request.args:
+            g.callback_started = time.perf_counter()
+
+    @server.after_request
+    def _log_slow_callback(response):
+        started = g.pop('callback_started', None)
+        if started is not None:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if elapsed_ms > budget_ms:
+                body = request.get_json(silent=True) or {}
+                logger.warning(
+                    "Callback %s took %.0f ms (budget %d ms); consider background_callback()",
+                    body.get('output'), elapsed_ms, budget_ms
+                )
+        return response
+
+    return server
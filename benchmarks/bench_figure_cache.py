@@ -0,0 +1,65 @@
+# benchmarks/bench_figure_cache.py
+#
+# Per-figure cost of the status pies with and without figure_cache. "Uncached" builds
+# the Plotly figure and serialises it the way Dash does for every response. "Cached"
+# looks up the stored dict and serialises that.
+#
+# Usage: python benchmarks/bench_figure_cache.py
+
+import os
+import sys
+import time
+
+from plotly.io.json import to_json_plotly
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from figure_cache import cached_figure, clear_figure_cache
+from sector_config import SECTORS
+from sector_data import get_sector_data
+from sector_page import pie_chart
+from app import build_status_pie, initial_status_data
+
+
+def per_call_ms(fn, repeat=200):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def report(label, build, key, version):
+    uncached = per_call_ms(lambda: to_json_plotly(build()), repeat=50)
+    clear_figure_cache()
+    start = time.perf_counter()
+    cached_figure(key, version, build)
+    first = (time.perf_counter() - start) * 1000
+    cached = per_call_ms(lambda: to_json_plotly(cached_figure(key, version, build)))
+    print(f"{label:<32} {uncached:>11.2f} {first:>11.2f} {cached:>11.3f} {uncached / cached:>8.0f}x")
+
+
+def main():
+    print(f"{'figure':<32} {'uncached':>11} {'first build':>11} {'cached':>11} {'speed-up':>9}")
+    print(f"{'':<32} {'(ms)':>11} {'(ms)':>11} {'(ms)':>11}")
+
+    sector = SECTORS[0]
+    data = get_sector_data(sector['key'])
+    report(
+        f"sector pie ({sector['key']})",
+        lambda: pie_chart(data['status_2024_counts'], "2024/25 Target Status", sector['palette']),
+        ('sector-pie', sector['key'], '2024/25'), data['version']
+    )
+
+    pillar, counts = next(iter(initial_status_data.items()))
+    counts_2024_25 = counts['2024/25']
+    report(
+        "home pillar pie (status_pie)",
+        lambda: build_status_pie(counts_2024_25, '2024/25'),
+        ('pillar-pie', pillar, '2024/25'), tuple(counts_2024_25.items())
+    )
+
+
+if __name__ == '__main__':
+    main()
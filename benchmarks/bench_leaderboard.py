@@ -0,0 +1,44 @@
+# benchmarks/bench_leaderboard.py
+#
+# Picking the k most-behind indicators: a full sort of the progress array against
+# leaderboard.top_k (numpy.argpartition plus a sort of the k picked). Runs on the computed
+# 2024/25 progress of the sector rows, tiled to larger sizes.
+#
+# Usage: python benchmarks/bench_leaderboard.py [copies ...]   (default: 1 100 1000)
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from leaderboard import get_leaderboards, top_k, NATIONAL
+
+K = 10
+
+
+def best_of(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(copies):
+    _, leaderboards = get_leaderboards()
+    base, _ = leaderboards['scopes'][(NATIONAL, '2024/25')]
+    print(f"{'rows':>10} {'sort (ms)':>12} {'top_k (ms)':>12} {'speed-up':>9}")
+    for n in copies:
+        progress = np.tile(base, n)
+        sort_time = best_of(lambda: np.argsort(progress, kind='stable')[:K])
+        top_time = best_of(lambda: top_k(progress, K))
+        print(f"{len(progress):>10} {sort_time * 1000:>12.3f} {top_time * 1000:>12.3f} "
+              f"{sort_time / top_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [1, 100, 1000])
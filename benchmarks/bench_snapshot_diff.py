@@ -0,0 +1,60 @@
+# benchmarks/bench_snapshot_diff.py
+#
+# snapshot_diff.diff_snapshots on the loaded data snapshot tiled to larger sizes, against
+# an "earlier release" with a share of the rows edited (statuses, values, narratives) and
+# a few rows added and removed.
+#
+# Usage: python benchmarks/bench_snapshot_diff.py [copies ...]   (default: 1 10 100)
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snapshot_diff import current_snapshot, diff_snapshots, change_summary
+
+# Share of the rows edited in the earlier release
+EDITED_SHARE = 0.05
+
+
+def earlier_release(snapshot, seed=0):
+    rng = np.random.default_rng(seed)
+    old = snapshot.copy()
+    rows = rng.choice(len(old), size=max(1, int(len(old) * EDITED_SHARE)), replace=False)
+    third = len(rows) // 3
+    old.loc[rows[:third], 'status_2024'] = 'LOW'
+    old.loc[rows[third:2 * third], 'current'] = -1.0
+    old.loc[rows[2 * third:], 'drivers'] = 'Earlier narrative'
+    # Rows added since (dropped here) and removed since (renamed here)
+    old = old.drop(index=rows[:10])
+    old.loc[rows[10:20], 'indicator'] = 'Discontinued indicator'
+    return old
+
+
+def best_of(fn, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(copies):
+    _, snapshot = current_snapshot()
+    print(f"{'rows':>10} {'diff (ms)':>12}  changes")
+    for n in copies:
+        new = pd.concat([snapshot] * n, ignore_index=True)
+        old = earlier_release(new)
+        elapsed = best_of(lambda: diff_snapshots(old, new))
+        summary = change_summary(diff_snapshots(old, new))
+        print(f"{len(new):>10} {elapsed * 1000:>12.1f}  " +
+              ', '.join(f"{change}: {count}" for change, count in summary.items()))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [1, 10, 100])
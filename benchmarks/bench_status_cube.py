@@ -0,0 +1,77 @@
+# benchmarks/bench_status_cube.py
+#
+# Compares the old per-pillar filter + value_counts loop with the single-pass
+# status_cube() tabulation on synthetic matrices.
+#
+# The loop cost grows with the number of groups, so each size is run with the four
+# NST2 pillars and with 64 groups (roughly the sector x outcome cardinality).
+#
+# Usage: python benchmarks/bench_status_cube.py [rows ...]   (default: 10000 1000000)
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from status_cube import STATUS_CATEGORIES, status_counts_by_group
+
+PILLARS = ['ECONOMIC TRANSFORMATION', 'SOCIAL TRANSFORMATIONAL', 'TRANSFORMATIONAL GOVERNANCE', 'OTHERS']
+STATUS_COLS = ['Status based on 2024/25 Target', 'Status based on 2026/27 Target']
+PERIODS = ['2024/25', '2026/7']
+
+
+def synthetic_matrix(n_rows, n_groups=len(PILLARS), seed=0):
+    rng = np.random.default_rng(seed)
+    statuses = np.array(STATUS_CATEGORIES + [None], dtype=object)
+    groups = PILLARS[:n_groups] + [f'GROUP {i}' for i in range(len(PILLARS), n_groups)]
+    return pd.DataFrame({
+        'Pillar': rng.choice(np.array(groups + [None], dtype=object), n_rows),
+        STATUS_COLS[0]: rng.choice(statuses, n_rows),
+        STATUS_COLS[1]: rng.choice(statuses, n_rows),
+    })
+
+
+def loop_counts(df):
+    # The previous implementation from app.py, kept here as the reference
+    result = {}
+    for pillar in [p for p in df['Pillar'].unique() if pd.notna(p)]:
+        pillar_df = df[df['Pillar'] == pillar]
+        counts_2024_25 = pillar_df[STATUS_COLS[0]].value_counts().to_dict()
+        counts_2026_27 = pillar_df[STATUS_COLS[1]].value_counts().to_dict()
+        result[pillar] = {
+            '2024/25': {cat: counts_2024_25.get(cat, 0) for cat in STATUS_CATEGORIES},
+            '2026/7': {cat: counts_2026_27.get(cat, 0) for cat in STATUS_CATEGORIES},
+        }
+    return result
+
+
+def best_of(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main(sizes):
+    print(f"{'rows':>10} {'groups':>7} {'loop (ms)':>12} {'cube (ms)':>12} {'speed-up':>9}")
+    for n_rows in sizes:
+        for n_groups in (len(PILLARS), 64):
+            df = synthetic_matrix(n_rows, n_groups)
+            repeat = 5 if n_rows <= 100_000 else 2
+            loop_time, expected = best_of(lambda: loop_counts(df), repeat)
+            cube_time, actual = best_of(
+                lambda: status_counts_by_group(df, 'Pillar', STATUS_COLS, PERIODS), repeat
+            )
+            assert actual == expected, "status_cube result differs from the reference loop"
+            print(f"{n_rows:>10} {n_groups:>7} {loop_time * 1000:>12.2f} {cube_time * 1000:>12.2f} "
+                  f"{loop_time / cube_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 1_000_000])
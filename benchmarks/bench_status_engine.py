@@ -0,0 +1,73 @@
+# benchmarks/bench_status_engine.py
+#
+# Recomputing progress and status of every indicator: a per-row Python loop (the way a
+# DataFrame.apply would do it) against status_engine.recompute on whole columns. Runs on
+# the real catalogue (all sectors plus matrix.xlsx) and on copies of it tiled to larger
+# sizes.
+#
+# Usage: python benchmarks/bench_status_engine.py [copies ...]   (default: 1 100 1000)
+
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogue import get_catalogue
+from status_engine import indicator_arrays, recompute, STATUS_THRESHOLDS, LOWEST_STATUS
+
+
+def row_status(baseline, target, current, decreasing):
+    # Reference: one indicator at a time
+    try:
+        value = target / current if decreasing else current / target
+    except ZeroDivisionError:
+        value = 1.0 if decreasing and target >= 0 else math.nan
+    if math.isnan(value) or math.isinf(value):
+        return None
+    for status, threshold in STATUS_THRESHOLDS:
+        if value >= threshold:
+            return status
+    return LOWEST_STATUS
+
+
+def loop_recompute(arrays):
+    statuses = []
+    for baseline, target_2024, target_midterm, current in zip(
+        arrays['baseline'].tolist(), arrays['target_2024'].tolist(),
+        arrays['target_midterm'].tolist(), arrays['current'].tolist()
+    ):
+        last_target = target_midterm if not math.isnan(target_midterm) else target_2024
+        decreasing = last_target < baseline
+        statuses.append((row_status(baseline, target_2024, current, decreasing),
+                         row_status(baseline, target_midterm, current, decreasing)))
+    return statuses
+
+
+def best_of(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(copies):
+    _, catalogue = get_catalogue()
+    base = indicator_arrays(catalogue)
+    print(f"{'rows':>10} {'loop (ms)':>12} {'engine (ms)':>12} {'speed-up':>9}")
+    for n in copies:
+        arrays = {field: np.tile(values, n) for field, values in base.items()}
+        repeat = 5 if n <= 100 else 2
+        loop_time = best_of(lambda: loop_recompute(arrays), repeat)
+        engine_time = best_of(lambda: recompute(arrays), repeat)
+        print(f"{len(arrays['current']):>10} {loop_time * 1000:>12.2f} {engine_time * 1000:>12.3f} "
+              f"{loop_time / engine_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [1, 100, 1000])
@@ -0,0 +1,208 @@
+# catalogue.py
+#
+# One table of every indicator row in the data snapshot: the 16 sector workbooks followed
+# by matrix.xlsx. The workbooks spell their columns differently; here every row gets the
+# same fields (CATALOGUE_FIELDS), plus the sector's pillar and the facet values
+# (normalised unit, status and responsible institutions) used for filtering, and the
+# progress and status recomputed from the numbers by status_engine.py.
+# Built once per snapshot (sector_data.snapshot_version).
+
+import math
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from sector_config import SECTORS
+from status_engine import indicator_arrays, recompute, status_check, INCREASING, DECREASING
+from sector_data import (
+    get_sector_data, get_matrix_data, snapshot_version,
+    OUTCOME_COL, INDICATOR_COL, UNITS_COL, BASELINE_COL, TARGET_2024_COL, TARGET_MIDTERM_COL,
+    CURRENT_COL, PROGRESS_2024_COL, PROGRESS_MIDTERM_COL, STATUS_2024_COL, STATUS_MIDTERM_COL,
+    DRIVERS_COL, CHALLENGES_COL, CATCHUP_COL, RESPONSIBILITY_COLS, TARGET_2028_COLS,
+    MATRIX_PILLAR_COL, MATRIX_OUTCOME_COL, MATRIX_BASELINE_COL, MATRIX_TARGET_2024_COL,
+    MATRIX_TARGET_MIDTERM_COL, MATRIX_CURRENT_COL, MATRIX_PROGRESS_2024_COL,
+    MATRIX_PROGRESS_MIDTERM_COL, MATRIX_STATUS_2024_COL, MATRIX_STATUS_MIDTERM_COL,
+    MATRIX_DRIVERS_COL, MATRIX_CHALLENGES_COL, MATRIX_CATCHUP_COL
+)
+
+# Source key and label of the rows that come from matrix.xlsx
+MATRIX_SOURCE = 'matrix'
+MATRIX_SOURCE_LABEL = 'NST2 MATRIX'
+
+# Catalogue field -> column in the sector workbooks / in matrix.xlsx
+SECTOR_FIELD_COLUMNS = {
+    'outcome': OUTCOME_COL,
+    'indicator': INDICATOR_COL,
+    'units': UNITS_COL,
+    'baseline': BASELINE_COL,
+    'target_2024': TARGET_2024_COL,
+    'target_midterm': TARGET_MIDTERM_COL,
+    'current': CURRENT_COL,
+    'progress_2024': PROGRESS_2024_COL,
+    'progress_midterm': PROGRESS_MIDTERM_COL,
+    'status_2024': STATUS_2024_COL,
+    'status_midterm': STATUS_MIDTERM_COL,
+    'drivers': DRIVERS_COL,
+    'challenges': CHALLENGES_COL,
+    'catchup': CATCHUP_COL,
+}
+MATRIX_FIELD_COLUMNS = {
+    'outcome': MATRIX_OUTCOME_COL,
+    'indicator': INDICATOR_COL,
+    'units': UNITS_COL,
+    'baseline': MATRIX_BASELINE_COL,
+    'target_2024': MATRIX_TARGET_2024_COL,
+    'target_midterm': MATRIX_TARGET_MIDTERM_COL,
+    'current': MATRIX_CURRENT_COL,
+    'progress_2024': MATRIX_PROGRESS_2024_COL,
+    'progress_midterm': MATRIX_PROGRESS_MIDTERM_COL,
+    'status_2024': MATRIX_STATUS_2024_COL,
+    'status_midterm': MATRIX_STATUS_MIDTERM_COL,
+    'drivers': MATRIX_DRIVERS_COL,
+    'challenges': MATRIX_CHALLENGES_COL,
+    'catchup': MATRIX_CATCHUP_COL,
+}
+
+# Fields filled in from status_engine.recompute
+COMPUTED_FIELDS = [
+    'direction', 'computed_progress_2024', 'computed_progress_midterm',
+    'computed_status_2024', 'computed_status_midterm', 'status_check',
+]
+
+CATALOGUE_FIELDS = (
+    ['source', 'source_label', 'pillar', 'path'] + list(SECTOR_FIELD_COLUMNS) +
+    ['target_2028', 'responsibility', 'unit', 'institutions'] + COMPUTED_FIELDS
+)
+
+# Facet value for a row without a status / unit / responsible institution
+NOT_RATED = 'NOT RATED'
+UNSPECIFIED = 'Unspecified'
+
+# Unit spellings that all mean "percent" (after sector_data has replaced 'Percent')
+PERCENT_UNITS = {'%', '%age', 'percent', 'percentage'}
+# Placeholders used in the Units column when there is no unit
+EMPTY_UNITS = {'', "'", "''", '-'}
+
+INSTITUTION_SEPARATORS = re.compile(r'[,/&;\n]|\band\b')
+
+
+def clean_text(value):
+    """Cell as a single-line string ('' for empty cells)."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    return ' '.join(str(value).split())
+
+
+def json_value(value):
+    """Catalogue cell as a JSON value (NaN -> null, numpy scalars -> Python)."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if value is None or isinstance(value, (str, int, float, bool, list)):
+        return value
+    return str(value)
+
+
+def normalize_status(value):
+    return clean_text(value).upper() or NOT_RATED
+
+
+def normalize_unit(value):
+    unit = clean_text(value)
+    if unit in EMPTY_UNITS:
+        return UNSPECIFIED
+    if unit.lower() in PERCENT_UNITS:
+        return '%'
+    return unit
+
+
+def split_institutions(value):
+    """'MINEMA (Lead), RWB / RFA' -> ['MINEMA', 'RWB', 'RFA']."""
+    institutions = []
+    for part in INSTITUTION_SEPARATORS.split(clean_text(value).replace('(Lead)', '')):
+        name = part.strip(' .').upper()
+        if name and name not in institutions:
+            institutions.append(name)
+    return institutions or [UNSPECIFIED]
+
+
+def _rows(df, field_columns, responsibility_col, **fixed):
+    rows = []
+    for record in df.to_dict('records'):
+        row = dict(fixed)
+        for field, col in field_columns.items():
+            value = record.get(col)
+            row[field] = None if value is None or (not isinstance(value, str) and pd.isna(value)) else value
+        row['indicator'] = clean_text(row['indicator'])
+        if not row['indicator']:
+            continue
+        row['outcome'] = clean_text(row['outcome'])
+        row['pillar'] = clean_text(row.get('pillar')) or UNSPECIFIED
+        row['status_2024'] = normalize_status(row['status_2024'])
+        row['status_midterm'] = normalize_status(row['status_midterm'])
+        row['responsibility'] = clean_text(record.get(responsibility_col)) if responsibility_col else ''
+        row['unit'] = normalize_unit(row['units'])
+        row['institutions'] = split_institutions(row['responsibility'])
+        rows.append(row)
+    return rows
+
+
+def first_column(df, candidates):
+    """First of the candidate spellings of a column that df has (None if none)."""
+    return next((col for col in candidates if col in df.columns), None)
+
+
+def build_catalogue():
+    rows = []
+    for sector in SECTORS:
+        df = get_sector_data(sector['key'])['df']
+        responsibility_col = first_column(df, RESPONSIBILITY_COLS)
+        rows.extend(_rows(
+            df, dict(SECTOR_FIELD_COLUMNS, target_2028=first_column(df, TARGET_2028_COLS)), responsibility_col,
+            source=sector['key'], source_label=sector['label'], pillar=sector['pillar'],
+            path=sector['path']
+        ))
+
+    df = get_matrix_data()['df']
+    responsibility_col = first_column(df, RESPONSIBILITY_COLS)
+    rows.extend(_rows(
+        df, dict(MATRIX_FIELD_COLUMNS, pillar=MATRIX_PILLAR_COL, target_2028=first_column(df, TARGET_2028_COLS)),
+        responsibility_col,
+        source=MATRIX_SOURCE, source_label=MATRIX_SOURCE_LABEL, path='/'
+    ))
+
+    catalogue = pd.DataFrame(rows, columns=CATALOGUE_FIELDS)
+    add_computed_statuses(catalogue)
+    return catalogue
+
+
+def add_computed_statuses(catalogue):
+    """Fill COMPUTED_FIELDS: progress and status recomputed from the numbers, and whether
+    they agree with the reported status."""
+    computed = recompute(indicator_arrays(catalogue), not_rated=NOT_RATED)
+    catalogue['direction'] = np.where(computed['decreasing'], DECREASING, INCREASING)
+    for period in ['2024', 'midterm']:
+        catalogue[f'computed_progress_{period}'] = computed[f'progress_{period}']
+        catalogue[f'computed_status_{period}'] = computed[f'status_{period}']
+    catalogue['status_check'] = status_check(
+        [catalogue['status_2024'].to_numpy(), catalogue['status_midterm'].to_numpy()],
+        [computed['status_2024'], computed['status_midterm']],
+        NOT_RATED
+    )
+
+
+_catalogue_lock = threading.Lock()
+_current_catalogue = {'version': None, 'catalogue': None}
+
+
+def get_catalogue():
+    """(version, catalogue DataFrame) for the current data snapshot, built on first use."""
+    version = snapshot_version()
+    with _catalogue_lock:
+        if _current_catalogue['version'] != version:
+            _current_catalogue['catalogue'] = build_catalogue()
+            _current_catalogue['version'] = version
+        return version, _current_catalogue['catalogue']
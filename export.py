@@ -0,0 +1,247 @@
+# export.py
+#
+# Download routes for filtered indicator sets, e.g. the LOW-status indicators of one
+# pillar, and for the change report between two data releases:
+#
+#   /export/indicators.csv?pillar=SOCIAL+TRANSFORMATIONAL&status_2024=LOW
+#   /export/indicators.xlsx?sector=ICT&filter={progress_2024} < 50&sort=-progress_2024
+#   /export/changes.csv?base=<snapshot>&change=Status+changed
+#
+# The indicators query parameters are the explorer's filters: one repeatable parameter
+# per facet (facet_index.FACETS, OR-ed within a facet), 'filter' in DataTable
+# filter_query syntax and repeatable 'sort' fields ('-' prefix for descending). Rows are
+# selected on the bitmap / table indexes and written CHUNK_ROWS at a time: the CSV is
+# streamed from a generator, the XLSX is written by openpyxl in write-only mode to a
+# temporary file and streamed from disk. Both carry an ETag of (data snapshot, query),
+# so a repeated download of an unchanged extract is answered with 304 Not Modified.
+#
+# changes downloads the change report between two recorded snapshots (snapshot_diff.py):
+# 'base', optional 'target' (default: the loaded data) and repeatable 'change' types
+# (every type without the parameter; an empty 'change=' selects none).
+
+import csv
+import hashlib
+import io
+import os
+import tempfile
+from urllib.parse import urlencode
+
+from flask import Response, abort, request
+from openpyxl import Workbook
+
+from catalogue import get_catalogue
+from facet_index import FACETS, get_facet_index, filter_bitmap, matching_rows
+from snapshot_diff import (
+    CHANGE_TYPES, DISPLAY_COLUMNS, list_snapshots, get_diff, filter_report, display_records
+)
+from table_query import TABLE_COLUMNS, get_table_index, filter_mask, sort_rows, display_value
+
+EXPORT_PATH = '/export/indicators'
+CHANGES_PATH = '/export/changes'
+
+# Exported columns: the explorer table columns plus the narrative ones
+EXPORT_COLUMNS = [(field, header) for field, header, _ in TABLE_COLUMNS] + [
+    ('drivers', 'Major drivers of performance'),
+    ('challenges', 'Challenges'),
+    ('catchup', 'Catch up plans'),
+]
+
+# Rows converted and written per step
+CHUNK_ROWS = 200
+# Bytes per chunk when streaming the XLSX file
+FILE_CHUNK_BYTES = 64 * 1024
+
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+# --- Query ---
+def export_query(args):
+    """(facet selections, filter_query, sort_by) from request args."""
+    selections = {facet: args.getlist(facet) for facet in FACETS}
+    filter_query = args.get('filter', '')
+    sort_by = [
+        {'column_id': field.lstrip('-'), 'direction': 'desc' if field.startswith('-') else 'asc'}
+        for field in args.getlist('sort') if field.lstrip('-')
+    ]
+    return selections, filter_query, sort_by
+
+
+def export_url(fmt, selections, filter_query='', sort_by=None):
+    """Download URL of the rows shown by the explorer (fmt: 'csv' or 'xlsx')."""
+    params = [(facet, value) for facet, values in selections.items() for value in values or []]
+    if filter_query:
+        params.append(('filter', filter_query))
+    for sort in sort_by or []:
+        prefix = '-' if sort.get('direction') == 'desc' else ''
+        params.append(('sort', prefix + sort['column_id']))
+    return f"{EXPORT_PATH}.{fmt}" + (f"?{urlencode(params)}" if params else '')
+
+
+def changes_url(fmt, base, target=None, changes=None):
+    """Download URL of the change report from snapshot base to target."""
+    params = [('base', base)] + ([('target', target)] if target else [])
+    params += [('change', change) for change in changes or []]
+    if changes is not None and not changes:
+        # Every change type unchecked: an empty report, not the default of all types
+        params.append(('change', ''))
+    return f"{CHANGES_PATH}.{fmt}?{urlencode(params)}"
+
+
+def export_rows(catalogue, selections, filter_query, sort_by):
+    """Selected catalogue row positions, in export order."""
+    _, index = get_facet_index()
+    _, table_index = get_table_index()
+    rows = matching_rows(index, filter_bitmap(index, selections))
+    rows = rows[filter_mask(table_index['columns'], index['rows'], filter_query)[rows]]
+    return sort_rows(table_index['columns'], rows, sort_by)
+
+
+def export_etag(version, fmt, selections, filter_query, sort_by):
+    query = export_url(fmt, selections, filter_query, sort_by)
+    return hashlib.sha1(f"{version}|{query}".encode('utf-8')).hexdigest()[:20]
+
+
+def row_chunks(catalogue, rows):
+    """Export rows as lists of display values, CHUNK_ROWS at a time."""
+    fields = [field for field, _ in EXPORT_COLUMNS]
+    for start in range(0, len(rows), CHUNK_ROWS):
+        chunk = catalogue.iloc[rows[start:start + CHUNK_ROWS]][fields]
+        yield [
+            [display_value(field, value) for field, value in zip(fields, record)]
+            for record in chunk.itertuples(index=False, name=None)
+        ]
+
+
+# --- Writers ---
+# Both take the column headers and an iterable of row chunks (lists of rows)
+def csv_stream(headers, chunks):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM so that Excel opens the file as UTF-8
+    writer.writerow(headers)
+    yield '\ufeff' + buffer.getvalue()
+    for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+
+
+def write_xlsx(headers, chunks, sheet_title='Indicators'):
+    """Write the rows to a temporary .xlsx file and return its path."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_title)
+    sheet.append(headers)
+    for chunk in chunks:
+        for row in chunk:
+            sheet.append(row)
+    handle, path = tempfile.mkstemp(suffix='.xlsx', prefix='nst2-export-')
+    os.close(handle)
+    workbook.save(path)
+    return path
+
+
+def file_stream(path):
+    """Yield the file in FILE_CHUNK_BYTES pieces."""
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(FILE_CHUNK_BYTES)
+            if not data:
+                break
+            yield data
+
+
+def remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# --- Routes ---
+def export_response(fmt):
+    selections, filter_query, sort_by = export_query(request.args)
+    version, catalogue = get_catalogue()
+    etag = export_etag(version, fmt, selections, filter_query, sort_by)
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    rows = export_rows(catalogue, selections, filter_query, sort_by)
+
+    headers = [header for _, header in EXPORT_COLUMNS]
+    return download_response(fmt, headers, row_chunks(catalogue, rows), len(rows), etag, 'nst2-indicators')
+
+
+def indicators_xlsx(selections, filter_query='', sort_by=None, set_progress=None):
+    """Write the selected indicators to a temporary .xlsx file and return its path.
+
+    set_progress(rows written, total rows) is called after every chunk; it is the
+    explorer's background job reporting to the progress bar.
+    """
+    _, catalogue = get_catalogue()
+    rows = export_rows(catalogue, selections, filter_query, sort_by)
+
+    def chunks():
+        done = 0
+        for chunk in row_chunks(catalogue, rows):
+            yield chunk
+            done += len(chunk)
+            if set_progress is not None:
+                set_progress(done, len(rows))
+
+    return write_xlsx([header for _, header in EXPORT_COLUMNS], chunks())
+
+
+def download_response(fmt, headers, chunks, row_count, etag, name, sheet_title='Indicators'):
+    """CSV or XLSX attachment of the row chunks."""
+    if fmt == 'csv':
+        response = Response(csv_stream(headers, chunks), mimetype='text/csv')
+    else:
+        path = write_xlsx(headers, chunks, sheet_title)
+        response = Response(file_stream(path), mimetype=XLSX_MIMETYPE)
+        response.content_length = os.path.getsize(path)
+        # On close rather than at the end of the stream: HEAD requests and clients that
+        # disconnect early never start it
+        response.call_on_close(lambda: remove_file(path))
+    response.headers['Content-Disposition'] = f'attachment; filename="{name}.{fmt}"'
+    response.headers['X-Row-Count'] = str(row_count)
+    response.set_etag(etag)
+    return response
+
+
+def change_chunks(report):
+    fields = [field for field, _ in DISPLAY_COLUMNS]
+    for start in range(0, len(report), CHUNK_ROWS):
+        yield [[record[field] for field in fields] for record in display_records(report.iloc[start:start + CHUNK_ROWS])]
+
+
+def changes_response(fmt):
+    base = request.args.get('base', '')
+    target = request.args.get('target') or None
+    changes = None
+    if 'change' in request.args:
+        changes = [change for change in request.args.getlist('change') if change in CHANGE_TYPES]
+    snapshots = list_snapshots()
+    if base not in snapshots or (target is not None and target not in snapshots):
+        abort(404)
+    version, _ = get_catalogue()
+    etag = hashlib.sha1(f"{version}|{changes_url(fmt, base, target, changes)}".encode('utf-8')).hexdigest()[:20]
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    report = filter_report(get_diff(base, target), changes)
+    headers = [header for _, header in DISPLAY_COLUMNS]
+    return download_response(fmt, headers, change_chunks(report), len(report), etag, 'nst2-changes', 'Changes')
+
+
+def register_export_routes(server):
+    """Add the CSV and XLSX download routes to the Flask server."""
+    server.add_url_rule(f"{EXPORT_PATH}.csv", 'export_indicators_csv', lambda: export_response('csv'))
+    server.add_url_rule(f"{EXPORT_PATH}.xlsx", 'export_indicators_xlsx', lambda: export_response('xlsx'))
+    server.add_url_rule(f"{CHANGES_PATH}.csv", 'export_changes_csv', lambda: changes_response('csv'))
+    server.add_url_rule(f"{CHANGES_PATH}.xlsx", 'export_changes_xlsx', lambda: changes_response('xlsx'))
+    return server
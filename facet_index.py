@@ -0,0 +1,135 @@
+# facet_index.py
+#
+# Bitmap indexes for filtering the indicator catalogue (catalogue.py) by several facets
+# at once. For every facet value there is one bitmap with a bit per catalogue row, packed
+# into uint64 words. Selected values of one facet are OR-ed, facets are AND-ed, and the
+# live count of every facet value is a popcount of (value bitmap AND filter). No
+# DataFrame is scanned after the index has been built, once per data snapshot.
+
+import threading
+
+import numpy as np
+
+from catalogue import get_catalogue, NOT_RATED, UNSPECIFIED
+from sector_config import SECTORS
+from status_cube import STATUS_CATEGORIES
+
+# Facet key -> (label, catalogue field). 'institutions' holds a list per row, so a row
+# can be set in several of its value bitmaps.
+FACETS = {
+    'pillar': ('Pillar', 'pillar'),
+    'sector': ('Sector', 'source_label'),
+    'status_2024': ('Status (2024/25)', 'status_2024'),
+    'status_midterm': ('Status (Midterm)', 'status_midterm'),
+    'unit': ('Unit', 'unit'),
+    'institution': ('Responsible institution', 'institutions'),
+    'status_check': ('Status check', 'status_check'),
+}
+
+# Number of set bits in every byte value
+POPCOUNT_TABLE = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint16)
+
+
+def pack_rows(mask):
+    """Bool array (rows,) or (values, rows) -> uint64 bitmap words (..., words)."""
+    mask = np.atleast_2d(mask)
+    n_rows = mask.shape[1]
+    padded = np.zeros((mask.shape[0], -(-n_rows // 64) * 64), dtype=bool)
+    padded[:, :n_rows] = mask
+    return np.packbits(padded, axis=1, bitorder='little').view(np.uint64)
+
+
+def popcount(bitmaps):
+    """Set bits per bitmap (last axis = words)."""
+    return POPCOUNT_TABLE[bitmaps.view(np.uint8)].sum(axis=-1)
+
+
+def facet_value_order(facet, values):
+    """Display order of a facet's values: configured order where there is one."""
+    if facet == 'sector':
+        order = [sector['label'] for sector in SECTORS]
+    elif facet in ('status_2024', 'status_midterm'):
+        order = STATUS_CATEGORIES + [NOT_RATED]
+    else:
+        order = []
+    known = [value for value in order if value in values]
+    rest = sorted((value for value in values if value not in order),
+                  key=lambda value: (value == UNSPECIFIED, str(value).lower()))
+    return known + rest
+
+
+def build_facet_index(catalogue):
+    """{'rows': n, 'all': bitmap, 'facets': {facet: {'values': [...], 'bitmaps': (values, words)}}}."""
+    n_rows = len(catalogue)
+    facets = {}
+    for facet, (_, field) in FACETS.items():
+        column = catalogue[field].tolist()
+        multi = bool(column) and isinstance(column[0], list)
+        row_values = column if multi else [[value] for value in column]
+        values = facet_value_order(facet, {value for row in row_values for value in row})
+        position = {value: v for v, value in enumerate(values)}
+        mask = np.zeros((len(values), n_rows), dtype=bool)
+        for row, row_value in enumerate(row_values):
+            for value in row_value:
+                mask[position[value], row] = True
+        facets[facet] = {'values': values, 'position': position, 'bitmaps': pack_rows(mask)}
+
+    return {
+        'rows': n_rows,
+        'all': pack_rows(np.ones(n_rows, dtype=bool))[0],
+        'facets': facets,
+    }
+
+
+def facet_filter(index, facet, selected):
+    """Bitmap of the rows having any of the selected values of facet (all rows if none)."""
+    if not selected:
+        return index['all']
+    entry = index['facets'][facet]
+    rows = [entry['position'][value] for value in selected if value in entry['position']]
+    if not rows:
+        return np.zeros_like(index['all'])
+    return np.bitwise_or.reduce(entry['bitmaps'][rows], axis=0)
+
+
+def filter_bitmap(index, selections, exclude=None):
+    """AND of the facet filters in selections ({facet: [values]}), skipping facet exclude."""
+    bitmap = index['all']
+    for facet, selected in selections.items():
+        if facet != exclude and selected:
+            bitmap = bitmap & facet_filter(index, facet, selected)
+    return bitmap
+
+
+def facet_counts(index, selections):
+    """{facet: {value: count}} of the rows matching the other facets' selections.
+
+    Counting each facet without its own selection keeps the counts of its other values
+    visible, so the user can see what adding a value to the selection would give.
+    """
+    counts = {}
+    for facet, entry in index['facets'].items():
+        others = filter_bitmap(index, selections, exclude=facet)
+        value_counts = popcount(entry['bitmaps'] & others)
+        counts[facet] = dict(zip(entry['values'], value_counts.tolist()))
+    return counts
+
+
+def matching_rows(index, bitmap):
+    """Catalogue row positions whose bit is set in bitmap."""
+    bits = np.unpackbits(bitmap.view(np.uint8), bitorder='little')[:index['rows']]
+    return np.flatnonzero(bits)
+
+
+_index_lock = threading.Lock()
+_current_index = {'version': None, 'index': None}
+
+
+def get_facet_index():
+    """(version, facet index) for the current data snapshot, built on first use."""
+    version, catalogue = get_catalogue()
+    with _index_lock:
+        if _current_index['version'] != version:
+            _current_index['index'] = build_facet_index(catalogue)
+            _current_index['version'] = version
+        return version, _current_index['index']
@@ -0,0 +1,36 @@
+# figure_cache.py
+#
+# Process-wide cache of Plotly figures. A figure is built once per data version and kept
+# as its serialised JSON (plus the parsed dict), so layouts and callbacks hand Dash a plain
+# dict instead of constructing and validating go.Figure objects again on every request.
+
+import json
+
+import plotly.io as pio
+
+_FIGURE_CACHE = {}
+
+
+def cached_figure(key, version, build):
+    """Return the figure dict for key, calling build() only when version has changed.
+
+    key identifies the figure (e.g. ('sector-pie', 'ict', '2024/25')), version identifies
+    the data it was built from, and build is a zero-argument callable returning a Figure.
+    The returned dict is shared between callers and must not be modified.
+    """
+    entry = _FIGURE_CACHE.get(key)
+    if entry is None or entry['version'] != version:
+        figure_json = pio.to_json(build(), validate=False)
+        entry = {'version': version, 'json': figure_json, 'figure': json.loads(figure_json)}
+        _FIGURE_CACHE[key] = entry
+    return entry['figure']
+
+
+def cached_figure_json(key):
+    """Serialised JSON of a cached figure, or None if it has not been built yet."""
+    entry = _FIGURE_CACHE.get(key)
+    return entry['json'] if entry else None
+
+
+def clear_figure_cache():
+    _FIGURE_CACHE.clear()
@@ -0,0 +1,85 @@
+# figures.py
+#
+# Shared look for every dashboard figure. The 'nst2' Plotly template is registered once
+# when this module is imported and holds the layout settings (fonts, margins, transparent
+# background, centred titles, pie defaults) that figures used to repeat inline. Figures
+# built here reference the template by name instead of the ~6.6 kB default 'plotly'
+# template that go.Figure embeds otherwise.
+#
+# plotly.js has no registry of named templates, so the compact template still travels
+# inside each figure's JSON, but it is a few hundred bytes and identical everywhere.
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+TEMPLATE_NAME = 'nst2'
+
+# Status colours shared by the status table, pies and bars
+STATUS_COLORS = {
+    'COMPLETED': '#28a745',  # Green
+    'GOOD': '#007bff',       # Blue
+    'SATISFACTORY': '#ffc107', # Yellow
+    'LOW': '#dc3545'         # Red
+}
+
+pio.templates[TEMPLATE_NAME] = go.layout.Template(
+    layout=dict(
+        font=dict(color='#333'),
+        title=dict(x=0.5, xanchor='center', font=dict(size=16)),
+        margin=dict(t=50, b=20, l=20, r=20),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        colorway=list(STATUS_COLORS.values()),
+    ),
+    data=dict(
+        pie=[go.Pie(hole=0.3, textinfo='percent')],
+    ),
+)
+
+# Sector page status pies (also the what-if pies): status_pie layout keywords
+SECTOR_PIE_LAYOUT = dict(
+    height=300,
+    margin=dict(t=50, b=0, l=20, r=20),
+    legend=dict(orientation='v', yanchor='bottom', y=0.5, xanchor='center', x=1),
+    uniformtext=dict(minsize=12, mode='hide'),
+)
+
+
+def make_figure(traces, title=None, **layout):
+    """go.Figure using the shared template; layout keywords are per-figure overrides only."""
+    if title is not None:
+        layout['title_text'] = title
+    return go.Figure(data=traces, layout=go.Layout(template=TEMPLATE_NAME, **layout))
+
+
+def status_pie(counts, title, colors=None, drop_zero=False, text_orientation=None, **layout):
+    """Donut of status counts ({status: count}).
+
+    colors is either a {status: colour} mapping or a list of colours in counts order;
+    it defaults to STATUS_COLORS. With drop_zero, statuses without indicators are left out.
+    text_orientation is the pie's insidetextorientation (plotly's 'auto' by default).
+    """
+    colors = STATUS_COLORS if colors is None else colors
+    if isinstance(colors, dict):
+        colors = [colors.get(status) for status in counts]
+    labels, values, marker_colors = [], [], []
+    for (status, count), color in zip(counts.items(), colors):
+        if drop_zero and not count:
+            continue
+        labels.append(status)
+        values.append(count)
+        marker_colors.append(color)
+    pie = go.Pie(labels=labels, values=values, marker_colors=marker_colors)
+    if text_orientation is not None:
+        pie.insidetextorientation = text_orientation
+    return make_figure([pie], title=title, **layout)
+
+
+def sparkline(labels, values, title=None, height=160, **layout):
+    """Small line chart of one indicator's values across data releases (labels on x)."""
+    trace = go.Scatter(x=labels, y=values, mode='lines+markers', line=dict(color='#007bff', width=2),
+                       marker=dict(size=6), hovertemplate='%{x}: %{y}<extra></extra>')
+    return make_figure([trace], title=title, height=height, showlegend=False,
+                       margin=dict(t=30 if title else 10, b=30, l=40, r=10),
+                       xaxis=dict(type='category', showgrid=False),
+                       yaxis=dict(showgrid=True, gridcolor='#eee', zeroline=False), **layout)
@@ -0,0 +1,38 @@
+# file_lock.py
+#
+# Exclusive lock shared by the processes of one machine, e.g. the gunicorn workers that
+# all record the loaded data at start-up. It guards the check-then-write of the
+# append-only stores under DATA_DIR (snapshot_diff.record_snapshot, history.record_history)
+# so that one worker records a data release and the others find it recorded.
+#
+# The lock is taken on an open lock file (flock, or msvcrt.locking on Windows), so the
+# operating system releases it when the block ends or the process dies.
+
+import contextlib
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextlib.contextmanager
+def exclusive_lock(path):
+    """Hold an exclusive lock on the file at path (created if missing) for the block."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
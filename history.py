@@ -0,0 +1,265 @@
+# history.py
+#
+# Append-only history of indicator values across data releases, for trends such as the
+# sparklines on the sector pages. The workbooks only hold the latest figures; every data
+# snapshot the app loads is added here (record_history, called at start-up).
+#
+# Layout, partitioned by reporting period (fiscal year July-June, by quarter):
+#
+#   history/<period>/<seq>-<snapshot version>.npz     e.g. history/2025-26-Q2/000003-3f2a...npz
+#
+# One file per ingested snapshot, written once and never changed. Every gunicorn worker
+# calls record_history; the sequence number is taken and the file written under a lock
+# file (file_lock.py), so one worker appends a release and the others find it recorded. Each file holds numpy
+# arrays (np.savez_compressed, no pickles), one column at a time:
+#   recorded, period          - ingestion time (UTC, ISO) and reporting period
+#   new_keys                  - indicator keys first seen in this snapshot; the key
+#                               dictionary is new_keys of all files in seq order
+#   added, removed            - ids of keys that appear / disappear in this snapshot
+#   <field>.ids, <field>.values for each HISTORY_FIELDS
+#                             - delta encoding: only the cells whose value differs from
+#                               the previous snapshot; an unchanged value is not stored again
+#
+# load_history replays the files into one (snapshot x key) matrix per field, cached until
+# a file is added, so a per-indicator time series is a column slice.
+
+import datetime
+import os
+import re
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+from catalogue import get_catalogue
+from file_lock import exclusive_lock
+from sector_data import DATA_DIR
+from snapshot_diff import KEY_FIELDS, normalized_names
+from status_engine import numeric
+
+HISTORY_DIR = os.path.join(DATA_DIR, 'history')
+PERIOD_NAME = re.compile(r'^\d{4}-\d{2}-Q[1-4]$')
+RECORD_NAME = re.compile(r'^(\d{6})-([0-9a-f]+)\.npz$')
+LOCK_PATH = os.path.join(HISTORY_DIR, '.lock')
+
+# Numeric fields (float64, NaN when empty) and text fields ('' when empty) kept per snapshot
+NUMBER_FIELDS = ['baseline', 'target_2024', 'target_midterm', 'target_2028', 'current']
+TEXT_FIELDS = ['status_2024', 'status_midterm']
+HISTORY_FIELDS = NUMBER_FIELDS + TEXT_FIELDS
+
+# First month of the fiscal year
+FISCAL_YEAR_START = 7
+
+
+def reporting_period(when=None):
+    """Fiscal quarter of a date (default: now), e.g. '2025-26-Q2' for October 2025."""
+    when = when or datetime.datetime.now(datetime.timezone.utc)
+    start_year = when.year if when.month >= FISCAL_YEAR_START else when.year - 1
+    quarter = (when.month - FISCAL_YEAR_START) % 12 // 3 + 1
+    return f"{start_year}-{(start_year + 1) % 100:02d}-Q{quarter}"
+
+
+def period_label(period):
+    """'2025-26-Q2' -> '2025/26 Q2'."""
+    return f"{period[:4]}/{period[5:7]} {period[8:]}"
+
+
+def history_keys(snapshot):
+    """Key string of every row: source, outcome and indicator ignoring case and spacing,
+    and the occurrence of that triple (the key snapshot_diff joins on)."""
+    parts = [snapshot['source'].astype(str).to_numpy()]
+    for field in KEY_FIELDS[1:]:
+        codes, names = normalized_names(snapshot[field])
+        parts.append(names[codes])
+    base = pd.Series(['\x1f'.join(values) for values in zip(*parts)], index=snapshot.index)
+    occurrence = base.groupby(base, sort=False).cumcount().astype(str)
+    return (base + '\x1f' + occurrence).to_numpy()
+
+
+def field_arrays(snapshot):
+    arrays = {field: numeric(snapshot[field]) for field in NUMBER_FIELDS}
+    for field in TEXT_FIELDS:
+        arrays[field] = snapshot[field].fillna('').astype(str).to_numpy(dtype=str)
+    return arrays
+
+
+def empty_values(field, shape):
+    if field in NUMBER_FIELDS:
+        return np.full(shape, np.nan)
+    return np.full(shape, '', dtype=object)
+
+
+def changed_values(field, old, new):
+    if field in NUMBER_FIELDS:
+        return ~((old == new) | (np.isnan(old) & np.isnan(new)))
+    return old != new
+
+
+# --- Files ---
+def list_records():
+    """[(seq, period, version, path)] of every history file, in seq order."""
+    records = []
+    if not os.path.isdir(HISTORY_DIR):
+        return records
+    for period in os.listdir(HISTORY_DIR):
+        folder = os.path.join(HISTORY_DIR, period)
+        if not PERIOD_NAME.match(period) or not os.path.isdir(folder):
+            continue
+        for name in os.listdir(folder):
+            match = RECORD_NAME.match(name)
+            if match:
+                records.append((int(match.group(1)), period, match.group(2), os.path.join(folder, name)))
+    return sorted(records)
+
+
+def replay(records):
+    """Rebuild the history from the files: {'snapshots': [{'seq', 'period', 'version',
+    'recorded'}], 'keys': [key], 'key_ids': {key: id}, 'by_indicator': {(source,
+    indicator): [(outcome, occurrence, id)]}, 'present': bool (snapshot, key), 'values':
+    {field: (snapshot, key) array}}."""
+    files = []
+    for _, _, _, path in records:
+        with np.load(path, allow_pickle=False) as data:
+            files.append({name: data[name] for name in data.files})
+    keys = [key for data in files for key in data['new_keys'].tolist()]
+    shape = (len(files), len(keys))
+    present = np.zeros(shape, dtype=bool)
+    values = {field: empty_values(field, shape) for field in HISTORY_FIELDS}
+    snapshots = []
+    for row, ((seq, period, version, _), data) in enumerate(zip(records, files)):
+        if row:
+            present[row] = present[row - 1]
+            for field in HISTORY_FIELDS:
+                values[field][row] = values[field][row - 1]
+        present[row, data['added']] = True
+        present[row, data['removed']] = False
+        for field in HISTORY_FIELDS:
+            values[field][row, data[f'{field}.ids']] = data[f'{field}.values']
+        snapshots.append({'seq': seq, 'period': period, 'version': version, 'recorded': str(data['recorded'])})
+    by_indicator = {}
+    for key_id, key in enumerate(keys):
+        source, outcome, indicator, occurrence = key.split('\x1f')
+        by_indicator.setdefault((source, indicator), []).append((outcome, int(occurrence), key_id))
+    return {
+        'snapshots': snapshots,
+        'keys': keys,
+        'key_ids': {key: key_id for key_id, key in enumerate(keys)},
+        'by_indicator': by_indicator,
+        'present': present,
+        'values': values,
+    }
+
+
+_lock = threading.Lock()
+_current_history = {'records': None, 'history': None}
+
+
+def load_history():
+    """replay() of the history files, rebuilt only when a file has been added."""
+    records = list_records()
+    with _lock:
+        if _current_history['records'] != records:
+            _current_history['history'] = replay(records)
+            _current_history['records'] = records
+        return _current_history['history']
+
+
+def history_columns(history, catalogue, period):
+    """Arrays of the history file of catalogue, given the history recorded so far."""
+    keys = history_keys(catalogue)
+    known = history['key_ids']
+    new_keys = [key for key in keys if key not in known]
+    ids = np.array([known.get(key, -1) for key in keys], dtype=np.int64)
+    ids[ids < 0] = np.arange(len(history['keys']), len(history['keys']) + len(new_keys))
+
+    # State after the last snapshot, widened to the keys first seen now
+    n_keys = len(history['keys']) + len(new_keys)
+    previous_present = np.zeros(n_keys, dtype=bool)
+    if history['snapshots']:
+        previous_present[:len(history['keys'])] = history['present'][-1]
+    present = np.zeros(n_keys, dtype=bool)
+    present[ids] = True
+
+    columns = {
+        'recorded': np.array(datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')),
+        'period': np.array(period),
+        'new_keys': np.array(new_keys, dtype=str),
+        'added': np.flatnonzero(present & ~previous_present),
+        'removed': np.flatnonzero(previous_present & ~present),
+    }
+    for field, current in field_arrays(catalogue).items():
+        previous = empty_values(field, n_keys)
+        if history['snapshots']:
+            previous[:len(history['keys'])] = history['values'][field][-1]
+        changed = changed_values(field, previous[ids], current)
+        columns[f'{field}.ids'] = ids[changed]
+        columns[f'{field}.values'] = current[changed]
+    return columns
+
+
+def record_history(period=None):
+    """Append the loaded data snapshot to the history unless it is already recorded.
+
+    period defaults to the reporting period of the current date. Returns the file path.
+    """
+    period = period or reporting_period()
+    if not PERIOD_NAME.match(period):
+        raise ValueError(f"Invalid reporting period {period!r}; expected e.g. '2025-26-Q2'")
+    version, catalogue = get_catalogue()
+    with exclusive_lock(LOCK_PATH):
+        records = list_records()
+        for _, _, recorded_version, path in records:
+            if recorded_version == version:
+                return path
+        columns = history_columns(load_history(), catalogue, period)
+
+        seq = records[-1][0] + 1 if records else 1
+        folder = os.path.join(HISTORY_DIR, period)
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"{seq:06d}-{version}.npz")
+        handle, tmp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                np.savez_compressed(f, **columns)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    return path
+
+
+# --- Reads ---
+def normalized_name(name):
+    _, (normalized,) = normalized_names(pd.Series([name]))
+    return normalized
+
+
+def indicator_key(history, source, indicator, outcome=None):
+    """Key id of an indicator (its first occurrence; under any outcome unless given), or
+    None."""
+    candidates = history['by_indicator'].get((source, normalized_name(indicator)), [])
+    if outcome is not None:
+        outcome = normalized_name(outcome)
+        candidates = [candidate for candidate in candidates if candidate[0] == outcome]
+    return min(candidates, key=lambda candidate: candidate[1])[2] if candidates else None
+
+
+def indicator_series(source, indicator, outcome=None, fields=('current',)):
+    """Time series of one indicator over the recorded snapshots in which it appears:
+    {'snapshots': [snapshot dicts], field: [values]}; None when it was never recorded."""
+    history = load_history()
+    key_id = indicator_key(history, source, indicator, outcome)
+    if key_id is None:
+        return None
+    rows = np.flatnonzero(history['present'][:, key_id])
+    series = {'snapshots': [history['snapshots'][row] for row in rows]}
+    for field in fields:
+        series[field] = history['values'][field][rows, key_id].tolist()
+    return series
+
+
+if __name__ == '__main__':
+    # python history.py [period]: append the loaded data to the history
+    import sys
+    print(record_history(sys.argv[1] if len(sys.argv) > 1 else None))
@@ -0,0 +1,105 @@
+# leaderboard.py
+#
+# Most-behind and most-ahead indicators, nationally and per pillar, by progress towards the
+# 2024/25 or 2026/27 target as recomputed by status_engine (direction-aware: a decreasing
+# indicator such as a mortality rate progresses by going down). Progress outside 0-100%
+# (a target exceeded, or typing errors in the workbooks) is capped to that range for the
+# ranking and flagged, so that outliers do not fill the boards. Covers the rows of the 16
+# sector workbooks; matrix.xlsx repeats many of them and is left out.
+#
+# Once per data snapshot the progress of every scope (all sectors, each pillar) is laid
+# out as one contiguous float array without the rows that have no progress. A leaderboard
+# is then numpy.argpartition over that array (O(n)) plus a sort of the k rows picked,
+# instead of sorting every indicator on each request.
+
+import threading
+
+import numpy as np
+
+from catalogue import get_catalogue, MATRIX_SOURCE
+from status_engine import numeric
+
+PROGRESS_FIELDS = {'2024/25': 'computed_progress_2024', 'midterm': 'computed_progress_midterm'}
+NATIONAL = 'all'
+BEHIND = 'behind'
+AHEAD = 'ahead'
+
+# Shifts capped progress below (ahead) / above (behind) equal uncapped progress
+CAPPED_TIE_BREAK = 1e-9
+
+# Catalogue fields returned for each leaderboard entry
+ENTRY_FIELDS = ['indicator', 'source', 'source_label', 'pillar', 'outcome', 'path']
+
+
+def build_leaderboards(catalogue):
+    """{'fields': {field: array over the sector rows} for ENTRY_FIELDS, 'progress':
+    {period: uncapped progress over the sector rows}, 'scopes': {(scope, period): (capped
+    progress array, positions into the sector rows)}}, scope being NATIONAL or a pillar."""
+    rows = np.flatnonzero(catalogue['source'].to_numpy() != MATRIX_SOURCE)
+    pillars = catalogue['pillar'].to_numpy()[rows]
+    scopes = {}
+    uncapped = {}
+    for period, field in PROGRESS_FIELDS.items():
+        uncapped[period] = numeric(catalogue[field].to_numpy()[rows])
+        progress = np.clip(uncapped[period], 0, 1)
+        rated = np.isfinite(progress)
+        scopes[(NATIONAL, period)] = (progress[rated], np.flatnonzero(rated))
+        for pillar in np.unique(pillars):
+            members = np.flatnonzero(rated & (pillars == pillar))
+            scopes[(pillar, period)] = (progress[members], members)
+    fields = {field: catalogue[field].to_numpy()[rows] for field in ENTRY_FIELDS}
+    return {'fields': fields, 'progress': uncapped, 'scopes': scopes}
+
+
+_lock = threading.Lock()
+_current_leaderboards = {'version': None, 'leaderboards': None}
+
+
+def get_leaderboards():
+    """(version, build_leaderboards() result) for the current data snapshot."""
+    version, catalogue = get_catalogue()
+    with _lock:
+        if _current_leaderboards['version'] != version:
+            _current_leaderboards['leaderboards'] = build_leaderboards(catalogue)
+            _current_leaderboards['version'] = version
+        return version, _current_leaderboards['leaderboards']
+
+
+def top_k(values, k, largest=False):
+    """Positions of the k smallest (largest) values, in order."""
+    k = min(k, len(values))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    keys = -values if largest else values
+    if k < len(keys):
+        picked = np.argpartition(keys, k - 1)[:k]
+    else:
+        picked = np.arange(len(keys))
+    return picked[np.argsort(keys[picked], kind='stable')]
+
+
+def scopes():
+    """Pillars with rated indicators, NATIONAL first."""
+    _, leaderboards = get_leaderboards()
+    pillars = sorted({scope for scope, _ in leaderboards['scopes']} - {NATIONAL})
+    return [NATIONAL] + pillars
+
+
+def leaderboard(scope=NATIONAL, period='2024/25', k=10, direction=BEHIND):
+    """The k most-behind (lowest progress) or most-ahead indicators of a scope, as
+    dicts of ENTRY_FIELDS plus 'progress' (fraction of the target, capped to 0-1),
+    'uncapped' (the computed fraction) and 'capped' (whether they differ)."""
+    if period not in PROGRESS_FIELDS:
+        raise ValueError(f"Unknown period {period!r}; expected one of {list(PROGRESS_FIELDS)}")
+    _, leaderboards = get_leaderboards()
+    progress, members = leaderboards['scopes'].get((scope, period), (np.empty(0), np.empty(0, dtype=np.int64)))
+    # Among equal (capped) progress, values that were within 0-100% come first
+    capped = progress != leaderboards['progress'][period][members]
+    tie_break = np.where(capped, CAPPED_TIE_BREAK if direction == AHEAD else -CAPPED_TIE_BREAK, 0.0)
+    picked = top_k(progress - tie_break, k, largest=direction == AHEAD)
+    positions = members[picked]
+    columns = {field: values[positions].tolist() for field, values in leaderboards['fields'].items()}
+    columns['progress'] = progress[picked].tolist()
+    columns['uncapped'] = leaderboards['progress'][period][positions].tolist()
+    columns['capped'] = [capped != uncapped for capped, uncapped in zip(columns['progress'], columns['uncapped'])]
+    return [dict(zip(columns, entry)) for entry in zip(*columns.values())]
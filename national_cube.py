@@ -0,0 +1,94 @@
+# national_cube.py
+#
+# Nation-wide status aggregate over all SSP sectors. The 16 sector frames are tabulated
+# once per data snapshot into a (sector, outcome) x period x status cube with
+# status_cube.status_cube; the national page reads slices of it (per sector, or per
+# outcome of one sector) without touching the DataFrames again.
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from sector_config import SECTORS
+from sector_data import (
+    get_sector_data, snapshot_version, OUTCOME_COL, STATUS_2024_COL, STATUS_MIDTERM_COL,
+    STATUS_PERIODS
+)
+from status_cube import status_cube
+
+# Period axis of the cube
+PERIODS = STATUS_PERIODS
+PERIOD_LABELS = {'2024/25': '2024/25 Target', 'midterm': 'NST2 Midterm Target (2026/27)'}
+
+
+def build_national_cube():
+    """Tabulate every sector workbook into one cube.
+
+    Returns a dict with
+      sectors       - sector keys, in sector_config.SECTORS order
+      groups        - (sector key, outcome) pairs, one per cube row
+      group_sector  - index into sectors for every group
+      cube          - int array (groups, PERIODS, STATUS_CATEGORIES)
+      indicators    - number of indicator rows per group (rated or not)
+      sector_cube   - cube summed over the outcomes of each sector
+      sector_indicators - indicator rows per sector
+    """
+    sectors = [sector['key'] for sector in SECTORS]
+    frames = []
+    for key in sectors:
+        df = get_sector_data(key)['df']
+        frames.append(pd.DataFrame({
+            'group': list(zip([key] * len(df), df[OUTCOME_COL])),
+            STATUS_2024_COL: df[STATUS_2024_COL].astype('string').str.strip().str.upper(),
+            STATUS_MIDTERM_COL: df[STATUS_MIDTERM_COL].astype('string').str.strip().str.upper(),
+        }))
+    combined = pd.concat(frames, ignore_index=True)
+
+    groups, cube = status_cube(combined, 'group', [STATUS_2024_COL, STATUS_MIDTERM_COL])
+    sector_index = {key: position for position, key in enumerate(sectors)}
+    group_sector = np.array([sector_index[key] for key, _ in groups], dtype=np.int64)
+    indicators = combined['group'].value_counts(sort=False).reindex(groups).to_numpy()
+
+    sector_cube = np.zeros((len(sectors),) + cube.shape[1:], dtype=np.int64)
+    np.add.at(sector_cube, group_sector, cube)
+    sector_indicators = np.bincount(group_sector, weights=indicators, minlength=len(sectors)).astype(np.int64)
+
+    return {
+        'sectors': sectors,
+        'groups': groups,
+        'group_sector': group_sector,
+        'cube': cube,
+        'indicators': indicators,
+        'sector_cube': sector_cube,
+        'sector_indicators': sector_indicators,
+    }
+
+
+_cube_lock = threading.Lock()
+_current_cube = {'version': None, 'cube': None}
+
+
+def get_national_cube():
+    """(version, cube dict) for the current data snapshot, built on first use."""
+    version = snapshot_version()
+    with _cube_lock:
+        if _current_cube['version'] != version:
+            _current_cube['cube'] = build_national_cube()
+            _current_cube['version'] = version
+        return version, _current_cube['cube']
+
+
+def sector_slice(cube, period):
+    """(sector keys, counts[sectors, STATUS_CATEGORIES], indicator rows per sector)."""
+    p = PERIODS.index(period)
+    return cube['sectors'], cube['sector_cube'][:, p, :], cube['sector_indicators']
+
+
+def outcome_slice(cube, key, period):
+    """(outcomes, counts[outcomes, STATUS_CATEGORIES], indicator rows) for one sector."""
+    p = PERIODS.index(period)
+    rows = np.flatnonzero(cube['group_sector'] == cube['sectors'].index(key))
+    outcomes = [cube['groups'][row][1] for row in rows]
+    return outcomes, cube['cube'][rows, p, :], cube['indicators'][rows]
+
@@ -0,0 +1,126 @@
+# pages/changes.py
+#
+# What changed between two data releases: indicators added or removed, statuses that
+# moved, values revised and narratives edited. The releases are the snapshots recorded
+# by snapshot_diff.py each time the app loads new workbooks; the report is computed (and
+# cached) by snapshot_diff.get_diff and sent to the browser one page at a time.
+
+import dash
+from dash import html, dcc, dash_table, Input, Output
+
+from export import changes_url
+from snapshot_diff import (
+    CHANGE_TYPES, DISPLAY_COLUMNS, list_snapshots, snapshot_label, snapshot_version,
+    current_snapshot, get_diff, filter_report, display_records, change_summary
+)
+
+dash.register_page(__name__, path='/changes', name='What Changed')
+
+# Table rows per page
+PAGE_SIZE = 25
+
+
+# --- Helper Functions ---
+def snapshot_options(names, current_version):
+    return [
+        {'label': snapshot_label(name) + (' - loaded data' if snapshot_version(name) == current_version else ''),
+         'value': name}
+        for name in reversed(names)
+    ]
+
+def summary_cards(summary):
+    return [
+        html.Div([
+            html.H2(str(count), className='metric-number'),
+            html.P(change, className='metric-label')
+        ], className='metric-card')
+        for change, count in summary.items()
+    ]
+
+
+# --- Layout ---
+def layout(**_):
+    # A function, so that releases recorded after start-up (by other workers) are listed
+    names = list_snapshots()
+    version, _ = current_snapshot()
+    current = next((name for name in names if snapshot_version(name) == version), None)
+    earlier = [name for name in names if name != current]
+    options = snapshot_options(names, version)
+    return html.Div([
+        html.H3("What Changed Between Data Releases", className='section-title'),
+        html.Div([
+            html.Div([
+                html.Label("Earlier release", className='dropdown-label'),
+                dcc.Dropdown(id='changes-base', options=options, value=earlier[-1] if earlier else None,
+                             clearable=False, className='dash-dropdown'),
+            ], className='ssp-dropdown-col'),
+            html.Div([
+                html.Label("Compared with", className='dropdown-label'),
+                dcc.Dropdown(id='changes-target', options=options, value=current,
+                             clearable=False, className='dash-dropdown'),
+            ], className='ssp-dropdown-col'),
+        ], className='ssp-dropdowns-row'),
+        dcc.Checklist(
+            id='changes-types',
+            options=CHANGE_TYPES,
+            value=CHANGE_TYPES,
+            inline=True,
+            inputStyle={'margin-right': '5px', 'margin-left': '15px'}
+        ),
+        html.P(id='changes-message', className='pillar-subheader'),
+        html.Div(id='changes-summary', className='metric-cards-container'),
+        html.Div([
+            html.A("Download CSV", id='changes-export-csv', className='export-link'),
+            html.A("Download Excel", id='changes-export-xlsx', className='export-link'),
+        ], className='export-links'),
+        dash_table.DataTable(
+            id='changes-table',
+            columns=[{'name': name, 'id': field} for field, name in DISPLAY_COLUMNS],
+            page_current=0,
+            page_size=PAGE_SIZE,
+            page_action='custom',
+            style_table={'overflowX': 'auto'},
+            style_header={'backgroundColor': '#f8f9fa', 'fontWeight': 'bold', 'color': '#333'},
+            style_cell={
+                'textAlign': 'left', 'padding': '8px', 'border': '1px solid #dee2e6',
+                'whiteSpace': 'normal', 'height': 'auto', 'maxWidth': '320px'
+            },
+        ),
+    ])
+
+
+# --- Callbacks ---
+@dash.callback(
+    Output('changes-table', 'data'),
+    Output('changes-table', 'page_count'),
+    Output('changes-message', 'children'),
+    Output('changes-summary', 'children'),
+    Output('changes-export-csv', 'href'),
+    Output('changes-export-xlsx', 'href'),
+    Input('changes-base', 'value'),
+    Input('changes-target', 'value'),
+    Input('changes-types', 'value'),
+    Input('changes-table', 'page_current'),
+    Input('changes-table', 'page_size'),
+)
+def update_changes(base, target, changes, page_current, page_size):
+    names = list_snapshots()
+    if base not in names or target not in names:
+        message = ("Only one data release has been recorded so far. Changes are listed here once "
+                   "updated workbooks have been loaded.")
+        return [], 0, message, [], None, None
+    if base == target:
+        return [], 0, "Choose two different releases.", [], None, None
+
+    report = get_diff(base, target)
+    shown = filter_report(report, changes)
+    page_size = page_size or PAGE_SIZE
+    page_count = max(1, -(-len(shown) // page_size))
+    page_current = min(page_current or 0, page_count - 1)
+    start = page_current * page_size
+    message = f"{len(shown)} changes from {snapshot_label(base)} to {snapshot_label(target)}"
+    return (
+        display_records(shown.iloc[start:start + page_size]), page_count, message,
+        summary_cards(change_summary(report)),
+        changes_url('csv', base, target, changes), changes_url('xlsx', base, target, changes),
+    )
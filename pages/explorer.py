@@ -0,0 +1,158 @@
+# pages/explorer.py
+#
+# Indicator explorer: every indicator of every sector (and of matrix.xlsx), filtered by
+# pillar, sector, status, unit and responsible institution at the same time. Filters and
+# the live count next to every facet value come from the bitmap indexes in
+# facet_index.py. The table is paged, sorted and filtered on the server (table_query.py),
+# so only the visible page is sent to the browser.
+#
+# The Excel download of the shown rows is written by a background job (background.py)
+# with a progress bar, instead of holding a request worker while openpyxl runs.
+
+import dash
+import dash_bootstrap_components as dbc
+from dash import html, dcc, dash_table, Input, Output, State, ALL
+
+from background import background_callback
+from facet_index import FACETS, get_facet_index, filter_bitmap, facet_counts, matching_rows
+from table_query import TABLE_COLUMNS, get_table_index, query_page
+from export import export_url, indicators_xlsx, remove_file
+
+dash.register_page(__name__, path='/indicators', name='Indicator Explorer')
+
+# Table rows per page
+PAGE_SIZE = 25
+
+
+# --- Helper Functions ---
+def facet_id(facet):
+    return {'type': 'facet-filter', 'facet': facet}
+
+def facet_options(values, counts, selected):
+    """Options labelled 'value (count)'. Values without matches are disabled unless selected."""
+    return [
+        {
+            'label': f"{value} ({counts.get(value, 0)})",
+            'value': value,
+            'disabled': not counts.get(value, 0) and value not in selected,
+        }
+        for value in values
+    ]
+
+# --- Layout ---
+def facet_dropdown(facet, label):
+    return html.Div([
+        html.Label(label, className='dropdown-label'),
+        dcc.Dropdown(id=facet_id(facet), multi=True, placeholder='All', className='dash-dropdown'),
+    ], className='ssp-dropdown-col')
+
+layout = html.Div([
+    html.H3("Indicator Explorer", className='section-title'),
+    html.Div(
+        [facet_dropdown(facet, label) for facet, (label, _) in FACETS.items()],
+        className='ssp-dropdowns-row', style={'flex-wrap': 'wrap'}
+    ),
+    html.H4(id='explorer-match-count', className='pillar-subheader'),
+    html.Div([
+        html.A("Download CSV", id='explorer-export-csv', href=export_url('csv', {}), className='export-link'),
+        html.Button("Download Excel", id='explorer-export-xlsx', className='export-link export-button'),
+        dbc.Progress(id='explorer-export-progress', value=0, max=1, style={'display': 'none'},
+                     className='export-progress'),
+        html.Button("Cancel", id='explorer-export-cancel', className='export-link export-button',
+                    style={'display': 'none'}),
+        dcc.Download(id='explorer-export-download'),
+    ], className='export-links'),
+    dash_table.DataTable(
+        id='explorer-table',
+        columns=[{'name': name, 'id': field, 'type': column_type} for field, name, column_type in TABLE_COLUMNS],
+        page_current=0,
+        page_size=PAGE_SIZE,
+        page_action='custom',
+        sort_action='custom',
+        sort_mode='multi',
+        sort_by=[],
+        filter_action='custom',
+        filter_query='',
+        style_table={'overflowX': 'auto'},
+        style_header={'backgroundColor': '#f8f9fa', 'fontWeight': 'bold', 'color': '#333'},
+        style_cell={
+            'textAlign': 'left', 'padding': '8px', 'border': '1px solid #dee2e6',
+            'whiteSpace': 'normal', 'height': 'auto', 'maxWidth': '320px'
+        },
+    ),
+])
+
+
+# --- Callbacks ---
+def facet_selections(selected_values):
+    facets = [item['id']['facet'] for item in dash.ctx.inputs_list[0]]
+    return {facet: values or [] for facet, values in zip(facets, selected_values)}
+
+@dash.callback(
+    Output({'type': 'facet-filter', 'facet': ALL}, 'options'),
+    Input({'type': 'facet-filter', 'facet': ALL}, 'value'),
+)
+def update_facet_options(selected_values):
+    selections = facet_selections(selected_values)
+    _, index = get_facet_index()
+    counts = facet_counts(index, selections)
+    return [
+        facet_options(index['facets'][facet]['values'], counts[facet], selected)
+        for facet, selected in selections.items()
+    ]
+
+@dash.callback(
+    Output('explorer-table', 'data'),
+    Output('explorer-table', 'page_count'),
+    Output('explorer-table', 'page_current'),
+    Output('explorer-match-count', 'children'),
+    Output('explorer-export-csv', 'href'),
+    Input({'type': 'facet-filter', 'facet': ALL}, 'value'),
+    Input('explorer-table', 'page_current'),
+    Input('explorer-table', 'page_size'),
+    Input('explorer-table', 'sort_by'),
+    Input('explorer-table', 'filter_query'),
+)
+def update_explorer_table(selected_values, page_current, page_size, sort_by, filter_query):
+    selections = facet_selections(selected_values)
+    _, index = get_facet_index()
+    rows = matching_rows(index, filter_bitmap(index, selections))
+
+    # A new facet selection or column filter starts again from the first page
+    triggered = dash.ctx.triggered_prop_ids
+    if ('explorer-table.filter_query' in triggered or
+            any(isinstance(component_id, dict) for component_id in triggered.values())):
+        page_current = 0
+    page_current = page_current or 0
+
+    _, table_index = get_table_index()
+    page, page_count, total = query_page(table_index, rows, filter_query, sort_by, page_current, page_size)
+    return (
+        page, page_count, min(page_current, page_count - 1), f"{total} of {index['rows']} indicators match",
+        export_url('csv', selections, filter_query, sort_by),
+    )
+
+@background_callback(
+    Output('explorer-export-download', 'data'),
+    Input('explorer-export-xlsx', 'n_clicks'),
+    State({'type': 'facet-filter', 'facet': ALL}, 'value'),
+    State('explorer-table', 'sort_by'),
+    State('explorer-table', 'filter_query'),
+    progress=[Output('explorer-export-progress', 'value'), Output('explorer-export-progress', 'max')],
+    running=[
+        (Output('explorer-export-xlsx', 'disabled'), True, False),
+        (Output('explorer-export-progress', 'style'), {'display': 'flex'}, {'display': 'none'}),
+        (Output('explorer-export-cancel', 'style'), {'display': 'inline-block'}, {'display': 'none'}),
+    ],
+    cancel=[Input('explorer-export-cancel', 'n_clicks')],
+    prevent_initial_call=True,
+)
+def export_excel(set_progress, n_clicks, selected_values, sort_by, filter_query):
+    # The facet dropdowns are laid out in FACETS order
+    selections = {facet: values or [] for facet, values in zip(FACETS, selected_values)}
+    path = indicators_xlsx(selections, filter_query, sort_by,
+                           set_progress=lambda done, total: set_progress((done, max(total, 1))))
+    try:
+        return dcc.send_file(path, filename='nst2-indicators.xlsx')
+    finally:
+        remove_file(path)
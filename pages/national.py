@@ -0,0 +1,243 @@
+# pages/national.py
+#
+# National overview: status of every SSP sector side by side. All numbers come from the
+# precomputed national cube (national_cube.py); the figures are cached per data snapshot
+# (figure_cache.py), so switching period or scope does not scan the sector workbooks.
+# Below them, leaderboards of the most-behind and most-ahead indicators (leaderboard.py).
+
+import dash
+from dash import html, dcc, Input, Output
+import plotly.graph_objects as go
+
+from figure_cache import cached_figure
+from figures import make_figure, STATUS_COLORS
+from national_cube import (
+    get_national_cube, sector_slice, outcome_slice, PERIODS, PERIOD_LABELS
+)
+from leaderboard import leaderboard, scopes as leaderboard_scopes, NATIONAL, BEHIND, AHEAD
+from sector_config import SECTORS, SECTORS_BY_KEY
+from status_cube import STATUS_CATEGORIES
+
+dash.register_page(__name__, path='/national', name='National Overview')
+
+# Statuses counted as on track when ranking sectors/outcomes
+ON_TRACK_STATUSES = ['COMPLETED', 'GOOD']
+
+ALL_SECTORS = 'all'
+
+# Leaderboard lengths on offer
+LEADERBOARD_SIZES = [5, 10, 20, 50]
+
+
+# --- Helper Functions ---
+def shorten(text, length=60):
+    text = str(text)
+    return text if len(text) <= length else text[:length - 1] + '…'
+
+def scope_rows(cube, scope, period):
+    """(row labels, hover names, counts[rows, STATUS_CATEGORIES]) for the selected scope."""
+    if scope == ALL_SECTORS:
+        keys, counts, _ = sector_slice(cube, period)
+        names = [SECTORS_BY_KEY[key]['label'] for key in keys]
+        return names, names, counts
+    outcomes, counts, _ = outcome_slice(cube, scope, period)
+    # Numbered so that outcomes sharing a long prefix stay separate rows
+    return [f"{n}. {shorten(outcome)}" for n, outcome in enumerate(outcomes, 1)], outcomes, counts
+
+def status_shares(counts):
+    """Share (%) of each status among the rated indicators of every row."""
+    rated = counts.sum(axis=1, keepdims=True)
+    return 100.0 * counts / rated.clip(min=1)
+
+def status_heatmap(labels, names, counts, title):
+    shares = status_shares(counts)
+    return make_figure([go.Heatmap(
+        z=shares,
+        x=STATUS_CATEGORIES,
+        y=labels,
+        customdata=[[name] * len(STATUS_CATEGORIES) for name in names],
+        text=counts,
+        texttemplate='%{text}',
+        colorscale='Blues',
+        zmin=0,
+        zmax=100,
+        colorbar=dict(title='% of rated'),
+        hovertemplate='%{customdata}<br>%{x}: %{text} indicators (%{z:.0f}%)<extra></extra>',
+    )], title=title, height=120 + 28 * len(labels),
+        yaxis=dict(autorange='reversed', automargin=True), xaxis=dict(side='top'))
+
+def ranked_status_bars(labels, names, counts, title):
+    """Stacked status shares per row, best on-track share at the top."""
+    shares = status_shares(counts)
+    on_track = shares[:, [STATUS_CATEGORIES.index(s) for s in ON_TRACK_STATUSES]].sum(axis=1)
+    order = sorted(range(len(labels)), key=lambda row: -on_track[row])
+    traces = [
+        go.Bar(
+            name=status,
+            orientation='h',
+            x=[shares[row, s] for row in order],
+            y=[labels[row] for row in order],
+            customdata=[[names[row], counts[row, s]] for row in order],
+            marker_color=STATUS_COLORS[status],
+            hovertemplate='%{customdata[0]}<br>' + status + ': %{customdata[1]} (%{x:.0f}%)<extra></extra>',
+        )
+        for s, status in enumerate(STATUS_CATEGORIES)
+    ]
+    return make_figure(traces, title=title, barmode='stack', height=120 + 28 * len(labels),
+                       xaxis=dict(title='% of rated indicators', range=[0, 100]),
+                       yaxis=dict(autorange='reversed', automargin=True),
+                       legend=dict(orientation='h', yanchor='bottom', y=1.0, xanchor='center', x=0.5))
+
+def totals_cards(totals):
+    return [
+        html.Div([
+            html.H2(str(count), className='metric-number', style={'color': STATUS_COLORS[status]}),
+            html.P(status, className='metric-label')
+        ], className='metric-card')
+        for status, count in totals.items()
+    ]
+
+
+def progress_cell(entry):
+    if entry['capped']:
+        return html.Span(f"{entry['progress']:.0%} *", title=f"Computed progress: {entry['uncapped']:.0%}")
+    return f"{entry['progress']:.0%}"
+
+
+def leaderboard_table(entries, title):
+    rows = [
+        html.Tr([
+            html.Td(rank),
+            html.Td(dcc.Link(shorten(entry['indicator'], 80), href=entry['path'], title=entry['indicator'])),
+            html.Td(entry['source_label']),
+            html.Td(progress_cell(entry)),
+        ])
+        for rank, entry in enumerate(entries, 1)
+    ]
+    header = html.Tr([html.Th("#"), html.Th("Indicator"), html.Th("Sector"), html.Th("Progress")])
+    notes = []
+    if any(entry['capped'] for entry in entries):
+        notes.append(html.P("* Computed progress outside 0-100%, capped for the ranking.",
+                            className='leaderboard-note'))
+    return html.Div([
+        html.P(title, className='section-title'),
+        html.Table([html.Thead(header), html.Tbody(rows)], className='table table-sm table-hover leaderboard-table'),
+        *notes
+    ], className='leaderboard-col')
+
+
+# --- Layout ---
+layout = html.Div([
+    html.H3("National Overview of SSP Sector Performance", className='section-title'),
+    html.Div([
+        html.Div([
+            html.Label("Status based on", className='dropdown-label'),
+            dcc.RadioItems(
+                id='national-period',
+                options=[{'label': PERIOD_LABELS[period], 'value': period} for period in PERIODS],
+                value=PERIODS[0],
+                inline=True,
+                inputStyle={'margin-right': '5px', 'margin-left': '15px'}
+            ),
+        ], className='ssp-dropdown-col'),
+        html.Div([
+            html.Label("Scope", className='dropdown-label'),
+            dcc.Dropdown(
+                id='national-scope',
+                options=[{'label': 'All sectors', 'value': ALL_SECTORS}] +
+                        [{'label': f"{sector['label']} outcomes", 'value': sector['key']} for sector in SECTORS],
+                value=ALL_SECTORS,
+                clearable=False,
+                className='dash-dropdown'
+            ),
+        ], className='ssp-dropdown-col'),
+    ], className='ssp-dropdowns-row'),
+
+    html.Div(id='national-totals', className='metric-cards-container'),
+    dcc.Graph(id='national-heatmap', config={'displayModeBar': False}),
+    dcc.Graph(id='national-ranking', config={'displayModeBar': False}),
+
+    # Most-behind / most-ahead indicators (leaderboard.py)
+    html.H3("Indicator Leaderboards", className='section-title'),
+    html.Div([
+        html.Div([
+            html.Label("Progress based on", className='dropdown-label'),
+            dcc.RadioItems(
+                id='leaderboard-period',
+                options=[{'label': PERIOD_LABELS[period], 'value': period} for period in PERIODS],
+                value=PERIODS[0],
+                inline=True,
+                inputStyle={'margin-right': '5px', 'margin-left': '15px'}
+            ),
+        ], className='ssp-dropdown-col'),
+        html.Div([
+            html.Label("Pillar", className='dropdown-label'),
+            dcc.Dropdown(
+                id='leaderboard-scope',
+                options=[{'label': 'All pillars' if scope == NATIONAL else scope.title(), 'value': scope}
+                         for scope in leaderboard_scopes()],
+                value=NATIONAL,
+                clearable=False,
+                className='dash-dropdown'
+            ),
+        ], className='ssp-dropdown-col'),
+        html.Div([
+            html.Label("Show", className='dropdown-label'),
+            dcc.Dropdown(
+                id='leaderboard-size',
+                options=[{'label': f"Top {size}", 'value': size} for size in LEADERBOARD_SIZES],
+                value=LEADERBOARD_SIZES[1],
+                clearable=False,
+                className='dash-dropdown'
+            ),
+        ], className='ssp-dropdown-col'),
+    ], className='ssp-dropdowns-row'),
+    html.Div(id='leaderboards', className='leaderboards'),
+])
+
+
+# --- Callbacks ---
+@dash.callback(
+    Output('national-totals', 'children'),
+    Output('national-heatmap', 'figure'),
+    Output('national-ranking', 'figure'),
+    Input('national-period', 'value'),
+    Input('national-scope', 'value')
+)
+def update_national_overview(period, scope):
+    if period not in PERIODS:
+        period = PERIODS[0]
+    if scope != ALL_SECTORS and scope not in SECTORS_BY_KEY:
+        scope = ALL_SECTORS
+    version, cube = get_national_cube()
+    scope_label = 'Sectors' if scope == ALL_SECTORS else f"{SECTORS_BY_KEY[scope]['label']} outcomes"
+
+    labels, names, counts = scope_rows(cube, scope, period)
+    totals = {status: int(count) for status, count in zip(STATUS_CATEGORIES, counts.sum(axis=0))}
+
+    heatmap = cached_figure(
+        ('national-heatmap', scope, period), version,
+        lambda: status_heatmap(labels, names, counts, f"{scope_label}: status mix ({PERIOD_LABELS[period]})")
+    )
+    ranking = cached_figure(
+        ('national-ranking', scope, period), version,
+        lambda: ranked_status_bars(labels, names, counts, f"{scope_label} ranked by share on track")
+    )
+    return totals_cards(totals), heatmap, ranking
+
+
+@dash.callback(
+    Output('leaderboards', 'children'),
+    Input('leaderboard-period', 'value'),
+    Input('leaderboard-scope', 'value'),
+    Input('leaderboard-size', 'value')
+)
+def update_leaderboards(period, scope, size):
+    if period not in PERIODS:
+        period = PERIODS[0]
+    if size not in LEADERBOARD_SIZES:
+        size = LEADERBOARD_SIZES[1]
+    return [
+        leaderboard_table(leaderboard(scope, period, size, BEHIND), f"Most behind ({PERIOD_LABELS[period]})"),
+        leaderboard_table(leaderboard(scope, period, size, AHEAD), f"Most ahead ({PERIOD_LABELS[period]})"),
+    ]
@@ -0,0 +1,19 @@
+# pages/sectors.py
+
+import dash
+
+from sector_config import SECTORS
+from sector_page import build_layout, register_callbacks
+
+# Register one page per configured sector. All sector pages share the layout builder
+# in sector_page.py; only the entries in sector_config.SECTORS differ.
+for sector in SECTORS:
+    dash.register_page(
+        f"pages.{sector['key']}",
+        path=sector['path'],
+        name=sector['name'],
+        layout=build_layout(sector)
+    )
+
+# The pattern-matching callbacks serve every sector page, so they are registered once
+register_callbacks()
@@ -0,0 +1,153 @@
+# projections.py
+#
+# Where is each indicator heading? Extends the trajectory from the baseline (2023/24) to
+# the current value (2024/25) to the NST2 midterm (2026/27) and end (2028/29) targets,
+# for every catalogue row at once (numpy), and estimates how likely the indicator is to
+# be on track there.
+#
+# Trajectories (PROJECTION_METHODS):
+#   'linear'   - the same absolute change every year (not below zero for values that
+#                start non-negative).
+#   'compound' - the same growth rate every year; only for positive baseline and current
+#                values (NaN otherwise).
+#
+# Two observations cannot say how uncertain a trajectory is, so the uncertainty comes from
+# the whole catalogue: how far indicators landed from their 2024/25 target, measured in
+# planned annual steps (a robust spread, SLIPPAGE). Each further year adds that much
+# spread again (random walk), so the chance of being on track at a target year is
+# P(expected value reaches the target) under a normal error with
+#     sd = slippage * |planned annual step| * sqrt(years from now to the target year).
+#
+# Results are cached per data snapshot (catalogue version) and trajectory method.
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from catalogue import get_catalogue
+from status_engine import numeric, indicator_arrays, decreasing_mask
+
+PROJECTION_METHODS = ('linear', 'compound')
+DEFAULT_METHOD = 'linear'
+
+# Years since the baseline (2023/24) of the current value and of each target
+CURRENT_YEAR = 1
+TARGET_YEARS = {'midterm': 3, '2028': 5}
+TARGET_LABELS = {'midterm': '2026/27', '2028': '2028/29'}
+
+# Bounds of the catalogue-wide slippage (in planned annual steps), so that a handful of
+# rows cannot make every projection certain or meaningless
+MIN_SLIPPAGE = 0.05
+MAX_SLIPPAGE = 2.0
+
+# Probability of being on track below which an indicator counts as at risk
+AT_RISK_PROBABILITY = 0.5
+
+
+def normal_cdf(z):
+    """Standard normal CDF (Abramowitz & Stegun 7.1.26, error below 1.5e-7)."""
+    x = np.abs(z) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-x * x)
+    return 0.5 * (1.0 + np.sign(z) * erf)
+
+
+def projection_arrays(df):
+    """status_engine.indicator_arrays plus the 2028/29 target."""
+    arrays = indicator_arrays(df)
+    arrays['target_2028'] = numeric(df['target_2028'])
+    return arrays
+
+
+def trajectory(baseline, current, years, method=DEFAULT_METHOD):
+    """Expected value `years` after the baseline (NaN where it cannot be projected)."""
+    if method not in PROJECTION_METHODS:
+        raise ValueError(f"Unknown projection method {method!r}; expected one of {PROJECTION_METHODS}")
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method == 'compound':
+            rate = np.where((baseline > 0) & (current > 0), current / baseline, np.nan) ** (1 / CURRENT_YEAR)
+            return baseline * rate ** years
+        expected = baseline + (current - baseline) / CURRENT_YEAR * years
+    # Counts, amounts and rates that start non-negative do not go below zero
+    return np.where((baseline >= 0) & (current >= 0), np.maximum(expected, 0), expected)
+
+
+def slippage(arrays):
+    """Robust spread (scaled MAD) of current vs the 2024/25 target, in planned annual steps."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        step = arrays['target_2024'] - arrays['baseline']
+        misses = (arrays['current'] - arrays['target_2024']) / step
+    misses = misses[np.isfinite(misses)]
+    if not len(misses):
+        return MAX_SLIPPAGE
+    spread = 1.4826 * np.median(np.abs(misses - np.median(misses)))
+    return float(np.clip(spread, MIN_SLIPPAGE, MAX_SLIPPAGE))
+
+
+def on_track_probability(expected, target, baseline, decreasing, years, spread):
+    """P(value at the target year reaches target), given the expected value."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ahead = np.where(decreasing, target - expected, expected - target)
+        sd = spread * np.abs(target - baseline) / years * np.sqrt(years - CURRENT_YEAR)
+        probability = normal_cdf(ahead / sd)
+    # No spread (target equal to the baseline): on track or not, nothing in between
+    probability = np.where(sd > 0, probability, (ahead >= 0).astype(float))
+    probability[~(np.isfinite(expected) & np.isfinite(target))] = np.nan
+    return probability
+
+
+def project(arrays, method=DEFAULT_METHOD, spread=None):
+    """Expected value and on-track probability of every row at each target year.
+
+    Returns {'expected_<period>', 'progress_<period>', 'on_track_<period>'} arrays for
+    each TARGET_YEARS period; progress is the expected share of the way from the baseline
+    to the target. spread defaults to slippage(arrays).
+    """
+    spread = slippage(arrays) if spread is None else spread
+    baseline = arrays['baseline']
+    decreasing = decreasing_mask(baseline, arrays['target_2024'], arrays['target_midterm'])
+    result = {}
+    for period, years in TARGET_YEARS.items():
+        expected = trajectory(baseline, arrays['current'], years, method)
+        expected[~np.isfinite(expected)] = np.nan
+        target = arrays[f'target_{period}']
+        result[f'expected_{period}'] = expected
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result[f'progress_{period}'] = (expected - baseline) / (target - baseline)
+        result[f'progress_{period}'][~np.isfinite(result[f'progress_{period}'])] = np.nan
+        result[f'on_track_{period}'] = on_track_probability(
+            expected, target, baseline, decreasing, years, spread
+        )
+    return result
+
+
+_lock = threading.Lock()
+_current_projections = {'version': None, 'projections': {}}
+
+
+def get_projections(method=DEFAULT_METHOD):
+    """(version, DataFrame of project() results aligned with the catalogue) for the
+    current data snapshot."""
+    version, catalogue = get_catalogue()
+    with _lock:
+        if _current_projections['version'] != version:
+            _current_projections['projections'] = {}
+            _current_projections['version'] = version
+        projections = _current_projections['projections']
+        if method not in projections:
+            projections[method] = pd.DataFrame(project(projection_arrays(catalogue), method),
+                                               index=catalogue.index)
+        return version, projections[method]
+
+
+def at_risk(rows, projections, period='midterm', limit=10):
+    """Positions (in rows) of the indicators least likely to reach their target at the
+    given target year, at most limit of them, all below AT_RISK_PROBABILITY."""
+    probability = projections[f'on_track_{period}'].to_numpy()[rows]
+    candidates = np.flatnonzero(probability < AT_RISK_PROBABILITY)
+    # Least likely first; ties (e.g. several at 0%) by how far the projection falls short
+    shortfall = projections[f'progress_{period}'].to_numpy()[rows][candidates]
+    order = np.lexsort((shortfall, probability[candidates]))
+    return candidates[order][:limit]
@@ -0,0 +1,245 @@
+# report.py
+#
+# Static reporting-cycle report: one HTML file per sector (status table, status pies,
+# performance highlights and a card per indicator with its narratives) plus an index
+# page with the status counts of every sector, built from the data snapshot without
+# running the server.
+#
+# Usage: python report.py [--out reports] [--sectors ict health ...] [--workers N] [--force]
+#
+# Sectors are rendered in a process pool and every file is written as soon as its sector
+# is done. manifest.json in the output directory records the inputs each report was built
+# from (workbook version, sector configuration, REPORT_VERSION); sectors whose inputs
+# have not changed since the last run are skipped. The pies are the sector pages' cached
+# figures (same figure_cache keys) drawn with one shared plotly.min.js. Reports have a
+# print stylesheet, so "Print to PDF" in a browser gives the PDF version.
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import time
+
+import pandas as pd
+from plotly.offline import get_plotlyjs
+
+from figure_cache import cached_figure, cached_figure_json
+from figures import STATUS_COLORS
+from sector_config import SECTORS, SECTORS_BY_KEY
+from sector_data import (
+    DATA_DIR, get_sector_data, file_version, DISPLAY_STATUSES, OUTCOME_COL, INDICATOR_COL,
+    UNITS_COL, BASELINE_COL, TARGET_2024_COL, TARGET_MIDTERM_COL, CURRENT_COL,
+    PROGRESS_2024_COL, PROGRESS_MIDTERM_COL, STATUS_2024_COL, STATUS_MIDTERM_COL,
+    DRIVERS_COL, CHALLENGES_COL, CATCHUP_COL
+)
+from sector_page import pie_chart, format_value, safe_percentage
+from static_html import write_atomic, summary_html, table_html, build_changed
+
+# Bump when the report layout changes so that every sector is rebuilt
+REPORT_VERSION = '1'
+
+DEFAULT_OUT_DIR = 'reports'
+PLOTLY_JS = 'plotly.min.js'
+
+REPORT_CSS = """
+body { font-family: Arial, sans-serif; color: #333; margin: 2rem; }
+h1 { color: #2b5876; margin-bottom: 0.25rem; }
+h2 { border-bottom: 2px solid #dee2e6; padding-bottom: 0.25rem; margin-top: 2rem; }
+.meta { color: #6c757d; font-size: 0.85rem; }
+.status-table { border-collapse: collapse; margin: 1rem 0; }
+.status-table th, .status-table td { border: 1px solid #dee2e6; padding: 6px 14px; text-align: center; }
+.status-table td:first-child { text-align: left; font-weight: bold; }
+.pies { display: flex; gap: 1rem; }
+.pie { width: 50%; height: 320px; }
+.cards { display: grid; grid-template-columns: repeat(auto-fill, minmax(420px, 1fr)); gap: 1rem; }
+.card { border: 1px solid #dee2e6; border-radius: 8px; padding: 0.75rem 1rem; break-inside: avoid; }
+.card h3 { font-size: 1rem; margin: 0 0 0.5rem; }
+.card table { width: 100%; font-size: 0.85rem; border-collapse: collapse; }
+.card td { padding: 2px 4px; vertical-align: top; }
+.card td:first-child { color: #6c757d; width: 40%; }
+.badge { display: inline-block; padding: 1px 8px; border-radius: 10px; color: white; font-size: 0.75rem; }
+.bar { background: #e9ecef; border-radius: 4px; height: 10px; }
+.bar span { display: block; height: 10px; border-radius: 4px; }
+.narrative { font-size: 0.85rem; margin: 0.4rem 0 0; }
+.highlight-percent, .highlight-number { font-weight: bold; color: #2575fc; }
+@media print {
+  body { margin: 0; }
+  h2 { break-before: page; }
+  h2:first-of-type { break-before: avoid; }
+  a { color: inherit; text-decoration: none; }
+}
+"""
+
+
+# --- Helpers ---
+def text(value, default='No data available'):
+    if value is None or (not isinstance(value, str) and pd.isna(value)) or not str(value).strip():
+        return html.escape(default)
+    return html.escape(' '.join(str(value).split()))
+
+
+def page(title, body, scripts=''):
+    return (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{html.escape(title)}</title>\n<style>{REPORT_CSS}</style>\n{scripts}</head>\n"
+        f"<body>\n{body}\n</body>\n</html>\n"
+    )
+
+
+def status_badge(status):
+    status = '' if status is None or pd.isna(status) else str(status).strip().upper()
+    if not status:
+        return '<span class="meta">Not rated</span>'
+    color = STATUS_COLORS.get(status, '#6c757d')
+    return f'<span class="badge" style="background:{color}">{html.escape(status)}</span>'
+
+
+def progress_bar(fraction):
+    percent = safe_percentage(fraction)
+    color = '#28a745' if percent >= 80 else '#ffc107' if percent >= 50 else '#dc3545'
+    width = min(max(percent, 0), 100)
+    return (f'<div class="bar"><span style="width:{width:.0f}%;background:{color}"></span></div>'
+            f'{percent:.1f}%')
+
+
+def indicator_card(row):
+    unit = row.get(UNITS_COL, '')
+    unit = '' if pd.isna(unit) else unit
+    values = [
+        ('Baseline', html.escape(format_value(row.get(BASELINE_COL), unit))),
+        ('2024/25 Target', html.escape(format_value(row.get(TARGET_2024_COL), unit))),
+        ('2026/27 Target', html.escape(format_value(row.get(TARGET_MIDTERM_COL), unit))),
+        ('Current progress', html.escape(format_value(row.get(CURRENT_COL), unit))),
+        ('Progress 2024/25', progress_bar(row.get(PROGRESS_2024_COL))),
+        ('Progress midterm', progress_bar(row.get(PROGRESS_MIDTERM_COL))),
+        ('Status 2024/25', status_badge(row.get(STATUS_2024_COL))),
+        ('Status midterm', status_badge(row.get(STATUS_MIDTERM_COL))),
+    ]
+    table = ''.join(f"<tr><td>{label}</td><td>{value}</td></tr>" for label, value in values)
+    narratives = ''.join(
+        f'<p class="narrative"><strong>{label}:</strong> {text(row.get(col))}</p>'
+        for label, col in [('Drivers', DRIVERS_COL), ('Challenges', CHALLENGES_COL), ('Catch up plans', CATCHUP_COL)]
+    )
+    return f'<div class="card"><h3>{text(row.get(INDICATOR_COL), "")}</h3><table>{table}</table>{narratives}</div>'
+
+
+def pie_div(element_id, figure_key):
+    # '</' would end the inline script early
+    figure_json = cached_figure_json(figure_key).replace('</', '<\\/')
+    return (f'<div class="pie" id="{element_id}"></div>'
+            f'<script>(function(f){{Plotly.newPlot("{element_id}", f.data, f.layout, {{displayModeBar: false}});}})'
+            f'({figure_json});</script>')
+
+
+# --- Reports ---
+def report_inputs(key):
+    """Fingerprint of everything a sector report is built from."""
+    sector = SECTORS_BY_KEY[key]
+    workbook_version = file_version(os.path.join(DATA_DIR, sector['workbook']))
+    config = json.dumps(sector, sort_keys=True, default=str)
+    return hashlib.sha1(f"{REPORT_VERSION}|{workbook_version}|{config}".encode('utf-8')).hexdigest()[:16]
+
+
+def build_sector_report(key, out_dir):
+    """Render one sector report into out_dir; returns its summary for the index page."""
+    sector = SECTORS_BY_KEY[key]
+    data = get_sector_data(key)
+    df = data['df']
+
+    # Same figure_cache keys as the sector page, so an in-process run reuses its figures
+    pie_keys = []
+    for period, counts, title in [
+        ('2024/25', data['status_2024_counts'], "2024/25 Target Status"),
+        ('midterm', data['status_midterm_counts'], "MidTerm Target Status"),
+    ]:
+        figure_key = ('sector-pie', key, period)
+        cached_figure(figure_key, data['version'], lambda: pie_chart(counts, title, sector['palette']))
+        pie_keys.append(figure_key)
+
+    rows = [
+        [status_badge(status), data['status_2024_counts'][status], data['status_midterm_counts'][status]]
+        for status in DISPLAY_STATUSES
+    ]
+    outcome_sections = []
+    for outcome, outcome_df in df.groupby(OUTCOME_COL, sort=False):
+        cards = ''.join(indicator_card(row) for row in outcome_df.to_dict('records'))
+        outcome_sections.append(f"<h2>{text(outcome, '')}</h2><div class=\"cards\">{cards}</div>")
+
+    body = (
+        f'<p class="meta"><a href="index.html">All sectors</a></p>'
+        f"<h1>{html.escape(sector['label'])} SECTOR REPORT</h1>"
+        f'<p class="meta">{html.escape(sector["pillar"])} &middot; {data["total_outcomes"]} outcomes &middot; '
+        f'{data["total_indicators"]} indicators &middot; generated {time.strftime("%Y-%m-%d %H:%M")}</p>'
+        f"<h2>Sector performance highlights</h2>{summary_html(sector['summary'])}"
+        f"{table_html(rows, ['Status', '2024/25 Target', 'NST2 Midterm Target'], 'status-table')}"
+        f'<div class="pies">{pie_div("pie-2024", pie_keys[0])}{pie_div("pie-midterm", pie_keys[1])}</div>'
+        + ''.join(outcome_sections)
+    )
+    scripts = f'<script src="{PLOTLY_JS}"></script>\n'
+    write_atomic(os.path.join(out_dir, f"{key}.html"), page(f"{sector['label']} sector report", body, scripts))
+
+    return {
+        'label': sector['label'],
+        'pillar': sector['pillar'],
+        'indicators': data['total_indicators'],
+        'status_2024': data['status_2024_counts'],
+        'status_midterm': data['status_midterm_counts'],
+    }
+
+
+def build_index(out_dir, summaries):
+    rows = []
+    for sector in SECTORS:
+        summary = summaries.get(sector['key'])
+        if summary is None:
+            continue
+        rows.append(
+            [f'<a href="{sector["key"]}.html">{html.escape(summary["label"])}</a>', html.escape(summary['pillar']),
+             summary['indicators']]
+            + [summary['status_2024'].get(status, 0) for status in DISPLAY_STATUSES]
+            + [summary['status_midterm'].get(status, 0) for status in DISPLAY_STATUSES]
+        )
+    headers = (['Sector', 'Pillar', 'Indicators']
+               + [f"{status} 2024/25" for status in DISPLAY_STATUSES]
+               + [f"{status} midterm" for status in DISPLAY_STATUSES])
+    body = (
+        "<h1>NST2 SECTOR REPORTS</h1>"
+        f'<p class="meta">Generated {time.strftime("%Y-%m-%d %H:%M")}</p>'
+        f"{table_html(rows, headers, 'status-table')}"
+    )
+    write_atomic(os.path.join(out_dir, 'index.html'), page("NST2 sector reports", body))
+
+
+def build_reports(out_dir, keys, workers=None, force=False, log=print):
+    """Build the reports of keys into out_dir; returns (built keys, skipped keys)."""
+    os.makedirs(out_dir, exist_ok=True)
+    plotly_path = os.path.join(out_dir, PLOTLY_JS)
+    if not os.path.exists(plotly_path):
+        write_atomic(plotly_path, get_plotlyjs())
+
+    inputs = {key: report_inputs(key) for key in keys}
+    manifest, built, skipped = build_changed(out_dir, inputs, build_sector_report, workers, force, log)
+    build_index(out_dir, {
+        key: entry['summary'] for key, entry in manifest.items()
+        if key in SECTORS_BY_KEY and isinstance(entry, dict) and entry.get('summary')
+    })
+    return built, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the static NST2 sector reports.")
+    parser.add_argument('--out', default=DEFAULT_OUT_DIR, help="output directory (default: %(default)s)")
+    parser.add_argument('--sectors', nargs='+', metavar='KEY', choices=list(SECTORS_BY_KEY),
+                        help="sector keys to build (default: all)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="rebuild sectors whose inputs have not changed")
+    args = parser.parse_args(argv)
+
+    keys = args.sectors or [sector['key'] for sector in SECTORS]
+    built, skipped = build_reports(args.out, keys, workers=args.workers, force=args.force)
+    print(f"{len(built)} built, {len(skipped)} unchanged; index: {os.path.join(args.out, 'index.html')}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+# search_index.py
+#
+# Cross-sector indicator search. Every row of the indicator catalogue (the 16 sector
+# workbooks and matrix.xlsx, see catalogue.py) is one document. The inverted index maps
+# each term to the documents that contain it together with its precomputed BM25 weight,
+# so a query only sums a few postings. The sorted vocabulary gives prefix matching
+# ("vacc" finds "vaccination") with a binary search. The index is built once per data
+# snapshot, together with the catalogue.
+
+import math
+import re
+import threading
+from bisect import bisect_left
+
+import pandas as pd
+
+from catalogue import get_catalogue
+
+# Field weights: a match in the indicator name counts more than one in the narrative
+FIELD_WEIGHTS = {
+    'indicator': 3.0,
+    'outcome': 1.5,
+    'source_label': 1.0,
+    'pillar': 1.0,
+    'drivers': 1.0,
+    'challenges': 1.0,
+    'catchup': 1.0,
+}
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# A term that only starts with the query token scores this fraction of an exact match
+PREFIX_WEIGHT = 0.8
+# Longest list of vocabulary terms one query token may expand to
+MAX_PREFIX_TERMS = 64
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'by', 'for', 'from', 'in', 'is', 'of', 'on',
+    'or', 'the', 'to', 'with'
+}
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text):
+    if text is None or (not isinstance(text, str) and pd.isna(text)):
+        return []
+    return [token for token in TOKEN_RE.findall(str(text).lower()) if token not in STOPWORDS]
+
+
+def collect_documents(catalogue):
+    """One document per catalogue row (every sector workbook row, then the matrix)."""
+    return catalogue.to_dict('records')
+
+
+def build_index(documents):
+    """Inverted index {term: {doc_id: bm25 weight}} plus the sorted vocabulary."""
+    term_freqs = []
+    lengths = []
+    for doc in documents:
+        freqs = {}
+        length = 0.0
+        for field, weight in FIELD_WEIGHTS.items():
+            tokens = tokenize(doc[field])
+            length += weight * len(tokens)
+            for token in tokens:
+                freqs[token] = freqs.get(token, 0.0) + weight
+        term_freqs.append(freqs)
+        lengths.append(length)
+
+    num_docs = len(documents)
+    avg_length = (sum(lengths) / num_docs) if num_docs else 0.0
+
+    postings = {}
+    for doc_id, freqs in enumerate(term_freqs):
+        for term, tf in freqs.items():
+            postings.setdefault(term, {})[doc_id] = tf
+
+    for term, docs in postings.items():
+        idf = math.log(1 + (num_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+        for doc_id, tf in docs.items():
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / avg_length)
+            docs[doc_id] = idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+    return {
+        'documents': documents,
+        'postings': postings,
+        'vocabulary': sorted(postings),
+    }
+
+
+def expand_token(index, token):
+    """[(term, weight)] for a query token: the exact term plus terms it is a prefix of."""
+    vocabulary = index['vocabulary']
+    expansions = []
+    start = bisect_left(vocabulary, token)
+    for term in vocabulary[start:start + MAX_PREFIX_TERMS]:
+        if not term.startswith(token):
+            break
+        expansions.append((term, 1.0 if term == token else PREFIX_WEIGHT))
+    return expansions
+
+
+def search(index, query, limit=10):
+    """Documents matching query, best first, each with its 'score'.
+
+    Documents that match every query token rank above those matching only some of them;
+    within each group documents are ordered by BM25 score.
+    """
+    tokens = list(dict.fromkeys(tokenize(query)))
+    if not tokens:
+        return []
+
+    scores = {}
+    matched = {}
+    for token in tokens:
+        token_scores = {}
+        for term, weight in expand_token(index, token):
+            for doc_id, term_score in index['postings'][term].items():
+                score = weight * term_score
+                if score > token_scores.get(doc_id, 0.0):
+                    token_scores[doc_id] = score
+        for doc_id, score in token_scores.items():
+            scores[doc_id] = scores.get(doc_id, 0.0) + score
+            matched[doc_id] = matched.get(doc_id, 0) + 1
+
+    ranked = sorted(scores, key=lambda doc_id: (-matched[doc_id], -scores[doc_id], doc_id))
+    documents = index['documents']
+    return [dict(documents[doc_id], score=round(scores[doc_id], 4)) for doc_id in ranked[:limit]]
+
+
+_index_lock = threading.Lock()
+_current_index = {'version': None, 'index': None}
+
+
+def get_search_index():
+    """Search index for the current data snapshot, built on first use."""
+    version, catalogue = get_catalogue()
+    with _index_lock:
+        if _current_index['version'] != version:
+            _current_index['index'] = build_index(collect_documents(catalogue))
+            _current_index['version'] = version
+        return _current_index['index']
+
+
+def search_indicators(query, limit=10):
+    return search(get_search_index(), query, limit=limit)
@@ -0,0 +1,727 @@
+# sector_config.py
+#
+# Declarative configuration for the SSP sector pages. Every entry is rendered by the
+# sector page engine (sector_page.py); pages/sectors.py registers one Dash page per entry.
+# The list order is the order of the sidebar navigation.
+#
+# Keys:
+#   key       - short identifier, also used as the page module name (pages.<key>)
+#   path      - URL of the page
+#   name      - page name shown in the sidebar
+#   label     - sector name in capitals, used in the header title and the sector count
+#   pillar    - NST2 pillar of the sector, spelled as in the Pillar column of matrix.xlsx
+#   workbook  - sector workbook (relative to the repository root)
+#   palette   - pie chart colours, in sector_data.DISPLAY_STATUSES order
+#   summary   - "SECTOR PERFORMANCE HIGHLIGHTS" bullets. Each bullet is a list of segments:
+#               a plain string, or a (style, text) tuple where style is a CSS class from
+#               assets/style.css ('highlight-percent', 'highlight-number', 'trend-up',
+#               'check-badge'), 'strong' for bold text or 'value' for an inline figure.
+
+SECTORS = [
+    {
+        'key': 'ict',
+        'path': '/ict',
+        'name': 'ICT Dashboard',
+        'label': 'ICT',
+        'pillar': 'ECONOMIC TRANSFORMATION',
+        'workbook': 'ICT.xlsx',
+        'palette': ['', '#28a745', '#ffc107', 'red'],
+        'summary': [
+            [
+                'Rwanda views ICT as a key enabler of national development, with the Smart Rwanda Master Plan guiding digital transformation across sectors like education, health, agriculture, and governance',
+            ],
+            [
+                'The country has achieved',
+                ('highlight-percent', '75%'),
+                ' 4G LTE coverage and',
+                ('highlight-number', '8.6 million\xa0 '),
+                'subscribers with over',
+                ('highlight-percent', '70% '),
+                'of priority government services available online or via mobile platforms.',
+                ('trend-up', ' ↗'),
+            ],
+            [
+                'Basic digital literacy among citizens stands at',
+                ('highlight-percent', '74.7%'),
+                ', internet access in schools is at',
+                ('highlight-percent', '61.8%'),
+                ', while smartphone ownership remains low at',
+                ('highlight-percent', '34%'),
+                ('check-badge', ' ✓'),
+            ],
+            [
+                'Limited connectivity in rural areas due to poor electrification and high broadband and hosting costs hinder accessibility and affordability.',
+                ('check-badge', ' ↓'),
+            ],
+            [
+                'The sector suffers from outdated cybersecurity infrastructure and a shortage of skilled professionals due to limited specialized training.',
+                ('trend-up', ' ↓'),
+            ],
+        ],
+    },
+    {
+        'key': 'psdye',
+        'path': '/psdye',
+        'name': 'PSDYE Dashboard',
+        'label': 'PSDYE',
+        'pillar': 'ECONOMIC TRANSFORMATION',
+        'workbook': 'psdye.xlsx',
+        'palette': ['green', 'yellow', 'lightblue', 'red'],
+        'summary': [
+            [
+                ('highlight-number', '1.37 million'),
+                ' productive and decent jobs created achieving',
+                ('highlight-percent', '92%'),
+                ' of NST1 target.',
+            ],
+            [
+                'Export revenues increased from',
+                ('highlight-number', 'USD 1.9 billion'),
+                'in 2017 to',
+                ('highlight-number', 'USD 3.5 billion '),
+                'in 2023, driven by growth in minerals, manufacturing, and services.',
+                ('trend-up', ' ↗'),
+            ],
+            [
+                'The tourism sector generated',
+                ('highlight-number', 'USD 620 million'),
+                'n 2023, with MICE tourism growing over',
+                ('highlight-percent', '40%'),
+                'year-on-year',
+                ('check-badge', ' ✓'),
+            ],
+            [
+                'The industrial sector expanded to',
+                ('highlight-percent', '22%'),
+                ' of GDP with continued support to MSMEs, which employ over',
+                ('highlight-number', '2.6 million'),
+                'people and contribute to ',
+                ('highlight-percent', '33%'),
+                'to GDP.',
+                ('check-badge', ' ✓'),
+            ],
+            [
+                'MSMEs, which make up over',
+                ('highlight-percent', '90%'),
+                ' of all businesses, employed ',
+                ('highlight-number', '2.6 million'),
+                ' people and contributed',
+                ('highlight-percent', '33%'),
+                ' to GDP.',
+                ('trend-up', ' ↗'),
+            ],
+        ],
+    },
+    {
+        'key': 'cenr',
+        'path': '/cenr',
+        'name': 'CENR Dashboard',
+        'label': 'CENR',
+        'pillar': 'ECONOMIC TRANSFORMATION',
+        'workbook': 'cenr.xlsx',
+        'palette': ['#28a745', '#ffc107', '#007bff', 'red'],
+        'summary': [
+            [
+                'Among the key achievements of the CENR sector during the NST-1 period are the increased national forest cover, now at',
+                ('highlight-percent', '30.4%'),
+                ' of land surface area',
+                ('trend-up', ' ↗'),
+            ],
+            [
+                'The transfer of',
+                ('highlight-percent', '65.5%'),
+                ' of public forests to private operators; the mobilization of up to ',
+                ('highlight-number', '4.8 billion USD'),
+                ', in climate finance',
+                ('check-badge', ' '),
+            ],
+            [
+                'The development of a National Land Use Development Master Plan (NLUDMP) for 2020 – 2050; the creation of a Land Administration Information System (LAIS).',
+                ('check-badge', '✓'),
+            ],
+            [
+                'The start of a project that will build infrastructure to manage water flows from the Volcanoes region; and the restoration of major wetlands of the country',
+                ('trend-up', '✓'),
+            ],
+        ],
+    },
+    {
+        'key': 'education',
+        'path': '/education',
+        'name': 'Education Dashboard',
+        'label': 'EDUCATION',
+        'pillar': 'SOCIAL TRANSFORMATIONAL',
+        'workbook': 'Education.xlsx',
+        'palette': ['red', '#28a745', '#ffc107', '#17a2b8'],
+        'summary': [
+            [
+                'Primary net enrollment exceeds',
+                ('highlight-percent', '95%'),
+                ',and pre-primary enrollment rose from',
+                ('highlight-percent', '21% '),
+                'to',
+                ('highlight-percent', '44.7% '),
+                'However, classroom overcrowding, limited early learning uptake, and double-shift systems persist—especially in lower primary, undermining foundational learning.',
+                ('trend-up', ' ↗'),
+            ],
+            [
+                'Over',
+                ('highlight-number', '1 Million '),
+                'secondary-aged learners remain in primary school. Adolescent pregnancy cases nearly doubled from',
+                ('highlight-number', '7,337 (2017)   '),
+                'to ',
+                ('highlight-number', '33,423 (2022) '),
+                "posing a major barrier to girls' education and retention.",
+                ('trend-up', '↓ '),
+            ],
+            [
+                'While school feeding programs have expanded, quality, affordability, and infrastructure (e.g., kitchens, clean water) remain major issues. Over',
+                ('highlight-percent', '94%'),
+                ' of schools still rely on firewood for cooking, raising health and environmental concerns',
+                ('check-badge', ' ✓'),
+            ],
+            [
+                'Learning outcomes improved (e.g., P3 Kinyarwanda comprehension rose to',
+                ('highlight-percent', '83% '),
+                ', but English proficiency among teachers remains low, only ',
+                ('highlight-percent', '4%'),
+                'of primary teachers meet standards). Over',
+                ('highlight-number', 'half'),
+                'of pre-primary and many primary teachers lack formal training ',
+                ('trend-up', '↓ '),
+            ],
+            [
+                'Dropout rates remain high',
+                ('highlight-percent', '5.2%'),
+                'in primary and',
+                ('highlight-percent', '4.8%'),
+                ' in n upper secondary. Low learning-adjusted years of schooling',
+                ('highlight-number', '(3.9 years) '),
+                'point to significant inefficiencies in the education system.',
+                ('trend-up', '↓ '),
+            ],
+        ],
+    },
+    {
+        'key': 'health',
+        'path': '/health',
+        'name': 'Health Dashboard',
+        'label': 'HEALTH',
+        'pillar': 'SOCIAL TRANSFORMATIONAL',
+        'workbook': 'Health.xlsx',
+        'palette': ['red', '#28a745', '#ffc107', '#17a2b8'],
+        'summary': [
+            [
+                'Rwanda has made significant strides in public health, focusing on accessible primary healthcare and disease prevention.',
+            ],
+            [
+                'Key achievements include a high immunization coverage rate of ',
+                ('highlight-percent', '98%'),
+                ' for common childhood diseases and a decline in maternal mortality ratio to ',
+                ('highlight-number', '203 '),
+                ' per 100,000 live births.',
+                ('trend-up', ' ↗'),
+            ],
+            [
+                'Challenges remain in non-communicable diseases, with rising cases of diabetes (',
+                ('highlight-percent', '5.4%'),
+                ') and hypertension (',
+                ('highlight-percent', '15%'),
+                ') among adults.',
+                ('check-badge', ' ↓'),
+            ],
+            [
+                'Despite efforts, equitable access to specialized care, particularly in rural areas, and retention of skilled health professionals remain ongoing issues.',
+                ('check-badge', ' ↓'),
+            ],
+            [
+                'Government initiatives are focusing on strengthening health infrastructure, expanding community health worker programs, and leveraging technology for health service delivery.',
+                ('check-badge', ' ✓'),
+            ],
+        ],
+    },
+    {
+        'key': 'governance',
+        'path': '/governance',
+        'name': 'Governance Dashboard',
+        'label': 'GOVERNANCE',
+        'pillar': 'TRANSFORMATIONAL GOVERNANCE',
+        'workbook': 'Governance.xlsx',
+        'palette': ['red', '#28a745', '#ffc107', '#17a2b8'],
+        'summary': [
+            [
+                'The sector aims to empower citizens, strengthen decentralized service delivery, and promote transparent, efficient, and accountable governance aligned with NST2 and Vision 2050.',
+            ],
+            [
+                'Citizen participation in governance forums rose from',
+                ('highlight-percent', '65.6%'),
+                ' to over',
+                ('highlight-percent', '90%  '),
+                'Local revenue increased from',
+                ('highlight-number', 'Rwf 60.6B '),
+                'to ',
+                ('highlight-number', 'Rwf 86.6B '),
+                'Local Economic Development (LED) initiatives created over.',
+                ('highlight-number', '942,000 jobs '),
+                '(2017–2021), and ICT use improved service delivery.',
+                ('trend-up', ' ↗'),
+            ],
+            [
+                'Platforms for civic engagement, gender parity, and civil society participation expanded. The new Decentralisation Policy (2021) strengthened local governance structures, and Home-Grown Solutions (HGS) continued to foster socio-economic transformation.',
+                ('check-badge', ' ✓'),
+            ],
+            [
+                'Automation and data systems improved decision-making at local levels, though digital literacy remains a challenge. Media and CSOs contributed to transparency and civic education.',
+                ('check-badge', ' ↗'),
+            ],
+            [
+                'Persistent issues include insufficient funding, outdated local structures, staffing shortages, limited civic engagement in decision-making, weak local revenue mobilization, and dependency mindsets among citizens.',
+                ('trend-up', ' ↓'),
+            ],
+        ],
+    },
+    {
+        'key': 'agriculture',
+        'path': '/agriculture',
+        'name': 'Agriculture Dashboard',
+        'label': 'AGRICULTURE',
+        'pillar': 'ECONOMIC TRANSFORMATION',
+        'workbook': 'agriculture.xlsx',
+        'palette': ['red', '#28a745', '#ffc107', '#17a2b8'],
+        'summary': [
+            [
+                'Rwanda’s agriculture employs about',
+                ('highlight-percent', '70%'),
+                ' of the population',
+                ('check-badge', ' ✓'),
+            ],
+            [
+                'Agriculture contributes',
+                ('highlight-percent', '27%'),
+                ' to GDP, and accounts for ',
+                ('highlight-percent', '34%'),
+                'of exports.',
+                ('check-badge', ' ✓'),
+            ],
+            [
+                'It is vital for economic growth, food security, and inclusive development.',
+                ('check-badge', ' ✓'),
+            ],
+            [
+                'The sector faces challenges such as low productivity',
+                ('highlight-percent', '(58.6%)'),
+                ', climate change, land scarcity, and limited access to finance',
+                ('check-badge', '↓'),
+            ],
+            [
+                'Rwanda is implementing the Strategic Plan for Agriculture Transformation (PSTA 5),aiming to modernize and build a climate-resilient agri-food system.',
+                ('trend-up', ' ↗'),
+            ],
+        ],
+    },
+    {
+        'key': 'transport',
+        'path': '/transport',
+        'name': 'Transport Dashboard',
+        'label': 'TRANSPORT',
+        'pillar': 'ECONOMIC TRANSFORMATION',
+        'workbook': 'transport.xlsx',
+        'palette': ['red', '#28a745', '#ffc107', '#17a2b8'],
+        'summary': [
+            [
+                'Since 2018, Rwanda has focused on reducing transport emissions, with electric vehicle incentives approved in 2021 and a growing number of EVs registered.',
+            ],
+            [
+                'Rwanda upgraded',
+                ('highlight-number', '424 km'),
+                ' km of national roads, rehabilitated',
+                ('highlight-number', '303 km  '),
+                'of paved roads, and improved',
+                ('highlight-number', '237 km '),
+                'km of urban roads. Airport passenger traffic to rise  from',
+                ('highlight-number', '1.5 '),
+                'to ',
+                ('highlight-number', '2 million '),
+                'annually, and one port on Lake Kivu was completed.',
+                ('trend-up', ' ↗'),
+            ],
+            [
+                'Rwanda’s road network totals ',
+                ('highlight-number', '44,671 km'),
+                ' with',
+                ('highlight-number', '6,655 km  '),
+                'well-developed. By end of NST1,',
+                ('highlight-percent', '62% '),
+                'of roads were paved,and',
+                ('highlight-percent', '97% '),
+                'of these were in good condition due to effective maintenance strategies',
+                ('trend-up', ' ↗'),
+            ],
+            [
+                'Improvements in Kigali led to reduced peak-hour waiting times from',
+                ('highlight-number', '30'),
+                'to below',
+                ('highlight-number', '18 minutes'),
+                ',and expanded routes, especially in underserved areas.',
+                ('check-badge', ' ↓'),
+            ],
+            [
+                'The next 5 years will focus on five pillars: (i) road quality and service level, (ii) better public transport and decongestion, (iii) multimodal transport systems, (iv) efficient air transport, and (v) green transport for climate resilience.',
+                ('trend-up', ' ✓'),
+            ],
+        ],
+    },
+    {
+        'key': 'sp',
+        'path': '/social-protection',
+        'name': 'Social Protection Dashboard',
+        'label': 'SOCIAL PROTECTION',
+        'pillar': 'SOCIAL TRANSFORMATIONAL',
+        'workbook': 'sp.xlsx',
+        'palette': ['red', '#28a745', '#ffc107', '#17a2b8'],
+        'summary': [
+            [
+                'The SP-SSP aims to reduce poverty through three core objectives: Protect, Promote, and Prevent, by expanding coverage, ensuring adequacy of benefits, and strengthening shock-responsive systems.',
+            ],
+            [
+                'Coverage expanded for older persons, persons with disabilities, and vulnerable groups. The Ejo Heza savings scheme exceeded its target, and over ',
+                ('highlight-number', '677,000'),
+                ' mothers and infants benefited from nutrition-sensitive support.',
+                ('trend-up', ' ↗'),
+            ],
+            [
+                'Social security and income support coverage (',
+                ('highlight-percent', '10%'),
+                ') fell short of the ',
+                ('highlight-percent', '17.7%'),
+                ' target. Vulnerable groups, especially children and informal sector workers, remain undercovered due to financing and structural barriers.',
+                ('check-badge', ' ↓'),
+            ],
+            [
+                'Over ',
+                ('highlight-number', '1.9 million'),
+                ' households received temporary assistance during crises, and ',
+                ('highlight-percent', '77%'),
+                ' of VUP’s classic public works (cPW) expenditure was directed to disaster risk reduction projects, exceeding targets.',
+                ('trend-up', ' ↗'),
+            ],
+            [
+                'Over ',
+                ('highlight-number', '16,000'),
+                ' youth and ',
+                ('highlight-number', '14,000'),
+                ' persons with disabilities benefited from rehabilitation services, while over ',
+                ('highlight-number', '250,000'),
+                ' households received asset transfers and income-generating support.',
+                ('check-badge', ' ✓'),
+            ],
+        ],
+    },
+    {
+        'key': 'energy',
+        'path': '/energy',
+        'name': 'Energy Dashboard',
+        'label': 'ENERGY',
+        'pillar': 'ECONOMIC TRANSFORMATION',
+        'workbook': 'energy.xlsx',
+        'palette': ['red', '#28a745', '#ffc107', '#17a2b8'],
+        'summary': [
+            [
+                ('strong', 'Universal Electricity Access by 2030:'),
+                ' Rwanda targets ',
+                ('value', '100%'),
+                ' electricity access by ',
+                ('value', '2030'),
+                ', with at least ',
+                ('value', '75%'),
+                ' grid-connected and the rest via off-grid solutions.',
+            ],
+            [
+                ('strong', 'Renewable Energy Focus:'),
+                ' Investments are prioritized in hydro, solar, and methane gas to scale up sustainable energy, aligning with SDG 7.',
+            ],
+            [
+                ('strong', 'Capacity Expansion:'),
+                ' Electricity generation is set to grow from ',
+                ('value', '400.1 MW'),
+                ' to ',
+                ('value', '615 MW'),
+                ' by ',
+                ('value', '2028/29'),
+                '.',
+            ],
+            [
+                ('strong', 'Infrastructure Development:'),
+                ' Planned upgrades include ',
+                ('value', '473.8 km'),
+                ' of high-voltage lines, ',
+                ('value', '6,133.6 km'),
+                ' of medium-voltage lines, ',
+                ('value', '21,673 km'),
+                ' of low-voltage lines, and ',
+                ('value', '15,000 km'),
+                ' of street lighting.',
+            ],
+            [
+                ('strong', 'Improved Efficiency & Economic Impact:'),
+                ' Efforts aim to cut system losses from ',
+                ('value', '16.9%'),
+                ' to ',
+                ('value', '14.7%'),
+                ' and position Rwanda as a regional energy hub—driving green growth, job creation, and investment.',
+            ],
+        ],
+    },
+    {
+        'key': 'urbanisation',
+        'path': '/urbanisation',
+        'name': 'Urbanisation Dashboard',
+        'label': 'URBANISATION',
+        'pillar': 'ECONOMIC TRANSFORMATION',
+        'workbook': 'urbanisation.xlsx',
+        'palette': ['red', '#28a745', '#ffc107', '#17a2b8'],
+        'summary': [
+            [
+                'Urbanization Progress: Population in well-managed urban areas rose from ',
+                ('highlight-percent', '18.4%'),
+                ' (2016/17) to ',
+                ('highlight-percent', '27.9%'),
+                ' (2022), with informal settlements slightly declining and ',
+                ('highlight-number', '60,000'),
+                ' residents benefiting from urban upgrading projects.',
+            ],
+            [
+                'Integrated Rural Settlements: Households in integrated rural settlements increased from ',
+                ('highlight-percent', '61.7%'),
+                ' to ',
+                ('highlight-percent', '65.4%'),
+                ', and over ',
+                ('highlight-number', '48,000'),
+                ' rural HHs were relocated from scattered settlements; ',
+                ('highlight-number', '254'),
+                ' IDP model villages were built for over ',
+                ('highlight-number', '29,000'),
+                ' families.',
+            ],
+            [
+                'Urban Planning and Coordination: NLUDMP ',
+                ('highlight-number', '2050'),
+                ' was adopted; ',
+                ('highlight-number', '21'),
+                ' District Land Use Plans (DLUPs) were developed; BPMIS is operational in all District One Stop Centers (OSCs); over ',
+                ('highlight-number', '1,000'),
+                ' stakeholders trained.',
+            ],
+            [
+                'Key Challenges: Persisting urban sprawl, unaffordable housing, weak private sector capacity, limited local government resources, and gaps in built environment skills hinder sustainable urban development.',
+            ],
+        ],
+    },
+    {
+        'key': 'watsan',
+        'path': '/watsan',
+        'name': 'WATSAN Dashboard',
+        'label': 'WATSAN',
+        'pillar': 'SOCIAL TRANSFORMATIONAL',
+        'workbook': 'watsan.xlsx',
+        'palette': ['red', '#28a745', '#ffc107', '#17a2b8'],
+        'summary': [
+            [
+                'Significant progress from 2017–2024, including increased water production capacity (from ',
+                ('highlight-number', '182,120'),
+                ' to ',
+                ('highlight-number', '329,652 m³/day'),
+                ') and expansion of the water distribution network to ',
+                ('highlight-number', '33,476 km'),
+                '.',
+            ],
+            [
+                'Clean water access reached ',
+                ('highlight-percent', '82.3%'),
+                ' nationally by 2022, with urban areas at ',
+                ('highlight-percent', '96%'),
+                ' and rural areas at ',
+                ('highlight-percent', '77%'),
+                ', revealing ongoing disparities.',
+            ],
+            [
+                'Sanitation improvements include ',
+                ('highlight-percent', '92%'),
+                ' of households using improved toilets and new sewage and faecal sludge treatment systems in Kigali and other districts.',
+            ],
+            [
+                'Persistent challenges remain, such as limited financing, high Non-Revenue Water (only reduced from ',
+                ('highlight-percent', '42%'),
+                ' to ',
+                ('highlight-percent', '39%'),
+                '), and project delays due to institutional and climate-related factors.',
+            ],
+            [
+                'Strategic goals for ',
+                ('highlight-number', '2029'),
+                ' include ',
+                ('highlight-percent', '100%'),
+                ' access to clean water and sanitation, expanding water production to ',
+                ('highlight-number', '684,652 m³/day'),
+                ', completing Kigali’s sewerage system, and enhancing waste management.',
+            ],
+        ],
+    },
+    {
+        'key': 'jrlo',
+        'path': '/jrlo',
+        'name': 'JRLO Dashboard',
+        'label': 'JRLO',
+        'pillar': 'TRANSFORMATIONAL GOVERNANCE',
+        'workbook': 'jrlo.xlsx',
+        'palette': ['red', '#28a745', '#ffc107', '#17a2b8'],
+        'summary': [
+            [
+                'Rule of law improved to ',
+                ('highlight-percent', '88.89%'),
+                ", with citizens' trust in the judiciary reaching ",
+                ('highlight-percent', '90.7%'),
+                '. E-Justice systems (like IECMS and MAJ MIS) enhanced service delivery. The Abunzi handled ',
+                ('highlight-percent', '98%'),
+                ' of eligible cases, easing court burden.',
+            ],
+            [
+                'Public confidence in safety rose to ',
+                ('highlight-percent', '93.63%'),
+                '. Road fatalities dropped, response times improved, and major investments were made in road safety (e.g., cameras, driving center, and AICs). Over ',
+                ('highlight-number', '1 million'),
+                ' community policing actors were trained.',
+            ],
+            [
+                'Progress in Unity and Reconciliation: Reconciliation rates increased to ',
+                ('highlight-percent', '94.6%'),
+                ', with a strong sense of national pride (',
+                ('highlight-percent', '99%'),
+                '). Gacaca archives were digitized, and genocide memorial preservation efforts were undertaken.',
+            ],
+            [
+                'Citizen satisfaction with anti-corruption measures rose to ',
+                ('highlight-percent', '88.97%'),
+                ', and Rwanda ranked among the ',
+                ('highlight-number', '49 least corrupt countries'),
+                ' in the 2023 Corruption Perception Index (CPI).',
+            ],
+        ],
+    },
+    {
+        'key': 'sport',
+        'path': '/sport',
+        'name': 'Sport and Culture Dashboard',
+        'label': 'SPORT AND CULTURE',
+        'pillar': 'SOCIAL TRANSFORMATIONAL',
+        'workbook': 'sport.xlsx',
+        'palette': ['#28a745', '#ffc107', '#007bff', 'red'],
+        'summary': [
+            [
+                'Major facilities were constructed or upgraded, including Kigali Arena and Amahoro Stadium. Over ',
+                ('highlight-number', '4,500'),
+                ' young athletes were identified and supported through national programs and international partnerships with ',
+                ('highlight-number', '523'),
+                ' sports professionals trained.',
+            ],
+            [
+                'Key cultural infrastructure was developed (e.g., museums, Nkumba Ubutore Centre), ',
+                ('highlight-number', '5,000'),
+                ' heritage items digitized, and ',
+                ('highlight-number', '1.3 million'),
+                ' museum visits were recorded. ',
+                ('highlight-number', '2'),
+                ' music schools, ',
+                ('highlight-number', '1'),
+                ' plastic arts school, and film training centers were established, supporting ',
+                ('highlight-number', '37'),
+                ' arts projects and creating ',
+                ('highlight-number', '5,708'),
+                ' jobs.',
+            ],
+            [
+                'Civic Education and Ikinyarwanda Promotion: Over ',
+                ('highlight-number', '292,000'),
+                ' people were trained under the Itorero program. Ikinyarwanda was digitalized, with new dictionaries produced across four sectors.',
+            ],
+            [
+                'Challenges include weak use of Ikinyarwanda in modern domains, low integration of cultural values in daily life, limited cultural experts, lack of a legal framework for the creative industry, and infrastructure and financing gaps in the arts sector.',
+                ('check-badge', ' ↓'),
+            ],
+        ],
+    },
+    {
+        'key': 'pfm',
+        'path': '/pfm',
+        'name': 'PFM Dashboard',
+        'label': 'PFM',
+        'pillar': 'TRANSFORMATIONAL GOVERNANCE',
+        'workbook': 'pfm.xlsx',
+        'palette': ['#28a745', '#ffc107', '#007bff', 'red'],
+        'summary': [
+            [
+                'The rollout of IFMIS across budget and non-budget agencies (excluding primary schools) improved transparency and efficiency in public financial reporting.',
+            ],
+            [
+                'Audit and Professional Certification Progress: ',
+                ('highlight-percent', '92%'),
+                ' of public entities received unqualified audit opinions, surpassing targets. The number of staff with professional certifications rose to ',
+                ('highlight-number', '1,052'),
+                ', well above the target of ',
+                ('highlight-number', '266'),
+                '.',
+            ],
+            [
+                'Enhanced Accountability: Adoption of the PEFA framework strengthened accountability, and the IPSAS accrual project is progressing at ',
+                ('highlight-percent', '73%'),
+                ', laying the groundwork for improved public sector accounting standards.',
+            ],
+            [
+                'Issues include declining domestic revenues, incomplete fiscal decentralization, limited oversight of Government Business Enterprises (GBEs), and the need to improve spending controls amid tighter public finances.',
+                ('check-badge', ' ↓'),
+            ],
+        ],
+    },
+    {
+        'key': 'fsd',
+        'path': '/fsd',
+        'name': 'FSD Dashboard',
+        'label': 'FSD',
+        'pillar': 'ECONOMIC TRANSFORMATION',
+        'workbook': 'fsd.xlsx',
+        'palette': ['#28a745', '#ffc107', '#007bff', 'red'],
+        'summary': [
+            [
+                "Rwanda's financial sector is stable, well-capitalized, profitable, and liquid, with sector-wide growth supported by the Financial Sector Development Programs (FSDP 1 & 2) and aligned with the country’s private-sector-led development strategy.",
+            ],
+            [
+                'The microfinance sector recorded ',
+                ('highlight-percent', '36.4%'),
+                ' asset growth, with deposits rising by Frw ',
+                ('highlight-number', '137 billion'),
+                '—partly due to the conversion of three banks into microfinance institutions.',
+            ],
+            [
+                'Digital and Cashless Innovations: Electronic payments reached nearly ',
+                ('highlight-percent', '200%'),
+                ' of GDP, and all Umurenge SACCOs were digitalized, advancing Rwanda’s push toward a cashless economy.',
+            ],
+            [
+                'Investment and Credit Access: Private sector access to credit surpassed targets (Frw ',
+                ('highlight-number', '1,927.2 billion'),
+                ' vs. Frw ',
+                ('highlight-number', '1,397.4 billion'),
+                '). The Kigali International Financial Centre exceeded its investment custody target (Frw ',
+                ('highlight-number', '300 billion'),
+                ' vs. Frw ',
+                ('highlight-number', '120 billion'),
+                ') and attracted ',
+                ('highlight-number', '40'),
+                ' of 50 planned investors.',
+            ],
+        ],
+    },
+]
+
+SECTORS_BY_KEY = {sector['key']: sector for sector in SECTORS}
+SECTORS_BY_PATH = {sector['path']: sector for sector in SECTORS}
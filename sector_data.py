@@ -0,0 +1,152 @@
+# sector_data.py
+#
+# Loading and summarising the SSP sector workbooks. Each workbook is read and cleaned
+# once per process and shared by every consumer (the sector pages and any later tools),
+# instead of every page module keeping its own copy.
+
+import hashlib
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+from sector_config import SECTORS, SECTORS_BY_KEY
+from status_cube import status_index
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Column names used in the sector workbooks
+OUTCOME_COL = 'Outcome'
+INDICATOR_COL = 'Indicators'
+UNITS_COL = 'Units'
+BASELINE_COL = 'Baseline'
+TARGET_2024_COL = '2024/25 Target'
+TARGET_MIDTERM_COL = '2026/27 Target'
+CURRENT_COL = 'Current progress'
+PROGRESS_2024_COL = 'Percentage Progress based on 2024/25 Target'
+PROGRESS_MIDTERM_COL = 'Percentage Progress based on 2026/27 Target'
+STATUS_2024_COL = 'Status based on 2024/25 Target'
+STATUS_MIDTERM_COL = 'Status based on NST2 Midterm target'
+DRIVERS_COL = 'Major drivers of performance'
+CHALLENGES_COL = 'Challenges'
+CATCHUP_COL = 'Catch up Plans'
+# Spelled differently from one workbook to the next (and missing from some)
+RESPONSIBILITY_COLS = ['Responsibility for reporting', 'Responsibility for Reporting', 'Responsible Institutions']
+# End-of-NST2 (2028/29) targets, the same way (matrix.xlsx spelling last)
+TARGET_2028_COLS = [
+    '2028/29', '2028/29 (target)', 'Target 2028/29', 'SSP Targets 2028/2029',
+    'Annual Targets\n(2028/2029)', 'Annual Targets (2028/29)'
+]
+
+SECTOR_COLUMNS = [
+    OUTCOME_COL, INDICATOR_COL, UNITS_COL, BASELINE_COL, TARGET_2024_COL, TARGET_MIDTERM_COL,
+    CURRENT_COL, PROGRESS_2024_COL, PROGRESS_MIDTERM_COL, STATUS_2024_COL, STATUS_MIDTERM_COL,
+    DRIVERS_COL, CHALLENGES_COL, CATCHUP_COL
+]
+
+# The national results matrix and the (stripped) column names it uses where they differ
+# from the sector workbooks
+MATRIX_WORKBOOK = 'matrix.xlsx'
+MATRIX_PILLAR_COL = 'Pillar'
+MATRIX_OUTCOME_COL = 'NST2 Outcome'
+MATRIX_BASELINE_COL = 'Baseline (2023/24)'
+MATRIX_TARGET_2024_COL = '2024/25 target'
+MATRIX_TARGET_MIDTERM_COL = '2026/27 target'
+MATRIX_CURRENT_COL = 'Current progress (2024/25)'
+MATRIX_PROGRESS_2024_COL = '% Progress based on 2024/25 Target'
+MATRIX_PROGRESS_MIDTERM_COL = '% Progress based on 2026/27 Target'
+MATRIX_STATUS_2024_COL = 'Status based on 2024/25 Target'
+MATRIX_STATUS_MIDTERM_COL = 'Status based on 2026/27 Target'
+MATRIX_DRIVERS_COL = 'Major drivers of performance (Maximum 2)'
+MATRIX_CHALLENGES_COL = 'Challenges, if any'
+MATRIX_CATCHUP_COL = 'Catch up Plans'
+
+# Order of the rows in the sector status table and of the slices in the pies
+DISPLAY_STATUSES = ['GOOD', 'SATISFACTORY', 'COMPLETED', 'LOW']
+
+# Keys of the two status periods (STATUS_2024_COL, STATUS_MIDTERM_COL)
+STATUS_PERIODS = ['2024/25', 'midterm']
+
+
+def file_version(path):
+    """Cheap version stamp for a data file: changes whenever the file is replaced or edited."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return 'missing'
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
+def load_sector_frame(workbook):
+    """Read and clean one sector workbook. A missing file gives an empty frame."""
+    try:
+        df = pd.read_excel(os.path.join(DATA_DIR, workbook))
+    except FileNotFoundError:
+        print(f"Error: {workbook} file not found. Using empty DataFrame.")
+        return pd.DataFrame(columns=SECTOR_COLUMNS)
+
+    # Some workbooks carry trailing spaces in their headers (e.g. 'Catch up Plans ')
+    df.columns = [str(col).strip() for col in df.columns]
+    df['Units'] = df['Units'].str.replace('Percent', '%', regex=False)
+    df = df.dropna(subset=[OUTCOME_COL])
+    df[OUTCOME_COL] = df[OUTCOME_COL].astype(str).str.strip()
+    df = df[df[OUTCOME_COL] != ''].reset_index(drop=True)
+    return df
+
+
+@lru_cache(maxsize=None)
+def get_sector_data(key):
+    """Cleaned frame plus the aggregates shown on the sector page, computed once per sector."""
+    workbook = SECTORS_BY_KEY[key]['workbook']
+    version = file_version(os.path.join(DATA_DIR, workbook))
+    df = load_sector_frame(workbook)
+
+    outcomes = [o for o in df[OUTCOME_COL].unique().tolist() if o and str(o).strip()]
+    indicators_by_outcome = {
+        outcome: [i for i in indicators.unique().tolist() if pd.notna(i) and str(i).strip()]
+        for outcome, indicators in df.groupby(OUTCOME_COL, sort=False)[INDICATOR_COL]
+    }
+
+    status_2024_counts = df[STATUS_2024_COL].value_counts().to_dict()
+    status_midterm_counts = df[STATUS_MIDTERM_COL].value_counts().to_dict()
+    # {period: {status: [indicator]}}: answers "which indicators are LOW" without a filter
+    indicators_by_status = status_index(
+        df, INDICATOR_COL, [STATUS_2024_COL, STATUS_MIDTERM_COL], STATUS_PERIODS, status_categories=DISPLAY_STATUSES
+    )
+
+    return {
+        'version': version,
+        'df': df,
+        'outcomes': outcomes,
+        'indicators_by_outcome': indicators_by_outcome,
+        'status_2024_counts': {status: int(status_2024_counts.get(status, 0)) for status in DISPLAY_STATUSES},
+        'status_midterm_counts': {status: int(status_midterm_counts.get(status, 0)) for status in DISPLAY_STATUSES},
+        'indicators_by_status': indicators_by_status,
+        'total_outcomes': len(outcomes),
+        'total_indicators': len(df),
+    }
+
+
+@lru_cache(maxsize=None)
+def get_matrix_data():
+    """Cleaned matrix.xlsx frame and its version. A missing file gives an empty frame."""
+    version = file_version(os.path.join(DATA_DIR, MATRIX_WORKBOOK))
+    try:
+        df = pd.read_excel(os.path.join(DATA_DIR, MATRIX_WORKBOOK))
+    except FileNotFoundError:
+        print(f"Error: {MATRIX_WORKBOOK} file not found. Using empty DataFrame.")
+        df = pd.DataFrame(columns=[MATRIX_PILLAR_COL, MATRIX_OUTCOME_COL, INDICATOR_COL, UNITS_COL])
+    df.columns = [str(col).strip() for col in df.columns]
+    df[UNITS_COL] = df[UNITS_COL].str.replace('Percent', '%', regex=False)
+    return {'version': version, 'df': df}
+
+
+def snapshot_version():
+    """Version of the loaded data snapshot: every sector workbook plus the matrix.
+
+    Built from the versions the cached frames were loaded with, so anything keyed on it
+    (indexes, aggregates) always matches the data it was computed from.
+    """
+    versions = [get_sector_data(sector['key'])['version'] for sector in SECTORS]
+    versions.append(get_matrix_data()['version'])
+    return hashlib.sha1('|'.join(versions).encode()).hexdigest()[:16]
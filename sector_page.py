@@ -0,0 +1,558 @@
+# sector_page.py
+#
+# Sector page engine: one layout builder and one set of callbacks shared by every SSP
+# sector page. What differs between sectors (workbook, pie colours, summary bullets)
+# comes from sector_config.SECTORS; pages/sectors.py registers the pages.
+
+import dash
+from dash import html, dcc, Input, Output, State, MATCH, ClientsideFunction
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from figure_cache import cached_figure
+from figures import status_pie, sparkline, SECTOR_PIE_LAYOUT
+from history import indicator_series, period_label
+from simulator import simulator_panel, register_simulator_callbacks
+from typeahead import cached_prefix_index, typeahead_options, TYPEAHEAD_LIMIT
+from sector_data import (
+    get_sector_data, DISPLAY_STATUSES, STATUS_PERIODS, INDICATOR_COL, UNITS_COL, BASELINE_COL,
+    TARGET_2024_COL, TARGET_MIDTERM_COL, CURRENT_COL, PROGRESS_2024_COL, PROGRESS_MIDTERM_COL,
+    DRIVERS_COL, CHALLENGES_COL, CATCHUP_COL
+)
+
+# Component IDs are pattern-matching dicts {'type': ..., 'sector': key} so that one pair
+# of callbacks (registered in register_callbacks) serves every sector page.
+DETAIL_TYPES = [
+    'sector-baseline', 'sector-target-2024', 'sector-target-midterm', 'sector-current',
+    'sector-progress-2024', 'sector-progress-midterm',
+    'sector-drivers', 'sector-challenges', 'sector-catchup', 'sector-history'
+]
+
+def sector_id(component_type, key):
+    return {'type': component_type, 'sector': key}
+
+# Inline style for 'value' summary segments
+SUMMARY_VALUE_STYLE = {'color': '#007bff', 'font-weight': 'bold'}
+
+
+# --- Helper Functions ---
+def pie_chart(data, title, palette):
+    return status_pie(data, title, colors=palette, text_orientation='radial', **SECTOR_PIE_LAYOUT)
+
+def create_progress_bar(value, label):
+    color = "success" if value >= 80 else "warning" if value >= 50 else "danger"
+    return dbc.Card([
+        dbc.CardHeader(label, className='progress-header', style={'font-weight': 'bold'}),
+        dbc.CardBody([
+            dbc.Progress(value=value, color=color, className="mb-3", style={'height': '20px'}),
+            html.Div(f"{value:.1f}%", className="progress-value", style={
+                'text-align': 'center',
+                'font-weight': 'bold',
+                'font-size': '1.1rem'
+            })
+        ])
+    ], className='progress-card', style={'height': '100%'})
+
+def format_value(value, unit):
+    if pd.isna(value):
+        return "N/A"
+    try:
+        return f"{float(value):.1f} {unit}" if unit else f"{float(value):.1f}"
+    except (ValueError, TypeError):
+        return f"{value} {unit}" if unit else str(value)
+
+def safe_percentage(value):
+    if pd.isna(value):
+        return 0
+    try:
+        return float(value) * 100
+    except (ValueError, TypeError):
+        return 0
+
+def summary_segment(segment):
+    if isinstance(segment, str):
+        return segment
+    style, text = segment
+    if style == 'strong':
+        return html.Strong(text)
+    if style == 'value':
+        return html.Span(text, style=SUMMARY_VALUE_STYLE)
+    return html.Span(text, className=style)
+
+def generate_summary_points(summary):
+    return [
+        html.Li([summary_segment(segment) for segment in bullet], className="summary-point")
+        for bullet in summary
+    ]
+
+def status_row(status, counts_2024, counts_midterm, last=False):
+    return html.Tr([
+        html.Td(status, className=f'status-cell {status.lower()}',
+                style={'font-weight': 'bold', 'text-align': 'left'}),
+        html.Td(counts_2024.get(status, 0),
+                style={'text-align': 'center', 'font-weight': 'bold'}),
+        html.Td(counts_midterm.get(status, 0),
+                style={'text-align': 'center', 'font-weight': 'bold'})
+    ], style={} if last else {'border-bottom': '1px solid #dee2e6'})
+
+def indicator_card(label, value_id):
+    return dbc.Card([
+        dbc.CardHeader(label, className='indicator-header',
+                       style={'background-color': '#f8f9fa', 'font-weight': 'bold'}),
+        dbc.CardBody([
+            html.Div(id=value_id, className="indicator-value",
+                     style={'font-size': '1.5rem', 'font-weight': 'bold', 'text-align': 'center'})
+        ])
+    ], className='indicator-card')
+
+
+# --- Layout of a sector page ---
+def build_layout(sector):
+    key = sector['key']
+    data = get_sector_data(key)
+    outcomes = data['outcomes']
+    status_2024_counts = data['status_2024_counts']
+    status_midterm_counts = data['status_midterm_counts']
+
+    return html.Div([
+        html.Div(className='main-content-wrapper', children=[
+
+            # 1. Top Row - Metrics and Summary
+            dbc.Row(className='top-row', children=[
+                # Metrics Cards
+                dbc.Col(className='metrics-col', width=3, children=[
+                    dbc.Row([
+                        dbc.Col(dbc.Card([
+                            dbc.CardHeader(html.Div("TOTAL OUTCOMES", className="metric-header"),
+                                           style={'background': 'linear-gradient(135deg, #6a11cb 0%, #2575fc 100%)'}),
+                            dbc.CardBody([
+                                html.Div(str(data['total_outcomes']), className="metric-number",
+                                         style={'color': '#6a11cb', 'text-shadow': '0 2px 4px rgba(106,17,203,0.3)'}),
+                                html.Div([
+                                    html.I(className="fas fa-chart-line metric-icon"),
+                                    ""
+                                ], className="metric-label"),
+                            ], style={'text-align': 'center'})
+                        ], className='metric-card', style={
+                            'border': 'none',
+                            'border-radius': '12px',
+                            'box-shadow': '0 6px 15px rgba(106,17,203,0.2)',
+                            'transition': 'transform 0.3s',
+                            'margin-bottom': '20px'
+                        }), width=12),
+
+                        dbc.Col(dbc.Card([
+                            dbc.CardHeader(html.Div("TOTAL INDICATORS", className="metric-header"),
+                                           style={'background': 'linear-gradient(135deg, #11998e 0%, #38ef7d 100%)'}),
+                            dbc.CardBody([
+                                html.Div(str(data['total_indicators']), className="metric-number",
+                                         style={'color': '#11998e', 'text-shadow': '0 2px 4px rgba(17,153,142,0.3)'}),
+                                html.Div([
+                                    html.I(className="fas fa-tasks metric-icon"),
+                                    ""
+                                ], className="metric-label"),
+                            ], style={'text-align': 'center'})
+                        ], className='metric-card', style={
+                            'border': 'none',
+                            'border-radius': '12px',
+                            'box-shadow': '0 6px 15px rgba(17,153,142,0.2)',
+                            'transition': 'transform 0.3s'
+                        }), width=12)
+                    ], style={'height': '30%'})
+                ]),
+
+                # Summary Card
+                dbc.Col(className='summary-col', width=9, children=[
+                    dbc.Card(className='summary-card', children=[
+                        dbc.CardHeader(
+                            html.Div([
+                                html.I(className="fas fa-chart-pie me-2"),
+                                "SECTOR PERFORMANCE HIGHLIGHTS"
+                            ]),
+                            className='summary-header',
+                            style={
+                                'background': 'linear-gradient(135deg, #2b5876 0%, #4e4376 100%)',
+                                'color': 'white',
+                                'font-size': '1.1rem',
+                                'font-weight': '600',
+                                'letter-spacing': '0.5px',
+                                'border-radius': '12px 12px 0 0'
+                            }
+                        ),
+                        dbc.CardBody([
+                            html.Ul(generate_summary_points(sector['summary']), className="summary-list", style={
+                                'padding-left': '20px',
+                                'list-style-type': 'none'
+                            })
+                        ], style={
+                            'background': 'rgba(248, 249, 250, 0.7)',
+                            'border-radius': '0 0 12px 12px',
+                            'padding': '20px'
+                        })
+                    ], style={
+                        'border': 'none',
+                        'border-radius': '12px',
+                        'box-shadow': '0 10px 20px rgba(0,0,0,0.1)',
+                        'height': '100%',
+                        'background': 'white'
+                    })
+                ])
+            ], style={'margin-bottom': '25px'}),
+
+            # 2. Status Section (Table and Pie Charts)
+            dbc.Row(className='status-section', children=[
+                # Status Table
+                dbc.Col(className='table-col', width=4, children=[
+                    dbc.Card([
+                        dbc.CardHeader("INDICATOR STATUS", className='table-header',
+                                       style={'background-color': '#343a40', 'color': 'white',
+                                              'font-weight': 'bold', 'padding': '10px',
+                                              'border-radius': '8px 8px 0 0'}),
+                        dbc.CardBody([
+                            dbc.Table([
+                                html.Thead([
+                                    html.Tr([
+                                        html.Th("Status", style={'width': '40%', 'text-align': 'left'}),
+                                        html.Th("Indicator Status based on 2024/25 Target", style={'width': '30%', 'text-align': 'center'}),
+                                        html.Th("Indicator Status based on MidTerm Target", style={'width': '30%', 'text-align': 'center'})
+                                    ], style={'background-color': '#f8f9fa'})
+                                ]),
+                                html.Tbody([
+                                    status_row(status, status_2024_counts, status_midterm_counts,
+                                               last=(status == DISPLAY_STATUSES[-1]))
+                                    for status in DISPLAY_STATUSES
+                                ])
+                            ], bordered=False, hover=True, responsive=True,
+                            style={
+                                'margin-bottom': '0',
+                                'width': '100%',
+                                'border': '1px solid #dee2e6',
+                                'border-radius': '0 0 8px 8px'
+                            },
+                            className="table-striped")
+                        ], style={'padding': '0'})
+                    ], style={
+                        'height': '100%',
+                        'border': 'none',
+                        'border-radius': '8px',
+                        'box-shadow': '0 4px 6px rgba(0,0,0,0.1)'
+                    })
+                ]),
+
+                # Pie Charts
+                # Clicking a slice lists that status's indicators (set_status_filter)
+                dbc.Col(className='pie-col', width=4, children=[
+                    dcc.Graph(
+                        id=sector_id('sector-pie-2024', key),
+                        figure=cached_figure(
+                            ('sector-pie', key, '2024/25'), data['version'],
+                            lambda: pie_chart(status_2024_counts, "2024/25 Target Status", sector['palette'])
+                        ),
+                        className='pie-chart',
+                        style={'height': '100%'}
+                    )
+                ]),
+                dbc.Col(className='pie-col', width=4, children=[
+                    dcc.Graph(
+                        id=sector_id('sector-pie-midterm', key),
+                        figure=cached_figure(
+                            ('sector-pie', key, 'midterm'), data['version'],
+                            lambda: pie_chart(status_midterm_counts, "MidTerm Target Status", sector['palette'])
+                        ),
+                        className='pie-chart',
+                        style={'height': '100%'}
+                    )
+                ])
+            ], style={'margin-bottom': '20px', 'align-items': 'stretch'}),
+
+            # 3. Selection Section
+            dbc.Row(className='selection-section', children=[
+                dbc.Col(width=6, children=[
+                    html.Label("SELECT OUTCOME", className="dropdown-label",
+                               style={'font-weight': 'bold', 'margin-bottom': '5px'}),
+                    dcc.Dropdown(
+                        id=sector_id('sector-outcome', key),
+                        options=[{'label': o, 'value': o} for o in outcomes],
+                        value=outcomes[0] if outcomes else None,
+                        className='outcome-dropdown',
+                        style={'border-radius': '4px', 'border': '1px solid #ced4da'}
+                    )
+                ]),
+                dbc.Col(width=6, children=[
+                    html.Label("SELECT INDICATOR", className="dropdown-label",
+                               style={'font-weight': 'bold', 'margin-bottom': '5px'}),
+                    dcc.Dropdown(
+                        id=sector_id('sector-indicator', key),
+                        options=indicator_options(key, outcomes[0]) if outcomes else [],
+                        className='indicator-dropdown',
+                        style={'border-radius': '4px', 'border': '1px solid #ced4da'}
+                    ),
+                    # Debounced selection ({'value', 'seq', 'client'}) that drives the detail callback
+                    dcc.Store(id=sector_id('sector-selection', key)),
+                    # Status filter set by clicking a pie slice ({'period', 'status'} or None)
+                    dcc.Store(id=sector_id('sector-status-filter', key))
+                ])
+            ], style={'margin-bottom': '20px'}),
+
+            # Indicators of the clicked pie slice
+            html.Div(id=sector_id('sector-status-panel', key), style={'display': 'none'}, children=[
+                dbc.Card([
+                    dbc.CardHeader(html.Div([
+                        html.Span(id=sector_id('sector-status-title', key), className="fw-bold"),
+                        html.Button("Clear filter", id=sector_id('sector-status-clear', key),
+                                    className='btn btn-sm btn-outline-secondary float-end')
+                    ])),
+                    dbc.CardBody(html.Ul(id=sector_id('sector-status-list', key), className='mb-0'))
+                ], style={'border-radius': '8px', 'box-shadow': '0 4px 6px rgba(0,0,0,0.1)'})
+            ]),
+
+            # 4. Indicator Metrics and Narrative
+            dbc.Row(className='indicator-narrative-section', children=[
+                # Indicator Metrics
+                dbc.Col(className='indicator-metrics-col', width=4, children=[
+                    dbc.Row([
+                        dbc.Col(indicator_card("Baseline", sector_id('sector-baseline', key)), width=6),
+                        dbc.Col(indicator_card("2024/25 Target", sector_id('sector-target-2024', key)), width=6)
+                    ], style={'margin-bottom': '15px'}),
+                    dbc.Row([
+                        dbc.Col(indicator_card("2026/27 Target", sector_id('sector-target-midterm', key)), width=6),
+                        dbc.Col(indicator_card("Current Progress", sector_id('sector-current', key)), width=6)
+                    ], style={'margin-bottom': '15px'}),
+                    # Progress Bars
+                    dbc.Row([
+                        dbc.Col(html.Div(id=sector_id('sector-progress-2024', key)), width=6),
+                        dbc.Col(html.Div(id=sector_id('sector-progress-midterm', key)), width=6)
+                    ], style={'margin-bottom': '15px'}),
+                    # Trend across data releases
+                    html.Div(id=sector_id('sector-history', key))
+                ]),
+
+                # Narrative Table
+                dbc.Col(className='narrative-col', width=8, children=[
+                    dbc.Card([
+                        dbc.CardHeader("Narrative Section", className='narrative-header',
+                                       style={'background-color': '#f8f9fa', 'font-weight': 'bold'}),
+                        dbc.CardBody([
+                            dbc.Table([
+                                html.Thead([
+                                    html.Tr([
+                                        html.Th("Major drivers of performance", className='narrative-th',
+                                                style={'background-color': '#343a40', 'color': 'white'}),
+                                        html.Th("Challenges", className='narrative-th',
+                                                style={'background-color': '#343a40', 'color': 'white'}),
+                                        html.Th("Catch up plans", className='narrative-th',
+                                                style={'background-color': '#343a40', 'color': 'white'})
+                                    ])
+                                ]),
+                                html.Tbody([
+                                    html.Tr([
+                                        html.Td(id=sector_id('sector-drivers', key), className='narrative-td',
+                                                style={'vertical-align': 'top', 'border-right': '1px solid #dee2e6'}),
+                                        html.Td(id=sector_id('sector-challenges', key), className='narrative-td',
+                                                style={'vertical-align': 'top', 'border-right': '1px solid #dee2e6'}),
+                                        html.Td(id=sector_id('sector-catchup', key), className='narrative-td',
+                                                style={'vertical-align': 'top'})
+                                    ])
+                                ])
+                            ], bordered=True, hover=True, responsive=True,
+                            style={'margin-bottom': '0', 'border': '1px solid #dee2e6'})
+                        ])
+                    ], style={'height': '100%'})
+                ])
+            ], style={'align-items': 'stretch'}),
+
+            # What-if simulator (simulator.py)
+            simulator_panel(key)
+        ])
+    ])
+
+
+# --- Callbacks ---
+def outcome_indicator_index(key, outcome):
+    data = get_sector_data(key)
+    return cached_prefix_index(
+        (key, outcome), data['version'], lambda: data['indicators_by_outcome'].get(outcome, [])
+    )
+
+def status_indicator_index(key, period, status):
+    data = get_sector_data(key)
+    return cached_prefix_index(
+        (key, 'status', period, status), data['version'],
+        lambda: data['indicators_by_status'].get(period, {}).get(status, [])
+    )
+
+def indicator_options(key, selected_outcome, search_value=None, selected_indicator=None, status_filter=None):
+    """Top indicator options for search_value (typeahead.TYPEAHEAD_LIMIT at most).
+
+    The options come from the selected outcome, or from the clicked pie slice when
+    status_filter ({'period', 'status'}) is set. A pie slice offers every one of its
+    indicators, as listed in the status panel, not only the first TYPEAHEAD_LIMIT.
+    """
+    data = get_sector_data(key)
+    if status_filter:
+        index = status_indicator_index(key, status_filter['period'], status_filter['status'])
+        limit = max(len(index['labels']), TYPEAHEAD_LIMIT)
+    elif selected_outcome and not data['df'].empty:
+        index = outcome_indicator_index(key, selected_outcome)
+        limit = TYPEAHEAD_LIMIT
+    else:
+        raise PreventUpdate
+    return typeahead_options(index, search_value, selected_indicator, limit)
+
+def status_filter_from_click(component_type, click_data):
+    """{'period', 'status'} for a click on one of the sector pies."""
+    points = (click_data or {}).get('points') or []
+    if not points or points[0].get('label') not in DISPLAY_STATUSES:
+        return None
+    period = STATUS_PERIODS[0] if component_type == 'sector-pie-2024' else STATUS_PERIODS[1]
+    return {'period': period, 'status': points[0]['label']}
+
+def history_card(key, indicator, unit):
+    """Sparkline of the indicator's current value over the recorded data releases."""
+    series = indicator_series(key, indicator)
+    if series is None or len(series['snapshots']) < 2:
+        body = html.P("The trend is shown once more than one data release has been recorded.",
+                      className='text-muted mb-0')
+    else:
+        labels = [f"{period_label(snapshot['period'])} #{snapshot['seq']}" for snapshot in series['snapshots']]
+        body = dcc.Graph(figure=sparkline(labels, series['current'], yaxis_title=unit or None),
+                         config={'displayModeBar': False})
+    return dbc.Card([
+        dbc.CardHeader("CURRENT VALUE ACROSS DATA RELEASES", className='progress-header',
+                       style={'font-weight': 'bold'}),
+        dbc.CardBody(body)
+    ], className='progress-card')
+
+def indicator_details(key, selected_indicator):
+    df = get_sector_data(key)['df']
+    if not selected_indicator or df.empty:
+        raise PreventUpdate
+
+    indicator_rows = df[df[INDICATOR_COL] == selected_indicator]
+    if indicator_rows.empty:
+        raise PreventUpdate
+
+    indicator_row = indicator_rows.iloc[0]
+    unit = indicator_row.get(UNITS_COL, '')
+
+    progress_2024_bar = create_progress_bar(
+        safe_percentage(indicator_row.get(PROGRESS_2024_COL)),
+        "FY2024/25 PERCENTAGE PROGRESS"
+    )
+    progress_midterm_bar = create_progress_bar(
+        safe_percentage(indicator_row.get(PROGRESS_MIDTERM_COL)),
+        "NST2 MIDTERM PERCENTAGE PROGRESS"
+    )
+
+    return (
+        format_value(indicator_row.get(BASELINE_COL), unit),
+        format_value(indicator_row.get(TARGET_2024_COL), unit),
+        format_value(indicator_row.get(TARGET_MIDTERM_COL), unit),
+        format_value(indicator_row.get(CURRENT_COL), unit),
+        progress_2024_bar,
+        progress_midterm_bar,
+        indicator_row.get(DRIVERS_COL, 'No data available'),
+        indicator_row.get(CHALLENGES_COL, 'No data available'),
+        indicator_row.get(CATCHUP_COL, 'No data available'),
+        history_card(key, selected_indicator, unit if isinstance(unit, str) else '')
+    )
+
+# Latest selection sequence number seen per (browser tab, sector). A selection that arrives
+# after a newer one from the same tab is stale and is not rendered.
+MAX_TRACKED_SELECTIONS = 10000
+_latest_selection = OrderedDict()
+_latest_selection_lock = threading.Lock()
+
+def is_stale_selection(key, selection):
+    token = (selection.get('client'), key)
+    seq = selection.get('seq', 0)
+    with _latest_selection_lock:
+        if seq < _latest_selection.get(token, -1):
+            return True
+        _latest_selection[token] = seq
+        _latest_selection.move_to_end(token)
+        while len(_latest_selection) > MAX_TRACKED_SELECTIONS:
+            _latest_selection.popitem(last=False)
+    return False
+
+def register_callbacks():
+    # Registered once for all sectors; MATCH pairs the outputs with the page that fired
+    # A click on a pie slice filters the indicators to that status; choosing another
+    # outcome or "Clear filter" removes the filter. The list is one dictionary lookup in
+    # the status index built when the workbook was loaded.
+    @dash.callback(
+        Output({'type': 'sector-status-filter', 'sector': MATCH}, 'data'),
+        Output({'type': 'sector-status-panel', 'sector': MATCH}, 'style'),
+        Output({'type': 'sector-status-title', 'sector': MATCH}, 'children'),
+        Output({'type': 'sector-status-list', 'sector': MATCH}, 'children'),
+        Input({'type': 'sector-pie-2024', 'sector': MATCH}, 'clickData'),
+        Input({'type': 'sector-pie-midterm', 'sector': MATCH}, 'clickData'),
+        Input({'type': 'sector-status-clear', 'sector': MATCH}, 'n_clicks'),
+        Input({'type': 'sector-outcome', 'sector': MATCH}, 'value'),
+        State({'type': 'sector-outcome', 'sector': MATCH}, 'id'),
+        prevent_initial_call=True
+    )
+    def set_status_filter(click_2024, click_midterm, clear_clicks, selected_outcome, outcome_id):
+        triggered_type = dash.ctx.triggered_id['type'] if dash.ctx.triggered_id else None
+        status_filter = None
+        if triggered_type == 'sector-pie-2024':
+            status_filter = status_filter_from_click(triggered_type, click_2024)
+        elif triggered_type == 'sector-pie-midterm':
+            status_filter = status_filter_from_click(triggered_type, click_midterm)
+        if not status_filter:
+            return None, {'display': 'none'}, '', []
+
+        data = get_sector_data(outcome_id['sector'])
+        indicators = data['indicators_by_status'][status_filter['period']][status_filter['status']]
+        period_label = '2024/25 target' if status_filter['period'] == STATUS_PERIODS[0] else 'midterm target'
+        title = f"{status_filter['status']} indicators ({period_label}): {len(indicators)}"
+        return (status_filter, {'display': 'block', 'margin-bottom': '20px'}, title,
+                [html.Li(indicator) for indicator in indicators])
+
+    # Options are filtered on the server: a new outcome or status filter resets the list
+    # and the selection, typing in the indicator dropdown (search_value) only replaces the list
+    @dash.callback(
+        Output({'type': 'sector-indicator', 'sector': MATCH}, 'options'),
+        Output({'type': 'sector-indicator', 'sector': MATCH}, 'value'),
+        Input({'type': 'sector-outcome', 'sector': MATCH}, 'value'),
+        Input({'type': 'sector-indicator', 'sector': MATCH}, 'search_value'),
+        Input({'type': 'sector-status-filter', 'sector': MATCH}, 'data'),
+        State({'type': 'sector-outcome', 'sector': MATCH}, 'id'),
+        State({'type': 'sector-indicator', 'sector': MATCH}, 'value'),
+        prevent_initial_call=True
+    )
+    def update_indicators(selected_outcome, search_value, status_filter, outcome_id, selected_indicator):
+        key = outcome_id['sector']
+        if dash.ctx.triggered_id and dash.ctx.triggered_id['type'] == 'sector-indicator':
+            options = indicator_options(key, selected_outcome, search_value, selected_indicator, status_filter)
+            return options, dash.no_update
+        options = indicator_options(key, selected_outcome, status_filter=status_filter)
+        return options, options[0]['value'] if options else None
+
+    # Indicator changes are debounced in the browser (assets/debounce.js), so scrolling
+    # through the dropdown only sends the selection the user settles on
+    dash.clientside_callback(
+        ClientsideFunction(namespace='nst2', function_name='debounceSelection'),
+        Output({'type': 'sector-selection', 'sector': MATCH}, 'data'),
+        Input({'type': 'sector-indicator', 'sector': MATCH}, 'value'),
+        State({'type': 'sector-indicator', 'sector': MATCH}, 'id'),
+        prevent_initial_call=True
+    )
+
+    @dash.callback(
+        [Output({'type': detail_type, 'sector': MATCH}, 'children') for detail_type in DETAIL_TYPES],
+        Input({'type': 'sector-selection', 'sector': MATCH}, 'data'),
+        State({'type': 'sector-selection', 'sector': MATCH}, 'id'),
+        prevent_initial_call=True
+    )
+    def update_indicator_data(selection, selection_id):
+        key = selection_id['sector']
+        if not selection or is_stale_selection(key, selection):
+            raise PreventUpdate
+        return indicator_details(key, selection.get('value'))
+
+    register_simulator_callbacks()
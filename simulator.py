@@ -0,0 +1,234 @@
+# simulator.py
+#
+# What-if simulator on the sector pages: "if these indicators reach their target, what
+# do the status pies look like?". The user picks indicators, edits their current value
+# and the whole sector is recomputed with status_engine.recompute.
+#
+# The numeric arrays and the reported progress and statuses of every sector are built
+# once per data snapshot. An edit starts from the reported figures and reruns the kernel
+# on the edited rows only; no DataFrame is touched. With no edits the what-if pies are
+# the page's reported pies, so a difference comes from the edits alone.
+
+import threading
+
+import dash
+import dash_bootstrap_components as dbc
+import numpy as np
+from dash import html, dcc, dash_table, Input, Output, State, MATCH
+from dash.exceptions import PreventUpdate
+
+from catalogue import get_catalogue, NOT_RATED
+from figures import status_pie, SECTOR_PIE_LAYOUT
+from sector_config import SECTORS_BY_KEY
+from sector_data import DISPLAY_STATUSES, STATUS_PERIODS
+from status_engine import indicator_arrays, numeric, recompute
+
+PERIOD_TITLES = {'2024/25': "What-if: 2024/25 Target Status", 'midterm': "What-if: MidTerm Target Status"}
+# recompute() result key of each period
+PERIOD_FIELDS = {'2024/25': '2024', 'midterm': 'midterm'}
+# Reported figures the simulation starts from
+RESULT_FIELDS = ['progress_2024', 'progress_midterm', 'status_2024', 'status_midterm']
+
+
+def sim_id(component_type, key):
+    return {'type': component_type, 'sector': key}
+
+
+# --- Kernel ---
+def build_simulation_bases(catalogue):
+    """{sector key: {'indicators', 'units', 'arrays', 'base'}} for every sector; 'base' holds
+    the reported progress and statuses."""
+    bases = {}
+    for key, rows in catalogue.groupby('source', sort=False).indices.items():
+        sector_rows = catalogue.iloc[rows]
+        bases[key] = {
+            'indicators': sector_rows['indicator'].tolist(),
+            'units': sector_rows['units'].fillna('').astype(str).str.strip().tolist(),
+            'arrays': indicator_arrays(sector_rows),
+            'base': {
+                'progress_2024': numeric(sector_rows['progress_2024']),
+                'progress_midterm': numeric(sector_rows['progress_midterm']),
+                'status_2024': sector_rows['status_2024'].to_numpy(dtype=object),
+                'status_midterm': sector_rows['status_midterm'].to_numpy(dtype=object),
+            },
+        }
+    return bases
+
+
+_bases_lock = threading.Lock()
+_current_bases = {'version': None, 'bases': None}
+
+
+def get_simulation_base(key):
+    """(version, simulation base of sector key) for the current data snapshot.
+
+    The base is None for a sector without indicators in the catalogue.
+    """
+    version, catalogue = get_catalogue()
+    with _bases_lock:
+        if _current_bases['version'] != version:
+            _current_bases['bases'] = build_simulation_bases(catalogue)
+            _current_bases['version'] = version
+        return version, _current_bases['bases'].get(key)
+
+
+def simulate(base, overrides):
+    """Reported progress and statuses of the sector, with the rows in overrides ({row:
+    current value}) recomputed from their new value."""
+    result = {field: base['base'][field].copy() for field in RESULT_FIELDS}
+    if not overrides:
+        return result
+    rows = np.fromiter(overrides, dtype=np.int64, count=len(overrides))
+    arrays = {field: values[rows] for field, values in base['arrays'].items()}
+    arrays['current'] = np.fromiter(overrides.values(), dtype=float, count=len(overrides))
+    computed = recompute(arrays, not_rated=NOT_RATED)
+    for field in RESULT_FIELDS:
+        result[field][rows] = computed[field]
+    return result
+
+
+def status_counts(statuses):
+    return {status: int(np.count_nonzero(statuses == status)) for status in DISPLAY_STATUSES}
+
+
+def mean_progress(progress):
+    """Mean progress in percent, each indicator capped at 100% (None without data)."""
+    values = progress[~np.isnan(progress)]
+    return float(np.clip(values, 0, 1).mean() * 100) if len(values) else None
+
+
+# --- Layout ---
+def table_row(base, row, value=None):
+    arrays = base['arrays']
+    number = lambda x: None if np.isnan(x) else float(x)
+    target = arrays['target_midterm'][row]
+    default = target if not np.isnan(target) else arrays['current'][row]
+    return {
+        'row': row,
+        'indicator': base['indicators'][row],
+        'unit': base['units'][row],
+        'current': number(arrays['current'][row]),
+        'target_2024': number(arrays['target_2024'][row]),
+        'target_midterm': number(target),
+        'what_if': number(default) if value is None else value,
+    }
+
+
+def simulator_panel(key):
+    _, base = get_simulation_base(key)
+    if base is None:
+        return None
+    return dbc.Card([
+        dbc.CardHeader("WHAT-IF SIMULATOR", className='narrative-header',
+                       style={'background-color': '#f8f9fa', 'font-weight': 'bold'}),
+        dbc.CardBody([
+            html.Label("Indicators to change (what-if values start at the 2026/27 target)",
+                       className='dropdown-label'),
+            dcc.Dropdown(
+                id=sim_id('sim-indicators', key),
+                options=[{'label': name, 'value': row} for row, name in enumerate(base['indicators'])],
+                multi=True,
+                placeholder='Choose indicators...',
+            ),
+            dash_table.DataTable(
+                id=sim_id('sim-table', key),
+                columns=[
+                    {'name': 'Indicator', 'id': 'indicator', 'editable': False},
+                    {'name': 'Unit', 'id': 'unit', 'editable': False},
+                    {'name': 'Current', 'id': 'current', 'type': 'numeric', 'editable': False},
+                    {'name': '2024/25 Target', 'id': 'target_2024', 'type': 'numeric', 'editable': False},
+                    {'name': '2026/27 Target', 'id': 'target_midterm', 'type': 'numeric', 'editable': False},
+                    {'name': 'What-if value', 'id': 'what_if', 'type': 'numeric', 'editable': True},
+                ],
+                data=[],
+                editable=True,
+                style_table={'margin': '15px 0', 'overflowX': 'auto'},
+                style_cell={'textAlign': 'left', 'padding': '6px', 'whiteSpace': 'normal', 'height': 'auto'},
+                style_data_conditional=[
+                    {'if': {'column_id': 'what_if'}, 'backgroundColor': '#fff8e1', 'fontWeight': 'bold'}
+                ],
+            ),
+            dbc.Row([
+                dbc.Col(dcc.Graph(id=sim_id('sim-pie-2024', key), config={'displayModeBar': False}), width=4),
+                dbc.Col(dcc.Graph(id=sim_id('sim-pie-midterm', key), config={'displayModeBar': False}), width=4),
+                dbc.Col(html.Div(id=sim_id('sim-summary', key)), width=4),
+            ]),
+        ])
+    ], style={'margin-top': '20px', 'border-radius': '8px', 'box-shadow': '0 4px 6px rgba(0,0,0,0.1)'})
+
+
+def summary_table(base, result):
+    header = html.Tr([html.Th("Status"), html.Th("Period"), html.Th("Now"), html.Th("What-if")])
+    rows = []
+    for period in STATUS_PERIODS:
+        field = PERIOD_FIELDS[period]
+        now = status_counts(base['base'][f'status_{field}'])
+        what_if = status_counts(result[f'status_{field}'])
+        for status in DISPLAY_STATUSES:
+            changed = now[status] != what_if[status]
+            rows.append(html.Tr([
+                html.Td(status, className=f'status-cell {status.lower()}'),
+                html.Td(period),
+                html.Td(now[status]),
+                html.Td(what_if[status], style={'font-weight': 'bold'} if changed else {}),
+            ]))
+    averages = []
+    for period in STATUS_PERIODS:
+        field = PERIOD_FIELDS[period]
+        now, what_if = mean_progress(base['base'][f'progress_{field}']), mean_progress(result[f'progress_{field}'])
+        if now is not None:
+            averages.append(html.Li(f"Average progress ({period}): {now:.1f}% → {what_if:.1f}%"))
+    return html.Div([
+        dbc.Table([html.Thead(header), html.Tbody(rows)], bordered=True, size='sm'),
+        html.Ul(averages, className='mb-0'),
+    ])
+
+
+# --- Callbacks ---
+def register_simulator_callbacks():
+    # Selecting indicators adds/removes table rows; values already edited are kept
+    @dash.callback(
+        Output({'type': 'sim-table', 'sector': MATCH}, 'data'),
+        Input({'type': 'sim-indicators', 'sector': MATCH}, 'value'),
+        State({'type': 'sim-table', 'sector': MATCH}, 'data'),
+        State({'type': 'sim-indicators', 'sector': MATCH}, 'id'),
+        prevent_initial_call=True
+    )
+    def update_simulator_rows(selected_rows, table_data, component_id):
+        _, base = get_simulation_base(component_id['sector'])
+        if base is None:
+            raise PreventUpdate
+        edited = {item['row']: item.get('what_if') for item in table_data or []}
+        return [table_row(base, row, edited.get(row)) for row in selected_rows or []
+                if 0 <= row < len(base['indicators'])]
+
+    # Every edit recomputes the whole sector (a few hundred microseconds)
+    @dash.callback(
+        Output({'type': 'sim-pie-2024', 'sector': MATCH}, 'figure'),
+        Output({'type': 'sim-pie-midterm', 'sector': MATCH}, 'figure'),
+        Output({'type': 'sim-summary', 'sector': MATCH}, 'children'),
+        Input({'type': 'sim-table', 'sector': MATCH}, 'data'),
+        State({'type': 'sim-table', 'sector': MATCH}, 'id'),
+    )
+    def update_simulation(table_data, component_id):
+        key = component_id['sector']
+        _, base = get_simulation_base(key)
+        if base is None:
+            raise PreventUpdate
+        overrides = {}
+        for item in table_data or []:
+            try:
+                row, value = int(item['row']), float(item['what_if'])
+            except (TypeError, ValueError, KeyError):
+                continue
+            # The table data comes from the browser: only rows of this sector
+            if 0 <= row < len(base['indicators']):
+                overrides[row] = value
+        result = simulate(base, overrides)
+        palette = SECTORS_BY_KEY[key]['palette'] if key in SECTORS_BY_KEY else None
+        pies = [
+            status_pie(status_counts(result[f'status_{PERIOD_FIELDS[period]}']), PERIOD_TITLES[period],
+                       colors=palette, text_orientation='radial', **SECTOR_PIE_LAYOUT)
+            for period in STATUS_PERIODS
+        ]
+        return pies[0], pies[1], summary_table(base, result)
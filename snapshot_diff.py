@@ -0,0 +1,298 @@
+# snapshot_diff.py
+#
+# What changed between two data releases: indicators added or removed, statuses that
+# moved, values revised and narratives edited.
+#
+# Every data snapshot the app loads is recorded in SNAPSHOT_DIR (record_snapshot, called
+# at start-up): the catalogue's SNAPSHOT_FIELDS as a gzipped pickle named
+# <UTC time>-<snapshot version>, so the releases list in the order they arrived. Every
+# gunicorn worker calls it; a lock file makes one of them write the release (through a
+# temporary file of its own) and the others find it recorded.
+#
+# diff_snapshots joins two snapshots on a stable indicator key - (source, outcome,
+# indicator) with case and spacing ignored, plus an occurrence number for names repeated
+# under one outcome, all as integer codes - with one hash join (DataFrame.merge) of the
+# keys and row positions, then compares every field column-wise. Numbers are compared
+# as numbers ('5' == 5.0), anything else as cleaned text; only cells whose raw values
+# differ reach that slower comparison. The report has one row per changed field
+# (REPORT_COLUMNS); diffs are cached per pair of snapshots.
+
+import datetime
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from catalogue import get_catalogue, clean_text
+from file_lock import exclusive_lock
+from sector_data import DATA_DIR
+from status_engine import numeric
+from table_query import display_value
+
+SNAPSHOT_DIR = os.path.join(DATA_DIR, 'snapshots')
+SNAPSHOT_SUFFIX = '.pkl.gz'
+SNAPSHOT_NAME = re.compile(r'^\d{8}T\d{6}Z-[0-9a-f]+$')
+LOCK_PATH = os.path.join(SNAPSHOT_DIR, '.lock')
+
+KEY_FIELDS = ['source', 'outcome', 'indicator']
+LABEL_FIELDS = ['source_label', 'pillar']
+STATUS_FIELDS = ['status_2024', 'status_midterm']
+VALUE_FIELDS = [
+    'units', 'baseline', 'target_2024', 'target_midterm', 'target_2028', 'current',
+    'progress_2024', 'progress_midterm',
+]
+NARRATIVE_FIELDS = ['drivers', 'challenges', 'catchup']
+SNAPSHOT_FIELDS = KEY_FIELDS + LABEL_FIELDS + STATUS_FIELDS + VALUE_FIELDS + NARRATIVE_FIELDS
+# Join columns built from KEY_FIELDS (see indicator_keys)
+KEY_COLUMNS = ['_source', '_outcome', '_indicator', '_occurrence']
+
+# Change types, in report order
+ADDED = 'Added'
+REMOVED = 'Removed'
+STATUS_CHANGED = 'Status changed'
+VALUE_REVISED = 'Value revised'
+NARRATIVE_EDITED = 'Narrative edited'
+CHANGE_TYPES = [ADDED, REMOVED, STATUS_CHANGED, VALUE_REVISED, NARRATIVE_EDITED]
+
+# Compared field -> change type it is reported as
+FIELD_CHANGES = OrderedDict(
+    [(field, STATUS_CHANGED) for field in STATUS_FIELDS] +
+    [(field, VALUE_REVISED) for field in VALUE_FIELDS] +
+    [(field, NARRATIVE_EDITED) for field in NARRATIVE_FIELDS]
+)
+
+REPORT_COLUMNS = ['change', 'source', 'source_label', 'pillar', 'outcome', 'indicator', 'field', 'old', 'new']
+
+# Columns of the change report as shown on the "What changed" page and in its downloads
+DISPLAY_COLUMNS = [
+    ('change', 'Change'), ('source_label', 'Sector'), ('pillar', 'Pillar'), ('outcome', 'Outcome'),
+    ('indicator', 'Indicator'), ('field', 'Field'), ('old', 'Old value'), ('new', 'New value'),
+]
+FIELD_LABELS = {
+    'status_2024': 'Status (2024/25)', 'status_midterm': 'Status (2026/27)', 'units': 'Units',
+    'baseline': 'Baseline', 'target_2024': '2024/25 target', 'target_midterm': '2026/27 target',
+    'target_2028': '2028/29 target', 'current': 'Current', 'progress_2024': 'Progress 2024/25 (%)',
+    'progress_midterm': 'Progress 2026/27 (%)', 'drivers': 'Major drivers of performance',
+    'challenges': 'Challenges', 'catchup': 'Catch up plans',
+}
+
+# Numbers closer than this (relative) are the same value (Excel float noise)
+RELATIVE_TOLERANCE = 1e-9
+
+# Diffs kept in memory
+DIFF_CACHE_SIZE = 16
+
+
+# --- Snapshots ---
+def snapshot_path(name):
+    if not SNAPSHOT_NAME.match(name or ''):
+        raise ValueError(f"Invalid snapshot name {name!r}")
+    return os.path.join(SNAPSHOT_DIR, name + SNAPSHOT_SUFFIX)
+
+
+def snapshot_version(name):
+    return name.rsplit('-', 1)[1]
+
+
+def list_snapshots():
+    """Recorded snapshot names, oldest first."""
+    if not os.path.isdir(SNAPSHOT_DIR):
+        return []
+    names = [f[:-len(SNAPSHOT_SUFFIX)] for f in os.listdir(SNAPSHOT_DIR) if f.endswith(SNAPSHOT_SUFFIX)]
+    return sorted(name for name in names if SNAPSHOT_NAME.match(name))
+
+
+def snapshot_label(name):
+    """'2025-07-01 09:30 UTC (3f2a9c1d)' for a snapshot name."""
+    saved = datetime.datetime.strptime(name.split('-', 1)[0], '%Y%m%dT%H%M%SZ')
+    return f"{saved:%Y-%m-%d %H:%M} UTC ({snapshot_version(name)[:8]})"
+
+
+def current_snapshot():
+    """(version, SNAPSHOT_FIELDS frame) of the loaded data."""
+    version, catalogue = get_catalogue()
+    return version, catalogue[SNAPSHOT_FIELDS]
+
+
+def record_snapshot():
+    """Save the loaded data snapshot unless it is already recorded; returns its name."""
+    version, snapshot = current_snapshot()
+    with exclusive_lock(LOCK_PATH):
+        for name in list_snapshots():
+            if snapshot_version(name) == version:
+                return name
+        name = f"{datetime.datetime.now(datetime.timezone.utc):%Y%m%dT%H%M%SZ}-{version}"
+        handle, tmp_path = tempfile.mkstemp(dir=SNAPSHOT_DIR, suffix='.tmp')
+        os.close(handle)
+        try:
+            snapshot.to_pickle(tmp_path, compression='gzip')
+            os.replace(tmp_path, snapshot_path(name))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    return name
+
+
+def load_snapshot(name):
+    """SNAPSHOT_FIELDS frame of a recorded snapshot (the loaded data is not re-read)."""
+    version, snapshot = current_snapshot()
+    if snapshot_version(name) == version:
+        return snapshot
+    return pd.read_pickle(snapshot_path(name), compression='gzip').reindex(columns=SNAPSHOT_FIELDS)
+
+
+# --- Diff ---
+def normalized_names(values):
+    """(codes, names) of a Series of names with case and spacing ignored: value i is
+    names[codes[i]]. Names repeat a lot (outcomes above all), so each distinct name is
+    normalised once."""
+    codes, names = pd.factorize(values.fillna('').astype(str))
+    return codes, names.str.lower().str.split().str.join(' ').to_numpy()
+
+
+def indicator_keys(old, new):
+    """Integer key columns (KEY_COLUMNS) of both snapshots: source, outcome and
+    indicator ignoring case and spacing, numbered jointly over the two snapshots, and the
+    occurrence of that triple within its snapshot."""
+    keys = pd.DataFrame(index=range(len(old) + len(new)))
+    for field, column in zip(KEY_FIELDS, KEY_COLUMNS):
+        values = pd.concat([old[field], new[field]], ignore_index=True)
+        codes, names = normalized_names(values)
+        keys[column] = pd.factorize(names)[0][codes]
+    old_keys, new_keys = keys.iloc[:len(old)].reset_index(drop=True), keys.iloc[len(old):].reset_index(drop=True)
+    for frame in (old_keys, new_keys):
+        frame[KEY_COLUMNS[-1]] = frame.groupby(KEY_COLUMNS[:-1], sort=False).cumcount()
+    return old_keys, new_keys
+
+
+def changed_cells(old, new):
+    """Boolean array: True where the old and new values (object arrays) differ."""
+    old_missing, new_missing = pd.isna(old), pd.isna(new)
+    # Cheap pass: identical raw values (or both empty) are unchanged
+    candidates = np.flatnonzero(~((old == new) | (old_missing & new_missing)))
+    changed = np.zeros(len(old), dtype=bool)
+    if not len(candidates):
+        return changed
+    old_numbers, new_numbers = numeric(old[candidates]), numeric(new[candidates])
+    both_numbers = np.isfinite(old_numbers) & np.isfinite(new_numbers)
+    scale = np.maximum(np.abs(old_numbers), np.abs(new_numbers))
+    with np.errstate(invalid='ignore'):
+        number_changed = np.abs(old_numbers - new_numbers) > RELATIVE_TOLERANCE * scale
+    text_changed = np.array([
+        clean_text(a) != clean_text(b) for a, b in zip(old[candidates], new[candidates])
+    ], dtype=bool)
+    changed[candidates] = np.where(both_numbers, number_changed, text_changed)
+    return changed
+
+
+def report_frame(change, snapshot, rows, field='', old_values=None, new_values=None):
+    """Report rows of one change type; rows are positions in snapshot, which gives the
+    identity (KEY_FIELDS and LABEL_FIELDS) of each row."""
+    frame = pd.DataFrame({
+        field_name: snapshot[field_name].to_numpy(dtype=object)[rows]
+        for field_name in KEY_FIELDS + LABEL_FIELDS
+    })
+    frame.insert(0, 'change', change)
+    frame['field'] = field
+    frame['old'] = old_values
+    frame['new'] = new_values
+    frame['_row'] = rows
+    return frame
+
+
+def diff_snapshots(old, new):
+    """Change report (REPORT_COLUMNS) of the new snapshot against the old one."""
+    old, new = old.reset_index(drop=True), new.reset_index(drop=True)
+    old_keys, new_keys = indicator_keys(old, new)
+    # Only the keys and row positions are joined; values are then taken by position
+    joined = old_keys.assign(_old=np.arange(len(old))).merge(
+        new_keys.assign(_new=np.arange(len(new))), on=KEY_COLUMNS, how='outer', sort=False
+    )
+    old_rows = joined['_old'].fillna(-1).to_numpy(dtype=np.int64)
+    new_rows = joined['_new'].fillna(-1).to_numpy(dtype=np.int64)
+    both = (old_rows >= 0) & (new_rows >= 0)
+    matched_old, matched_new = old_rows[both], new_rows[both]
+
+    frames = [
+        report_frame(ADDED, new, new_rows[old_rows < 0]),
+        report_frame(REMOVED, old, old_rows[new_rows < 0]),
+    ]
+    for field, change in FIELD_CHANGES.items():
+        old_values = old[field].to_numpy(dtype=object)[matched_old]
+        new_values = new[field].to_numpy(dtype=object)[matched_new]
+        changed = changed_cells(old_values, new_values)
+        frames.append(report_frame(change, new, matched_new[changed], field,
+                                   old_values[changed], new_values[changed]))
+    report = pd.concat(frames, ignore_index=True)
+    # Change type, then snapshot order (fields in FIELD_CHANGES order within a row)
+    report['_order'] = report['change'].map({change: n for n, change in enumerate(CHANGE_TYPES)})
+    report = report.sort_values(['_order', '_row'], kind='stable')
+    return report[REPORT_COLUMNS].reset_index(drop=True)
+
+
+def filter_report(report, changes=None):
+    """Report rows of the given change types (all of them when changes is None)."""
+    if changes is None:
+        return report
+    return report[report['change'].isin(changes).to_numpy()]
+
+
+def display_records(report):
+    """Report rows as dicts of DISPLAY_COLUMNS display values."""
+    fields = [field for field, _ in DISPLAY_COLUMNS]
+    records = []
+    for record in report[fields].itertuples(index=False, name=None):
+        row = dict(zip(fields, record))
+        field = row['field']
+        row['old'], row['new'] = display_value(field, row['old']), display_value(field, row['new'])
+        row['field'] = FIELD_LABELS.get(field, field)
+        records.append(row)
+    return records
+
+
+def change_summary(report):
+    """{change type: number of report rows}, in CHANGE_TYPES order."""
+    counts = report['change'].value_counts()
+    return {change: int(counts.get(change, 0)) for change in CHANGE_TYPES}
+
+
+_lock = threading.Lock()
+_diff_cache = OrderedDict()
+
+
+def get_diff(base, target=None):
+    """Change report from snapshot base to snapshot target (default: the loaded data)."""
+    version, _ = current_snapshot()
+    target_key = target if target is not None else version
+    key = (base, target_key)
+    with _lock:
+        if key in _diff_cache:
+            _diff_cache.move_to_end(key)
+            return _diff_cache[key]
+    old = load_snapshot(base)
+    new = load_snapshot(target) if target is not None else current_snapshot()[1]
+    report = diff_snapshots(old, new)
+    with _lock:
+        _diff_cache[key] = report
+        while len(_diff_cache) > DIFF_CACHE_SIZE:
+            _diff_cache.popitem(last=False)
+    return report
+
+
+if __name__ == '__main__':
+    # python snapshot_diff.py [base [target]]: record the loaded data, then print the
+    # summary of base -> target (default: the previous recording -> the loaded data)
+    import sys
+    current = record_snapshot()
+    names = list_snapshots()
+    previous = names[:names.index(current)]
+    base = sys.argv[1] if len(sys.argv) > 1 else (previous[-1] if previous else current)
+    target = sys.argv[2] if len(sys.argv) > 2 else None
+    report = get_diff(base, target)
+    print(f"{snapshot_label(base)} -> {snapshot_label(target) if target else 'loaded data'}")
+    for change, count in change_summary(report).items():
+        print(f"  {change:<18} {count}")
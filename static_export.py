@@ -0,0 +1,354 @@
+# static_export.py
+#
+# Offline copy of the dashboard for field offices without a connection to the server:
+# every route ('/' and the sector pages) prerendered into a static bundle that any static
+# file server (or a browser opening the files from a USB stick) can show.
+#
+# Usage: python static_export.py [--out static_bundle]
+#        python static_export.py --single-file [--out static_bundle] [--sectors ict ...] [--workers N]
+#
+# Each route becomes <route>/index.html. The parts of a page that do not depend on a
+# selection (metric cards, highlights, status table) are rendered here; the data the
+# interactive parts need (status pies, the outcome -> indicator cascade and every
+# indicator's detail view) is precomputed into data/<page>.js as compact columnar JSON
+# and drawn in the browser by static_viewer/viewer.js. The data files are plain scripts
+# rather than fetched JSON so that the pages also work from file:// URLs.
+#
+# --single-file writes one self-contained <sector>.html per sector instead: styles, logo,
+# page data, plotly.js and the viewer all inlined (~5 MB, mostly plotly.js), to be mailed
+# or copied around on its own. The files are built by static_html.build_changed (a process
+# pool, skipping sectors whose workbook, configuration and viewer files have not changed).
+# Their sidebars link only the sector pages present in the output directory.
+
+import argparse
+import base64
+import functools
+import hashlib
+import html
+import json
+import os
+import shutil
+import time
+
+import plotly
+from plotly.offline import get_plotlyjs
+
+from catalogue import SECTOR_FIELD_COLUMNS, MATRIX_FIELD_COLUMNS, json_value
+from figure_cache import cached_figure
+from figures import STATUS_COLORS, status_pie
+from sector_config import SECTORS, SECTORS_BY_KEY
+from sector_data import (
+    DATA_DIR, get_sector_data, get_matrix_data, snapshot_version, file_version, DISPLAY_STATUSES,
+    INDICATOR_COL, MATRIX_PILLAR_COL, MATRIX_OUTCOME_COL, MATRIX_STATUS_2024_COL, MATRIX_STATUS_MIDTERM_COL
+)
+from sector_page import pie_chart
+from static_html import write_atomic, summary_html, table_html, metric_cards, build_changed
+from status_cube import status_counts_by_group
+
+DEFAULT_OUT_DIR = 'static_bundle'
+VIEWER_DIR = os.path.join(DATA_DIR, 'static_viewer')
+ASSETS_DIR = os.path.join(DATA_DIR, 'assets')
+
+# Files copied into the bundle's assets/ directory
+BUNDLE_ASSETS = ['style.css', 'styles2.css', 'Coat_of_arms_of_Rwanda.svg']
+VIEWER_FILES = ['viewer.js', 'viewer.css']
+PLOTLY_JS = 'plotly.min.js'
+LOGO = 'Coat_of_arms_of_Rwanda.svg'
+
+# Page stylesheets, in load order
+STYLESHEETS = [
+    os.path.join(ASSETS_DIR, 'style.css'),
+    os.path.join(ASSETS_DIR, 'styles2.css'),
+    os.path.join(VIEWER_DIR, 'viewer.css'),
+]
+
+# Bump when the single-file page layout changes so that every sector is rebuilt
+SINGLE_FILE_VERSION = '1'
+
+# Home page pies: period key -> year in the title (as on the live home page)
+HOME_PIE_PERIODS = {'2024/25': '2024/25', '2026/7': '2026/27'}
+
+HOME_TITLE = "NST2 PROGRESS DASHBOARD"
+
+
+# --- Page data ---
+def columnar(df, field_columns):
+    """{'n', 'columns'} with one list per field; repetitive text is dictionary-encoded."""
+    columns = {}
+    for field, col in field_columns.items():
+        values = [json_value(value) for value in df[col]] if col in df.columns else [None] * len(df)
+        distinct = list(dict.fromkeys(value for value in values if value is not None))
+        if values and all(isinstance(value, str) for value in distinct) and len(distinct) * 2 <= len(values):
+            position = {value: code for code, value in enumerate(distinct)}
+            columns[field] = {'values': distinct, 'codes': [position.get(value) for value in values]}
+        else:
+            columns[field] = values
+    return {'n': len(df), 'columns': columns}
+
+
+def sector_page_data(key):
+    """Data of one sector page for static_viewer/viewer.js."""
+    sector = SECTORS_BY_KEY[key]
+    data = get_sector_data(key)
+    # Same figure_cache keys and builders as the live sector page
+    pies = [
+        cached_figure(('sector-pie', key, '2024/25'), data['version'],
+                      lambda: pie_chart(data['status_2024_counts'], "2024/25 Target Status", sector['palette'])),
+        cached_figure(('sector-pie', key, 'midterm'), data['version'],
+                      lambda: pie_chart(data['status_midterm_counts'], "MidTerm Target Status", sector['palette'])),
+    ]
+    return {
+        'levels': [{'field': 'outcome', 'label': 'Select Outcome'}],
+        'pies': {'by': None, 'figures': {'': pies}},
+        'rows': columnar(data['df'], SECTOR_FIELD_COLUMNS),
+        'status_colors': STATUS_COLORS,
+    }
+
+
+def home_page_data():
+    """Data of the home page (matrix.xlsx, by pillar) for static_viewer/viewer.js."""
+    matrix = get_matrix_data()
+    df = matrix['df'].copy()
+    for col in [MATRIX_STATUS_2024_COL, MATRIX_STATUS_MIDTERM_COL]:
+        df[col] = df[col].astype('string').str.strip().str.upper()
+    counts = status_counts_by_group(
+        df, MATRIX_PILLAR_COL, [MATRIX_STATUS_2024_COL, MATRIX_STATUS_MIDTERM_COL], list(HOME_PIE_PERIODS)
+    )
+    figures = {
+        pillar: [
+            cached_figure(
+                ('pillar-pie', pillar, year), tuple(period_counts[period].items()),
+                lambda counts=period_counts[period], year=year: status_pie(
+                    counts, f'Indicator Status ({year})', drop_zero=True, legend_title_text='Status'
+                )
+            )
+            for period, year in HOME_PIE_PERIODS.items()
+        ]
+        for pillar, period_counts in counts.items()
+    }
+    field_columns = dict(MATRIX_FIELD_COLUMNS, pillar=MATRIX_PILLAR_COL)
+    return {
+        'levels': [
+            {'field': 'pillar', 'label': 'Select a Pillar'},
+            {'field': 'outcome', 'label': 'Select NST2 Outcome'},
+        ],
+        'pies': {'by': 'pillar', 'figures': figures},
+        'rows': columnar(df, field_columns),
+        'status_colors': STATUS_COLORS,
+    }
+
+
+# --- Prerendered HTML ---
+def status_table(counts_2024, counts_midterm):
+    rows = [
+        [(status, f'status-cell {status.lower()}'), counts_2024.get(status, 0), counts_midterm.get(status, 0)]
+        for status in DISPLAY_STATUSES
+    ]
+    return table_html(rows, ['Status', '2024/25 Target', 'NST2 Midterm Target'], 'viewer-status-table')
+
+
+def viewer_sections(title):
+    """Placeholders filled by viewer.js."""
+    return (
+        f'<div class="viewer-section"><h3 class="section-title">{html.escape(title)}</h3>'
+        '<div id="viewer-pies" class="viewer-pies"></div></div>'
+        '<div class="viewer-section ssp-section-container">'
+        '<div id="viewer-cascade" class="ssp-dropdowns-row"></div>'
+        '<h3 id="viewer-indicator-header" class="selected-indicator-header"></h3>'
+        '<div id="viewer-detail" class="indicator-detail-container"></div></div>'
+    )
+
+
+def sector_body(key):
+    sector = SECTORS_BY_KEY[key]
+    data = get_sector_data(key)
+    return (
+        metric_cards([("Total outcomes", data['total_outcomes']), ("Total indicators", data['total_indicators'])])
+        + '<div class="viewer-section"><h3 class="section-title">SECTOR PERFORMANCE HIGHLIGHTS</h3>'
+        + summary_html(sector['summary'], 'summary-list', 'summary-point') + '</div>'
+        + '<div class="viewer-section">'
+        + status_table(data['status_2024_counts'], data['status_midterm_counts']) + '</div>'
+        + viewer_sections("Indicator status")
+    )
+
+
+def home_body():
+    df = get_matrix_data()['df']
+    metrics = [
+        ("Number of Pillars", df[MATRIX_PILLAR_COL].dropna().nunique()),
+        ("Number of Sectors", len(SECTORS)),
+        ("Number of Outcomes", df[MATRIX_OUTCOME_COL].nunique()),
+        ("Number of Indicators", df[INDICATOR_COL].nunique()),
+    ]
+    return metric_cards(metrics) + viewer_sections("Indicator status by pillar")
+
+
+def sidebar(links, current):
+    """links: [(route, text, href)] -> sidebar nav; current route is highlighted."""
+    items = ''.join(
+        f'<a href="{href}" class="sidebar-nav-link{" active" if route == current else ""}">{html.escape(text)}</a>'
+        for route, text, href in links
+    )
+    return f'<nav class="sidebar-container viewer-sidebar">{items}</nav>'
+
+
+def render_page(title, body, nav, head, scripts, snapshot):
+    """Complete HTML page. head/scripts are the tags for the styles and the scripts."""
+    return (
+        '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+        f'<title>{html.escape(title)}</title>\n{head}\n</head>\n<body>\n'
+        f'<div class="header-container">{nav["logo"]}'
+        f'<h1 class="dashboard-title-text">{html.escape(title)}</h1></div>\n'
+        f'<div class="viewer-layout">{nav["sidebar"]}'
+        f'<main class="main-content-wrapper viewer-main">{body}'
+        f'<p class="viewer-note">Offline copy generated {time.strftime("%Y-%m-%d %H:%M")} '
+        f'from data snapshot {snapshot}.</p></main></div>\n'
+        f'{scripts}\n</body>\n</html>\n'
+    )
+
+
+def page_script(page_data):
+    """window.NST2_PAGE = ... as script source ('</' escaped for inline use)."""
+    payload = json.dumps(page_data, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+    return f"window.NST2_PAGE = {payload};\n"
+
+
+# --- Bundle ---
+def routes():
+    """(route, page name, sidebar text, title) for every exported page."""
+    pages = [('/', 'home', 'Home', HOME_TITLE)]
+    pages += [(sector['path'], sector['key'], sector['name'], f"{sector['label']} DASHBOARD") for sector in SECTORS]
+    return pages
+
+
+def page_data(name):
+    return home_page_data() if name == 'home' else sector_page_data(name)
+
+
+def page_body(name):
+    return home_body() if name == 'home' else sector_body(name)
+
+
+def copy_static_files(out_dir):
+    os.makedirs(os.path.join(out_dir, 'assets'), exist_ok=True)
+    for name in BUNDLE_ASSETS:
+        shutil.copyfile(os.path.join(ASSETS_DIR, name), os.path.join(out_dir, 'assets', name))
+    for name in VIEWER_FILES:
+        shutil.copyfile(os.path.join(VIEWER_DIR, name), os.path.join(out_dir, 'assets', name))
+    write_atomic(os.path.join(out_dir, 'assets', PLOTLY_JS), get_plotlyjs())
+
+
+def build_bundle(out_dir, log=print):
+    """Write the static bundle into out_dir."""
+    copy_static_files(out_dir)
+    pages = routes()
+    for route, name, _, title in pages:
+        # Relative links, so the bundle works under any URL prefix and from file://
+        depth = route.strip('/').count('/') + 1 if route != '/' else 0
+        prefix = '../' * depth
+        links = [
+            (other, text, f"{prefix}{other.strip('/') + '/' if other != '/' else ''}index.html")
+            for other, _, text, _ in pages
+        ]
+        nav = {
+            'logo': f'<img src="{prefix}assets/{LOGO}" class="header-logo" alt="">',
+            'sidebar': sidebar(links, route),
+        }
+        head = ''.join(
+            f'<link rel="stylesheet" href="{prefix}assets/{os.path.basename(path)}">' for path in STYLESHEETS
+        )
+        scripts = (
+            f'<script src="{prefix}data/{name}.js"></script>'
+            f'<script src="{prefix}assets/{PLOTLY_JS}"></script>'
+            f'<script src="{prefix}assets/viewer.js"></script>'
+        )
+        write_atomic(os.path.join(out_dir, 'data', f"{name}.js"), page_script(page_data(name)))
+        page_path = os.path.join(out_dir, route.strip('/'), 'index.html')
+        write_atomic(page_path, render_page(title, page_body(name), nav, head, scripts, snapshot_version()))
+        log(f"{route}: {page_path}")
+    return [route for route, _, _, _ in pages]
+
+
+# --- Single-file sector pages ---
+def read_text(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def single_file_inputs(key, linked):
+    """Fingerprint of everything a single-file sector page is built from (linked: the
+    sector keys in its sidebar)."""
+    sector = SECTORS_BY_KEY[key]
+    parts = [
+        SINGLE_FILE_VERSION,
+        plotly.__version__,
+        file_version(os.path.join(DATA_DIR, sector['workbook'])),
+        json.dumps(sector, sort_keys=True, default=str),
+        ','.join(linked),
+    ]
+    parts += [file_version(path) for path in STYLESHEETS + [os.path.join(VIEWER_DIR, 'viewer.js')]]
+    return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()[:16]
+
+
+def single_file_page(key, linked):
+    sector = SECTORS_BY_KEY[key]
+    with open(os.path.join(ASSETS_DIR, LOGO), 'rb') as f:
+        logo = base64.b64encode(f.read()).decode('ascii')
+    links = [(other['path'], other['name'], f"{other['key']}.html") for other in SECTORS if other['key'] in linked]
+    nav = {
+        'logo': f'<img src="data:image/svg+xml;base64,{logo}" class="header-logo" alt="">',
+        'sidebar': sidebar(links, sector['path']),
+    }
+    head = ''.join(f"<style>{read_text(path)}</style>" for path in STYLESHEETS)
+    scripts = (
+        f"<script>{page_script(sector_page_data(key))}</script>"
+        f"<script>{get_plotlyjs()}</script>"
+        f"<script>{read_text(os.path.join(VIEWER_DIR, 'viewer.js'))}</script>"
+    )
+    title = f"{sector['label']} DASHBOARD"
+    return render_page(title, sector_body(key), nav, head, scripts, get_sector_data(key)['version'])
+
+
+def write_single_file(key, out_dir, linked=()):
+    write_atomic(os.path.join(out_dir, f"{key}.html"), single_file_page(key, linked))
+
+
+def build_single_files(out_dir, keys, workers=None, force=False, log=print):
+    """Write <key>.html for keys into out_dir; returns (built keys, skipped keys).
+
+    Pages already in out_dir are part of the run too: every sidebar links the same pages,
+    so an existing page is rebuilt when a new sector is added next to it.
+    """
+    linked = [
+        sector['key'] for sector in SECTORS
+        if sector['key'] in keys or os.path.exists(os.path.join(out_dir, f"{sector['key']}.html"))
+    ]
+    inputs = {key: single_file_inputs(key, linked) for key in linked}
+    build = functools.partial(write_single_file, linked=linked)
+    _, built, skipped = build_changed(out_dir, inputs, build, workers, force, log)
+    return built, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the dashboard as a static offline bundle.")
+    parser.add_argument('--out', default=DEFAULT_OUT_DIR, help="output directory (default: %(default)s)")
+    parser.add_argument('--single-file', action='store_true',
+                        help="write one self-contained <sector>.html per sector instead of the bundle")
+    parser.add_argument('--sectors', nargs='+', metavar='KEY', choices=list(SECTORS_BY_KEY),
+                        help="sector keys for --single-file (default: all)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="rebuild sectors whose inputs have not changed")
+    args = parser.parse_args(argv)
+
+    if args.single_file:
+        keys = args.sectors or [sector['key'] for sector in SECTORS]
+        built, skipped = build_single_files(args.out, keys, workers=args.workers, force=args.force)
+        print(f"{len(built)} built, {len(skipped)} unchanged in {args.out}")
+        return
+    exported = build_bundle(args.out)
+    print(f"{len(exported)} pages exported to {args.out}; open {os.path.join(args.out, 'index.html')}")
+
+
+if __name__ == '__main__':
+    main()
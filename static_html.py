@@ -0,0 +1,123 @@
+# static_html.py
+#
+# HTML building blocks shared by the files generated outside the server: the sector
+# reports (report.py) and the offline bundle / single-file pages (static_export.py).
+# Everything returns a string with the text escaped here; write_atomic writes a finished
+# file so that a reader never sees it half-written.
+#
+# build_changed is the per-sector build loop of both generators: sectors are built in a
+# process pool and manifest.json in the output directory records the inputs each file
+# was built from, so sectors whose inputs have not changed are skipped on the next run.
+
+import html
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from sector_page import SUMMARY_VALUE_STYLE
+
+MANIFEST = 'manifest.json'
+
+
+def write_atomic(path, content):
+    """Write text to path through a temporary file (creating the directory)."""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def summary_html(summary, list_class=None, item_class=None):
+    """<ul> of a sector's summary bullets (sector_config 'summary' segments)."""
+    value_style = ';'.join(f"{prop}:{val}" for prop, val in SUMMARY_VALUE_STYLE.items())
+    items = []
+    for bullet in summary:
+        parts = []
+        for segment in bullet:
+            if isinstance(segment, str):
+                parts.append(html.escape(segment))
+                continue
+            style, value = segment
+            if style == 'strong':
+                parts.append(f"<strong>{html.escape(value)}</strong>")
+            elif style == 'value':
+                parts.append(f'<span style="{value_style}">{html.escape(value)}</span>')
+            else:
+                parts.append(f'<span class="{style}">{html.escape(value)}</span>')
+        items.append(f"<li{class_attr(item_class)}>{''.join(parts)}</li>")
+    return f"<ul{class_attr(list_class)}>{''.join(items)}</ul>"
+
+
+def table_html(rows, headers, table_class):
+    """<table> with a header row. A cell is HTML, or (HTML, css class) for a classed cell."""
+    def cell(value):
+        if isinstance(value, tuple):
+            content, css_class = value
+            return f"<td{class_attr(css_class)}>{content}</td>"
+        return f"<td>{value}</td>"
+
+    head = ''.join(f"<th>{html.escape(header)}</th>" for header in headers)
+    body = ''.join('<tr>' + ''.join(cell(value) for value in row) + '</tr>' for row in rows)
+    return f'<table class="{table_class}"><tr>{head}</tr>{body}</table>'
+
+
+def metric_cards(metrics):
+    """Metric cards of [(label, value)], as on the dashboard pages."""
+    cards = ''.join(
+        f'<div class="metric-card"><h2 class="metric-number">{value}</h2>'
+        f'<p class="metric-label">{html.escape(label)}</p></div>'
+        for label, value in metrics
+    )
+    return f'<div class="metric-cards-container">{cards}</div>'
+
+
+def class_attr(css_class):
+    return f' class="{css_class}"' if css_class else ''
+
+
+# --- Incremental builds ---
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def build_changed(out_dir, inputs, build, workers=None, force=False, log=print):
+    """Run build(key, out_dir) for the keys of inputs ({key: fingerprint}) whose
+    fingerprint differs from manifest.json, or whose <key>.html is missing.
+
+    build returns a JSON-serialisable summary, kept in the manifest next to the
+    fingerprint. Returns (manifest, built keys, skipped keys).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = load_manifest(out_dir)
+    todo = [
+        key for key in inputs
+        if force or not isinstance(manifest.get(key), dict) or manifest[key].get('inputs') != inputs[key]
+        or not os.path.exists(os.path.join(out_dir, f"{key}.html"))
+    ]
+    skipped = [key for key in inputs if key not in todo]
+    for key in skipped:
+        log(f"{key}: unchanged, skipped")
+
+    def record(key, summary, started):
+        manifest[key] = {'inputs': inputs[key], 'summary': summary}
+        write_atomic(os.path.join(out_dir, MANIFEST), json.dumps(manifest, indent=1))
+        log(f"{key}: wrote {os.path.join(out_dir, key + '.html')} ({time.perf_counter() - started:.1f}s)")
+
+    started = time.perf_counter()
+    if workers == 1 or len(todo) <= 1:
+        for key in todo:
+            record(key, build(key, out_dir), started)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(build, key, out_dir): key for key in todo}
+            for future in as_completed(futures):
+                record(futures[future], future.result(), started)
+    return manifest, todo, skipped
@@ -0,0 +1,281 @@
+// static_viewer/viewer.js
+//
+// Clientside part of the offline dashboard pages written by static_export.py. The page
+// carries its data in window.NST2_PAGE (columnar rows, cascade levels, status pies); this
+// script draws the pies, fills the outcome -> indicator dropdowns and renders the
+// indicator detail view, all without a server. The selected indicator is kept in the
+// URL hash (#row=N) so a detail view can be linked to.
+
+(function () {
+    'use strict';
+
+    var page = window.NST2_PAGE;
+    if (!page) {
+        return;
+    }
+
+    var STATUS_COLORS = page.status_colors || {};
+
+    // --- Data ---
+    // Columns are either a plain list or {values, codes} (dictionary-encoded)
+    function decode(column) {
+        if (Array.isArray(column)) {
+            return column;
+        }
+        return column.codes.map(function (code) {
+            return code === null ? null : column.values[code];
+        });
+    }
+
+    var columns = {};
+    Object.keys(page.rows.columns).forEach(function (field) {
+        columns[field] = decode(page.rows.columns[field]);
+    });
+    var nRows = page.rows.n;
+
+    function isBlank(value) {
+        return value === null || value === undefined || String(value).trim() === '';
+    }
+
+    // Distinct non-blank values of field over rows, in order of first appearance
+    function distinct(field, rows) {
+        var seen = {};
+        var values = [];
+        rows.forEach(function (row) {
+            var value = columns[field][row];
+            if (!isBlank(value) && !seen[value]) {
+                seen[value] = true;
+                values.push(value);
+            }
+        });
+        return values;
+    }
+
+    function matchingRows(selections) {
+        var rows = [];
+        for (var row = 0; row < nRows; row++) {
+            var keep = true;
+            for (var i = 0; i < selections.length && keep; i++) {
+                keep = columns[page.levels[i].field][row] === selections[i];
+            }
+            if (keep) {
+                rows.push(row);
+            }
+        }
+        return rows;
+    }
+
+    // --- Formatting (same rules as sector_page.format_value) ---
+    function formatValue(value, unit) {
+        if (isBlank(value)) {
+            return 'N/A';
+        }
+        var number = typeof value === 'number' ? value : NaN;
+        var text = isNaN(number) ? String(value) : number.toFixed(1);
+        return isBlank(unit) ? text : text + ' ' + unit;
+    }
+
+    function el(tag, className, text) {
+        var node = document.createElement(tag);
+        if (className) {
+            node.className = className;
+        }
+        if (text !== undefined && text !== null) {
+            node.textContent = text;
+        }
+        return node;
+    }
+
+    function card(label, content) {
+        var node = el('div', 'metric-card-detail');
+        node.appendChild(el('div', 'metric-detail-header', label));
+        if (typeof content === 'string') {
+            node.appendChild(el('div', 'indicator-value', content));
+        } else {
+            node.appendChild(content);
+        }
+        return node;
+    }
+
+    function progressBar(fraction) {
+        var percent = typeof fraction === 'number' ? fraction * 100 : 0;
+        var color = percent >= 80 ? '#28a745' : percent >= 50 ? '#ffc107' : '#dc3545';
+        var wrapper = el('div');
+        var bar = el('div', 'viewer-bar');
+        var fill = el('span');
+        fill.style.width = Math.min(Math.max(percent, 0), 100) + '%';
+        fill.style.background = color;
+        bar.appendChild(fill);
+        wrapper.appendChild(bar);
+        wrapper.appendChild(el('div', 'progress-value', percent.toFixed(1) + '%'));
+        return wrapper;
+    }
+
+    function statusBadge(status) {
+        if (isBlank(status)) {
+            return el('span', 'viewer-muted', 'Not rated');
+        }
+        var badge = el('span', 'viewer-badge', status);
+        badge.style.background = STATUS_COLORS[String(status).toUpperCase()] || '#6c757d';
+        return badge;
+    }
+
+    // --- Views ---
+    function drawPies(group) {
+        var container = document.getElementById('viewer-pies');
+        if (!container || !page.pies) {
+            return;
+        }
+        container.innerHTML = '';
+        var figures = page.pies.figures[page.pies.by ? group : ''] || [];
+        figures.forEach(function (figure) {
+            var div = el('div', 'viewer-pie');
+            container.appendChild(div);
+            if (window.Plotly) {
+                window.Plotly.newPlot(div, figure.data, figure.layout, {displayModeBar: false, responsive: true});
+            }
+        });
+    }
+
+    function renderDetail(row) {
+        var header = document.getElementById('viewer-indicator-header');
+        var detail = document.getElementById('viewer-detail');
+        detail.innerHTML = '';
+        if (row === null) {
+            header.textContent = '';
+            return;
+        }
+        var value = function (field) { return columns[field] ? columns[field][row] : null; };
+        var unit = value('units');
+        header.textContent = value('indicator');
+
+        var values = el('div', 'indicator-metric-row');
+        values.appendChild(card('Baseline', formatValue(value('baseline'), unit)));
+        values.appendChild(card('2024/25 Target', formatValue(value('target_2024'), unit)));
+        values.appendChild(card('2026/27 Target', formatValue(value('target_midterm'), unit)));
+        values.appendChild(card('Current progress', formatValue(value('current'), unit)));
+        detail.appendChild(values);
+
+        var progress = el('div', 'indicator-metric-row');
+        progress.appendChild(card('FY2024/25 PERCENTAGE PROGRESS', progressBar(value('progress_2024'))));
+        progress.appendChild(card('NST2 MIDTERM PERCENTAGE PROGRESS', progressBar(value('progress_midterm'))));
+        progress.appendChild(card('Status 2024/25', statusBadge(value('status_2024'))));
+        progress.appendChild(card('Status midterm', statusBadge(value('status_midterm'))));
+        detail.appendChild(progress);
+
+        [['Major drivers of performance', 'drivers'], ['Challenges', 'challenges'], ['Catch up plans', 'catchup']]
+            .forEach(function (item) {
+                var section = el('div', 'viewer-narrative');
+                section.appendChild(el('h4', null, item[0]));
+                section.appendChild(el('p', null, isBlank(value(item[1])) ? 'No data available' : value(item[1])));
+                detail.appendChild(section);
+            });
+    }
+
+    // --- Cascade ---
+    var selects = [];
+    var indicatorSelect = null;
+    var indicatorRows = [];
+
+    function fillSelect(select, options, placeholder) {
+        select.innerHTML = '';
+        var empty = el('option', null, placeholder);
+        empty.value = '';
+        select.appendChild(empty);
+        options.forEach(function (option) {
+            var node = el('option', null, option.label);
+            node.value = option.value;
+            select.appendChild(node);
+        });
+    }
+
+    function selections(upTo) {
+        var values = [];
+        for (var i = 0; i < upTo; i++) {
+            if (!selects[i].value) {
+                break;
+            }
+            values.push(selects[i].value);
+        }
+        return values;
+    }
+
+    // Refill the dropdowns after level changed; a level keeps its value if still offered
+    function refresh(level) {
+        for (var i = level + 1; i < selects.length; i++) {
+            var previous = selects[i].value;
+            var values = distinct(page.levels[i].field, matchingRows(selections(i)));
+            fillSelect(selects[i], values.map(function (v) { return {label: v, value: v}; }), 'Choose...');
+            selects[i].value = values.indexOf(previous) >= 0 ? previous : (values[0] || '');
+        }
+        var chosen = selections(selects.length);
+        indicatorRows = chosen.length === selects.length ? matchingRows(chosen) : [];
+        indicatorRows = indicatorRows.filter(function (row) { return !isBlank(columns.indicator[row]); });
+        fillSelect(indicatorSelect, indicatorRows.map(function (row) {
+            return {label: columns.indicator[row], value: String(row)};
+        }), 'Choose indicator...');
+        drawPies(selects.length ? selects[0].value : '');
+        renderDetail(null);
+    }
+
+    function selectRow(row) {
+        page.levels.forEach(function (level, i) {
+            selects[i].value = columns[level.field][row];
+            refresh(i);
+        });
+        if (!page.levels.length) {
+            refresh(-1);
+        }
+        indicatorSelect.value = String(row);
+        renderDetail(row);
+    }
+
+    function rowFromHash() {
+        var match = /row=(\d+)/.exec(window.location.hash);
+        var row = match ? parseInt(match[1], 10) : NaN;
+        return row >= 0 && row < nRows ? row : null;
+    }
+
+    function init() {
+        var cascade = document.getElementById('viewer-cascade');
+        page.levels.forEach(function (level, i) {
+            var col = el('div', 'ssp-dropdown-col');
+            col.appendChild(el('label', 'dropdown-label', level.label));
+            var select = el('select', 'viewer-select');
+            select.addEventListener('change', function () { refresh(i); });
+            col.appendChild(select);
+            cascade.appendChild(col);
+            selects.push(select);
+        });
+        var col = el('div', 'ssp-dropdown-col');
+        col.appendChild(el('label', 'dropdown-label', 'Select Indicator'));
+        indicatorSelect = el('select', 'viewer-select');
+        indicatorSelect.addEventListener('change', function () {
+            var row = indicatorSelect.value === '' ? null : parseInt(indicatorSelect.value, 10);
+            renderDetail(row);
+            if (row !== null) {
+                window.history.replaceState(null, '', '#row=' + row);
+            }
+        });
+        col.appendChild(indicatorSelect);
+        cascade.appendChild(col);
+
+        var row = rowFromHash();
+        refresh(-1);
+        if (row !== null) {
+            selectRow(row);
+        }
+        window.addEventListener('hashchange', function () {
+            var hashRow = rowFromHash();
+            if (hashRow !== null) {
+                selectRow(hashRow);
+            }
+        });
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', init);
+    } else {
+        init();
+    }
+})();
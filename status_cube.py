@@ -0,0 +1,78 @@
+# status_cube.py
+#
+# Vectorised status tabulation shared by the home dashboard and the sector pages.
+# Instead of filtering the DataFrame once per pillar and calling value_counts() twice,
+# every row is mapped to (group code, period, status code) and counted with a single
+# np.bincount, producing the whole group x period x status cube in one pass.
+# status_index() lists the items (indicators) behind each count, for click-to-filter.
+
+import numpy as np
+import pandas as pd
+
+STATUS_CATEGORIES = ['COMPLETED', 'GOOD', 'SATISFACTORY', 'LOW']
+
+
+def status_cube(df, group_col, status_cols, status_categories=STATUS_CATEGORIES):
+    """Count statuses per group for several status columns at once.
+
+    Returns (groups, cube) where groups lists the non-null group values in order of
+    first appearance (same order as Series.unique()) and cube is an int64 array of
+    shape (len(groups), len(status_cols), len(status_categories)).
+    Statuses outside status_categories (or missing) are not counted.
+    """
+    group_codes, groups = pd.factorize(df[group_col], sort=False)
+    n_groups = len(groups)
+    n_periods = len(status_cols)
+    n_statuses = len(status_categories)
+    cube_size = n_groups * n_periods * n_statuses
+    if cube_size == 0:
+        return list(groups), np.zeros((n_groups, n_periods, n_statuses), dtype=np.int64)
+
+    flat_indexes = []
+    for period, status_col in enumerate(status_cols):
+        status_codes = pd.Categorical(df[status_col], categories=status_categories).codes
+        valid = (group_codes >= 0) & (status_codes >= 0)
+        flat_indexes.append(
+            (group_codes[valid] * n_periods + period) * n_statuses + status_codes[valid]
+        )
+
+    counts = np.bincount(np.concatenate(flat_indexes), minlength=cube_size)
+    return list(groups), counts.reshape(n_groups, n_periods, n_statuses)
+
+
+def status_counts_by_group(df, group_col, status_cols, period_labels,
+                           status_categories=STATUS_CATEGORIES):
+    """Return {group: {period_label: {status: count}}} built from status_cube()."""
+    groups, cube = status_cube(df, group_col, status_cols, status_categories)
+    return {
+        group: {
+            period_label: {
+                status: int(cube[g, p, s]) for s, status in enumerate(status_categories)
+            }
+            for p, period_label in enumerate(period_labels)
+        }
+        for g, group in enumerate(groups)
+    }
+
+
+def status_index(df, item_col, status_cols, period_labels, group_col=None,
+                 status_categories=STATUS_CATEGORIES):
+    """Items (e.g. indicator names) per status, for lookups such as "all LOW indicators".
+
+    Returns {period_label: {status: [items]}}, or {group: {period_label: {status: [items]}}}
+    with group_col. Items keep their order of first appearance; every status has an
+    entry, possibly empty, so callers never filter the DataFrame again.
+    """
+    valid_items = df[item_col].notna() & (df[item_col].astype(str).str.strip() != '')
+    groups = [None] if group_col is None else [g for g in df[group_col].unique() if pd.notna(g)]
+    index = {
+        group: {period: {status: [] for status in status_categories} for period in period_labels}
+        for group in groups
+    }
+    for period, status_col in zip(period_labels, status_cols):
+        keys = [status_col] if group_col is None else [group_col, status_col]
+        rows = df[valid_items & df[status_col].isin(status_categories)]
+        for key, items in rows.groupby(keys, sort=False)[item_col]:
+            group, status = (None, key[0]) if group_col is None else key
+            index[group][period][status] = items.unique().tolist()
+    return index[None] if group_col is None else index
@@ -0,0 +1,115 @@
+# status_engine.py
+#
+# Recomputes progress and status of every indicator from its numbers instead of trusting
+# the hand-typed Status columns. Works on whole columns at once (numpy), so all sectors
+# are recomputed in a few milliseconds.
+#
+# Progress towards a target (PROGRESS_METHODS):
+#   'ratio'    - current / target, or target / current for a decreasing-is-better
+#                indicator. This is how most sector workbooks compute their % progress.
+#   'distance' - (current - baseline) / (target - baseline): share of the way from the
+#                baseline to the target covered so far; works for both directions.
+# An indicator is decreasing-is-better when its last target is below its baseline.
+#
+# Status classes come from STATUS_THRESHOLDS (lowest progress for each class, highest
+# class first); progress below all of them is LOW, missing progress is not rated.
+
+import numpy as np
+import pandas as pd
+
+# Status -> lowest progress (fraction of the target) for that status, highest first
+STATUS_THRESHOLDS = [
+    ('COMPLETED', 1.0),
+    ('GOOD', 0.75),
+    ('SATISFACTORY', 0.5),
+]
+LOWEST_STATUS = 'LOW'
+
+PROGRESS_METHODS = ('ratio', 'distance')
+DEFAULT_METHOD = 'ratio'
+
+INCREASING = 'increasing'
+DECREASING = 'decreasing'
+
+# Values of the status check (see status_check)
+AGREES = 'Agrees with reported'
+DIFFERS = 'Differs from reported'
+NOT_COMPUTABLE = 'Not computable'
+
+
+def numeric(values):
+    """Float array of a column of cells; text and empty cells become NaN."""
+    return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=float)
+
+
+def indicator_arrays(df):
+    """Numeric arrays the engine works on, from a frame with catalogue field names."""
+    return {
+        field: numeric(df[field])
+        for field in ['baseline', 'target_2024', 'target_midterm', 'current']
+    }
+
+
+def decreasing_mask(baseline, target_2024, target_midterm):
+    """True where the indicator improves by going down (last target below baseline)."""
+    last_target = np.where(np.isfinite(target_midterm), target_midterm, target_2024)
+    with np.errstate(invalid='ignore'):
+        return last_target < baseline
+
+
+def progress(baseline, target, current, decreasing, method=DEFAULT_METHOD):
+    """Progress towards target as a fraction (NaN where it cannot be computed)."""
+    if method not in PROGRESS_METHODS:
+        raise ValueError(f"Unknown progress method {method!r}; expected one of {PROGRESS_METHODS}")
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method == 'distance':
+            result = (current - baseline) / (target - baseline)
+        else:
+            result = np.where(decreasing, target / current, current / target)
+            # A decreasing indicator that has reached zero has met any target >= 0
+            result = np.where(decreasing & (current == 0) & (target >= 0), 1.0, result)
+    result[~np.isfinite(result)] = np.nan
+    return result
+
+
+def classify(progress_values, thresholds=STATUS_THRESHOLDS, not_rated=None):
+    """Status per progress value; not_rated where progress is NaN."""
+    # Thresholds ascending: searchsorted gives the number of thresholds each value reaches
+    ordered = sorted(thresholds, key=lambda item: item[1])
+    levels = np.array([threshold for _, threshold in ordered])
+    names = np.array([LOWEST_STATUS] + [status for status, _ in ordered] + [not_rated], dtype=object)
+    codes = np.searchsorted(levels, progress_values, side='right')
+    codes[np.isnan(progress_values)] = len(names) - 1
+    return names[codes]
+
+
+def recompute(arrays, method=DEFAULT_METHOD, thresholds=STATUS_THRESHOLDS, not_rated=None):
+    """Progress and status of every row for both periods.
+
+    arrays: indicator_arrays() output (possibly with edited 'current' values).
+    Returns {'decreasing', 'progress_2024', 'progress_midterm', 'status_2024',
+    'status_midterm'}.
+    """
+    decreasing = decreasing_mask(arrays['baseline'], arrays['target_2024'], arrays['target_midterm'])
+    result = {'decreasing': decreasing}
+    for period in ['2024', 'midterm']:
+        values = progress(arrays['baseline'], arrays[f'target_{period}'], arrays['current'], decreasing, method)
+        result[f'progress_{period}'] = values
+        result[f'status_{period}'] = classify(values, thresholds, not_rated)
+    return result
+
+
+def status_check(reported, computed, not_rated):
+    """AGREES / DIFFERS / NOT_COMPUTABLE per row, over pairs of (reported, computed) arrays.
+
+    A row differs when any period's computed status differs from the reported one
+    (including a computable status that was not reported); it is not computable when no
+    period can be computed.
+    """
+    computable = np.zeros(len(reported[0]), dtype=bool)
+    differs = np.zeros(len(reported[0]), dtype=bool)
+    for reported_status, computed_status in zip(reported, computed):
+        has_computed = computed_status != not_rated
+        computable |= has_computed
+        differs |= has_computed & (reported_status != computed_status)
+    return np.where(differs, DIFFERS, np.where(computable, AGREES, NOT_COMPUTABLE)).astype(object)
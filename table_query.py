@@ -0,0 +1,212 @@
+# table_query.py
+#
+# Server-side paging, sorting and filtering for the Indicator Explorer table
+# (dash_table.DataTable with page_action/sort_action/filter_action='custom').
+#
+# Every displayed column of the catalogue is turned, once per data snapshot, into arrays
+# the queries run on: lower-cased text, a float value (NaN when the cell is not a
+# number), its rank in the column's sort order and whether the cell is empty. Filtering
+# is vectorised comparisons on these arrays, sorting is an np.lexsort of the ranks of the
+# matching rows, and only the rows of the requested page are converted to records.
+
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from catalogue import get_catalogue
+
+# Displayed columns: (catalogue field, header, DataTable type)
+TABLE_COLUMNS = [
+    ('source_label', 'Sector', 'text'),
+    ('pillar', 'Pillar', 'text'),
+    ('outcome', 'Outcome', 'text'),
+    ('indicator', 'Indicator', 'text'),
+    ('unit', 'Unit', 'text'),
+    ('baseline', 'Baseline', 'any'),
+    ('target_2024', '2024/25 Target', 'any'),
+    ('target_midterm', '2026/27 Target', 'any'),
+    ('current', 'Current progress', 'any'),
+    ('progress_2024', 'Progress 2024/25 (%)', 'numeric'),
+    ('progress_midterm', 'Progress 2026/27 (%)', 'numeric'),
+    ('status_2024', 'Status 2024/25', 'text'),
+    ('status_midterm', 'Status midterm', 'text'),
+    ('computed_status_2024', 'Computed status 2024/25', 'text'),
+    ('computed_status_midterm', 'Computed status midterm', 'text'),
+    ('responsibility', 'Responsibility', 'text'),
+]
+
+# Progress is stored as a fraction and shown (and filtered) in percent
+PERCENT_FIELDS = {'progress_2024', 'progress_midterm'}
+
+# DataTable filter operators (keyword or symbol form) -> comparison. Keywords may carry an
+# 'i' (case-insensitive) or 's' (sensitive) prefix; text is always compared lower-cased.
+FILTER_OPERATORS = {
+    'ge': '>=', '>=': '>=', 'le': '<=', '<=': '<=', 'lt': '<', '<': '<', 'gt': '>', '>': '>',
+    'ne': '!=', '!=': '!=', 'eq': '=', '=': '=',
+    'contains': 'contains', 'datestartswith': 'datestartswith',
+}
+
+FILTER_PART_RE = re.compile(r'\{(?P<column>[^}]+)\}\s+(?P<operator>\S+)\s*(?P<value>.*)$')
+
+
+def display_value(field, value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if field in PERCENT_FIELDS:
+        return round(float(value) * 100, 1)
+    if isinstance(value, float):
+        return round(value, 2)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    return ' '.join(str(value).split())
+
+
+def column_arrays(values):
+    """(text, numbers, ranks) arrays for one column of display values.
+
+    Sort order: numbers ascending, then text alphabetically, then empty cells.
+    """
+    text = np.array(['' if value is None else str(value).lower() for value in values], dtype=str)
+    numbers = np.array(
+        [value if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan
+         for value in values], dtype=float
+    )
+
+    def sort_key(row):
+        value = values[row]
+        if value is None:
+            return (2, 0.0, '')
+        if not np.isnan(numbers[row]):
+            return (0, numbers[row], '')
+        return (1, 0.0, text[row])
+
+    # Dense ranks: equal cells share a rank so that the next sort column breaks the tie
+    keys = [sort_key(row) for row in range(len(values))]
+    order = sorted(range(len(values)), key=keys.__getitem__)
+    ranks = np.empty(len(values), dtype=np.int64)
+    rank = -1
+    previous = None
+    for row in order:
+        if keys[row] != previous:
+            rank += 1
+            previous = keys[row]
+        ranks[row] = rank
+    return text, numbers, ranks
+
+
+def build_table_index(catalogue):
+    records = catalogue[[field for field, _, _ in TABLE_COLUMNS]].to_dict('records')
+    display_rows = [{field: display_value(field, row[field]) for field in row} for row in records]
+    columns = {}
+    for field, _, _ in TABLE_COLUMNS:
+        text, numbers, ranks = column_arrays([row[field] for row in display_rows])
+        blank = np.array([row[field] is None for row in display_rows], dtype=bool)
+        columns[field] = {'text': text, 'numbers': numbers, 'ranks': ranks, 'blank': blank}
+    return {'rows': display_rows, 'columns': columns}
+
+
+def split_filter_part(filter_part):
+    """'{col} >= 5' / '{col} icontains "x"' -> (column, operator, value); Nones if unknown."""
+    match = FILTER_PART_RE.match(filter_part.strip())
+    if not match:
+        return None, None, None
+    operator = match.group('operator')
+    if operator not in FILTER_OPERATORS and operator[:1] in ('i', 's'):
+        operator = operator[1:]
+    if operator not in FILTER_OPERATORS:
+        return None, None, None
+
+    operator = FILTER_OPERATORS[operator]
+    value_part = match.group('value').strip()
+    quote = value_part[:1]
+    if len(value_part) > 1 and quote in ('"', "'", '`') and value_part[-1] == quote:
+        value = value_part[1:-1].replace('\\' + quote, quote)
+    elif operator in ('contains', 'datestartswith'):
+        # Text matches keep the typed value: 'contains 5' is '5', not '5.0'
+        value = value_part
+    else:
+        try:
+            value = float(value_part)
+        except ValueError:
+            value = value_part
+    return match.group('column'), operator, value
+
+
+def filter_mask(columns, n_rows, filter_query):
+    """Bool mask of the rows matching a DataTable filter_query ('&&'-joined parts)."""
+    mask = np.ones(n_rows, dtype=bool)
+    for filter_part in (filter_query or '').split(' && '):
+        name, operator, value = split_filter_part(filter_part)
+        if name not in columns:
+            continue
+        column = columns[name]
+        if operator in ('contains', 'datestartswith'):
+            needle = value.lower()
+            if operator == 'contains':
+                mask &= np.char.find(column['text'], needle) >= 0
+            else:
+                mask &= np.char.startswith(column['text'], needle)
+        elif isinstance(value, float):
+            numbers = column['numbers']
+            with np.errstate(invalid='ignore'):
+                mask &= {
+                    '>=': numbers >= value, '<=': numbers <= value, '<': numbers < value,
+                    '>': numbers > value, '!=': ~(numbers == value), '=': numbers == value,
+                }[operator]
+        elif operator in ('=', '!='):
+            equal = column['text'] == str(value).lower()
+            mask &= equal if operator == '=' else ~equal
+        else:
+            # Ordering comparisons against text compare alphabetically
+            text, needle = column['text'], str(value).lower()
+            mask &= {
+                '>=': text >= needle, '<=': text <= needle, '<': text < needle, '>': text > needle,
+            }[operator]
+    return mask
+
+
+def sort_rows(columns, rows, sort_by):
+    """rows ordered by the DataTable sort_by list (first entry is the primary key)."""
+    keys = []
+    for sort in reversed(sort_by or []):
+        column = columns.get(sort.get('column_id'))
+        if column is None:
+            continue
+        ranks = column['ranks'][rows]
+        keys.append(-ranks if sort.get('direction') == 'desc' else ranks)
+        # Empty cells stay at the bottom in both directions
+        keys.append(column['blank'][rows])
+    if not keys:
+        return rows
+    return rows[np.lexsort(keys)]
+
+
+def query_page(index, rows, filter_query, sort_by, page_current, page_size):
+    """(records of the requested page, page_count, matching row count).
+
+    rows are the catalogue positions allowed by the facet filters, in catalogue order.
+    """
+    rows = rows[filter_mask(index['columns'], len(index['rows']), filter_query)[rows]]
+    rows = sort_rows(index['columns'], rows, sort_by)
+    page_size = max(int(page_size or 1), 1)
+    page_count = max(-(-len(rows) // page_size), 1)
+    page_current = min(max(int(page_current or 0), 0), page_count - 1)
+    start = page_current * page_size
+    page = [index['rows'][row] for row in rows[start:start + page_size]]
+    return page, page_count, len(rows)
+
+
+_index_lock = threading.Lock()
+_current_index = {'version': None, 'index': None}
+
+
+def get_table_index():
+    """(version, table index) for the current data snapshot, built on first use."""
+    version, catalogue = get_catalogue()
+    with _index_lock:
+        if _current_index['version'] != version:
+            _current_index['index'] = build_table_index(catalogue)
+            _current_index['version'] = version
+        return version, _current_index['index']
@@ -0,0 +1,88 @@
+# typeahead.py
+#
+# Server-side type-ahead for the indicator dropdowns. Instead of shipping every indicator
+# as a dropdown option and filtering in the browser, the dropdowns send their search_value
+# and get back at most TYPEAHEAD_LIMIT options.
+#
+# The index is a sorted array of lower-cased "word suffixes" of every label (for "Number
+# of schools": "number of schools", "of schools", "schools"), so typing the start of any
+# word finds the label. A query is two binary searches that bound the matching slice of
+# the array; the cost depends on the number of matches, not the size of the catalogue.
+
+from bisect import bisect_left
+
+# Most options a dropdown receives for one search
+TYPEAHEAD_LIMIT = 25
+
+_INDEX_CACHE = {}
+
+
+def normalize(text):
+    return ' '.join(str(text).lower().split())
+
+
+def build_prefix_index(labels):
+    """Sorted word-suffix array over labels (a list of distinct strings)."""
+    entries = []
+    for label_id, label in enumerate(labels):
+        words = normalize(label).split(' ')
+        for start in range(len(words)):
+            entries.append((' '.join(words[start:]), start, label_id))
+    entries.sort()
+    return {
+        'labels': list(labels),
+        'keys': [key for key, _, _ in entries],
+        'starts': [start for _, start, _ in entries],
+        'ids': [label_id for _, _, label_id in entries],
+    }
+
+
+def prefix_search(index, query, limit=TYPEAHEAD_LIMIT):
+    """Labels containing a word that starts with query, best first.
+
+    Labels that start with the query come first, then labels where a later word matches,
+    each group in alphabetical order. An empty query returns the first labels in their
+    original order.
+    """
+    query = normalize(query or '')
+    if not query:
+        return index['labels'][:limit]
+
+    keys = index['keys']
+    lo = bisect_left(keys, query)
+    hi = bisect_left(keys, query + '\uffff', lo)
+
+    # dicts as ordered sets: a label is listed once, as leading if any of its keys is
+    leading, other = {}, {}
+    for position in range(lo, hi):
+        label_id = index['ids'][position]
+        if index['starts'][position] == 0:
+            leading[label_id] = None
+            other.pop(label_id, None)
+            if len(leading) >= limit:
+                break
+        elif label_id not in leading:
+            other[label_id] = None
+
+    ranked = (list(leading) + list(other))[:limit]
+    return [index['labels'][label_id] for label_id in ranked]
+
+
+def cached_prefix_index(scope, version, labels):
+    """Prefix index for scope (e.g. ('ict', outcome)), rebuilt only when version changes.
+
+    labels is a zero-argument callable returning the labels for the scope.
+    """
+    entry = _INDEX_CACHE.get(scope)
+    if entry is None or entry['version'] != version:
+        entry = {'version': version, 'index': build_prefix_index(labels())}
+        _INDEX_CACHE[scope] = entry
+    return entry['index']
+
+
+def typeahead_options(index, search_value, selected=None, limit=TYPEAHEAD_LIMIT):
+    """Dropdown options for search_value; the selected value is always kept as an option."""
+    labels = prefix_search(index, search_value, limit)
+    if selected and selected not in labels:
+        labels = [selected] + labels
+    return [{'label': label, 'value': label} for label in labels]